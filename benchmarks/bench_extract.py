@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+기사 본문 추출 벤치마크
+- fixtures/html/ 의 저장된 HTML로 기존 방식(html.parser + 호출마다 정규식 18개)과
+  html_extract.extract_article_text를 비교
+- 두 방식의 결과가 같은지도 함께 확인
+
+사용 예시:
+  python benchmarks/bench_extract.py
+  python benchmarks/bench_extract.py --repeat 50
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import html_extract  # noqa: E402
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures" / "html"
+
+# 픽스처 파일 → 원래 기사 URL (도메인 규칙 적용용)
+FIXTURE_URLS = {
+    "adage_article.html": "https://adage.com/article/marketing-news/example/1",
+    "digiday_article.html": "https://digiday.com/media/example/",
+    "bloter_article.html": "https://www.bloter.net/news/articleView.html?idxno=1",
+    "generic_paragraphs.html": "https://example.com/news/1",
+}
+
+
+def legacy_extract(html):
+    """변경 전 analyze_and_report.fetch_article_fulltext의 추출 로직"""
+    soup = BeautifulSoup(html, "html.parser")
+
+    for tag in soup.find_all(["script", "style", "nav", "footer", "header",
+                               "aside", "iframe", "noscript", "form", "svg", "button"]):
+        tag.decompose()
+
+    body_text = ""
+    article = soup.find("article")
+    if article:
+        body_text = article.get_text(separator="\n", strip=True)
+
+    if len(body_text) < 500:
+        for selector in [
+            ".article-content", ".post-content", ".entry-content",
+            ".story-body", ".article-body", ".content-body",
+            '[itemprop="articleBody"]', ".article__body",
+            "#article-body", ".node-body", ".wysiwyg"
+        ]:
+            el = soup.select_one(selector)
+            if el:
+                body_text = el.get_text(separator="\n", strip=True)
+                if len(body_text) > 500: break
+
+    if len(body_text) < 500:
+        paragraphs = soup.find_all("p")
+        valid_paragraphs = [
+            p.get_text(strip=True) for p in paragraphs
+            if len(p.get_text(strip=True)) > 40
+        ]
+        body_text = "\n".join(valid_paragraphs)
+
+    noise_patterns = [
+        r'(?i)subscribe.*?newsletter',
+        r'(?i)sign up for.*?email',
+        r'(?i)get your.*?ticket',
+        r'(?i)secure your spot.*?summit',
+        r'(?i)digiday media buying summit.*?\.',
+        r'(?i)subscribe to continue reading',
+        r'(?i)subscription only',
+        r'(?i)become a member',
+        r'(?i)already a subscriber',
+        r'(?i)read more about.*?membership',
+        r'(?i)all rights reserved',
+        r'(?i)copyright \d{4}',
+        r'(?i)advertisement',
+        r'(?i)follow us on',
+        r'(?i)answers to common questions brands might have about the nation.*?s semiquincentennial',
+        r'(?i)play them all',
+        r'(?i)future of marketing briefing',
+        r'(?i)latest marketing briefing',
+    ]
+    for pattern in noise_patterns:
+        body_text = re.sub(pattern, '', body_text)
+
+    clean_lines = []
+    for line in body_text.split('\n'):
+        line_strip = line.strip()
+        if len(line_strip) < 30: continue
+        if line_strip.lower().startswith(('author:', 'by:', 'written by:', 'published:', 'source:')): continue
+        if "digiday media buying summit" in line_strip.lower(): continue
+        if "answers to common questions brands might have" in line_strip.lower(): continue
+        clean_lines.append(line_strip)
+
+    return '\n\n'.join(clean_lines)[:4000]
+
+
+def _time(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def run(repeat=20):
+    """픽스처별 (이름, 기존 ms, 신규 ms, 결과 일치 여부) 목록을 반환합니다."""
+    rows = []
+    for path in sorted(FIXTURE_DIR.glob("*.html")):
+        html = path.read_bytes()
+        url = FIXTURE_URLS.get(path.name)
+        legacy_s, legacy_text = _time(lambda: legacy_extract(html), repeat)
+        new_s, new_text = _time(lambda: html_extract.extract_article_text(html, url), repeat)
+        rows.append((path.name, legacy_s * 1000, new_s * 1000, legacy_text == new_text))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기사 본문 추출 벤치마크")
+    parser.add_argument("--repeat", type=int, default=20, help="픽스처당 반복 횟수")
+    args = parser.parse_args()
+
+    engine = "selectolax" if html_extract.HAS_SELECTOLAX else f"bs4+{html_extract.BS4_PARSER}"
+    print(f"엔진: {engine}, 반복: {args.repeat}회")
+    print(f"{'fixture':<26} {'legacy(ms)':>11} {'new(ms)':>9} {'speedup':>8}  same")
+    total_legacy = total_new = 0.0
+    for name, legacy_ms, new_ms, same in run(args.repeat):
+        total_legacy += legacy_ms
+        total_new += new_ms
+        print(f"{name:<26} {legacy_ms:>11.2f} {new_ms:>9.2f} {legacy_ms / new_ms:>7.1f}x  {'✓' if same else '✗'}")
+    print(f"{'합계':<24} {total_legacy:>11.2f} {total_new:>9.2f} {total_legacy / total_new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
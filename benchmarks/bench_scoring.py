@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+키워드 분류/관련도 점수 벤치마크
+- 기존 방식(키워드마다 부분 문자열 검사, 정렬 키에서 재계산)과 scoring 모듈 비교
+- 합성 항목 N건을 분류하고 select_top_items와 같은 두 번의 정렬 수행
+- 두 방식의 분류 결과가 얼마나 일치하는지도 출력 (단어 경계 매칭 때문에 일부 다를 수 있음)
+
+사용 예시:
+  python benchmarks/bench_scoring.py
+  python benchmarks/bench_scoring.py --items 20000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import scoring  # noqa: E402
+from config import TREND_CATEGORIES  # noqa: E402
+
+KEYWORD_WORDS = (
+    "brand campaign ai video connected tv mobile apps retail media walmart first-party data "
+    "measurement advertisers privacy cookie attribution platforms creators tiktok youtube "
+    "influencer content marketing programmatic dsp rtb agency strategy research study"
+).split()
+FILLER_WORDS = (
+    "the a of to and in for on with that said was is its as by from at this have has will "
+    "company year new more than about after their which were also would over people could "
+    "market share quarter growth revenue sales executive chief officer according report week "
+    "announced plans launched team business industry customers deal billion million percent "
+    "president time first two other some into most while what when there where been they "
+    "again today because already expected across global partners including service services"
+).split()
+
+
+def _sentence(rng, k):
+    # 실제 기사처럼 일반 단어 사이에 키워드가 드문드문 섞이도록 (약 10%)
+    return " ".join(
+        rng.choice(KEYWORD_WORDS) if rng.random() < 0.1 else rng.choice(FILLER_WORDS)
+        for _ in range(k)
+    )
+
+
+def make_items(n, seed=42):
+    rng = random.Random(seed)
+    items = []
+    for i in range(n):
+        items.append({
+            "title": _sentence(rng, 12),
+            "summary": _sentence(rng, 70),
+            "type": "academic" if i % 5 == 0 else "industry",
+            "region": "kr" if i % 4 == 0 else "global",
+        })
+    return items
+
+
+def legacy_categorize(item):
+    text = f"{item.get('title', '')} {item.get('summary', '')}".lower()
+    best_cat, best_score = "기타", 0
+    for category, keywords in TREND_CATEGORIES.items():
+        if category == "기타": continue
+        score = sum(1 for kw in keywords if kw in text)
+        if category == "AI/자동화": score *= 1.5
+        if score > best_score:
+            best_score = score
+            best_cat = category
+    return best_cat
+
+
+def legacy_relevance(item):
+    text = f"{item.get('title', '')} {item.get('summary', '')}".lower()
+    core_kw = [
+        "advertis", "marketing", "media", "campaign", "brand", "consumer",
+        "digital", "tech", "data", "platform", "content", "strategy", "research", "study", "analysis"
+    ]
+    score = sum(1 for kw in core_kw if kw in text)
+    if item.get("type") == "academic": score += 3
+    if "ai" in text or "gpt" in text or "generative" in text: score += 2
+    if item.get("region") == "kr": score += 2
+    return score
+
+
+def run_legacy(items):
+    categories = [legacy_categorize(item) for item in items]
+    sorted(items, key=lambda x: -legacy_relevance(x))
+    sorted(items, key=lambda x: -legacy_relevance(x))
+    return categories
+
+
+def run_new(items):
+    scoring.score_items(items)
+    sorted(items, key=lambda x: -scoring.relevance(x))
+    sorted(items, key=lambda x: -scoring.relevance(x))
+    return [scoring.categorize(item) for item in items]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="키워드 분류/관련도 점수 벤치마크")
+    parser.add_argument("--items", type=int, default=5000, help="합성 항목 수")
+    args = parser.parse_args()
+
+    items = make_items(args.items)
+    start = time.perf_counter()
+    legacy = run_legacy(items)
+    legacy_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    new = run_new(items)
+    new_s = time.perf_counter() - start
+
+    same = sum(a == b for a, b in zip(legacy, new))
+    print(f"항목 {args.items}건")
+    print(f"기존:  {legacy_s * 1000:8.1f} ms")
+    print(f"신규:  {new_s * 1000:8.1f} ms  ({legacy_s / new_s:.1f}x)")
+    print(f"분류 일치: {same}/{len(items)}")
+
+
+if __name__ == "__main__":
+    main()
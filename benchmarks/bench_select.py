@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+select_top_items 벤치마크 + 동일성 검사
+- 무작위 항목 목록 수백 개로 기존 선별 로직과 결과(선택 항목과 순서)가 같은지 확인
+- 누적 항목 규모(수만 건)에서 실행 시간 비교
+
+사용 예시:
+  python benchmarks/bench_select.py
+  python benchmarks/bench_select.py --cases 2000 --items 50000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from analyze_and_report import relevance_score, select_top_items  # noqa: E402
+from scoring import score_items  # noqa: E402
+
+SOURCES = ["AdAge", "Adweek", "Digiday", "매드타임스", "블로터", "모비인사이드", "arXiv", "Semantic Scholar"]
+KR_SOURCES = {"매드타임스", "블로터", "모비인사이드"}
+
+
+def legacy_select_top_items(items, top_n=10, kr_ratio=0.3):
+    """변경 전 analyze_and_report.select_top_items"""
+    items_sorted = sorted(items, key=lambda x: -relevance_score(x))
+
+    if kr_ratio == 0:
+        return items_sorted[:top_n]
+
+    final_items = []
+    source_counts = {}
+
+    kr_target = int(top_n * kr_ratio)
+
+    kr_items = [a for a in items_sorted if a.get("region") == "kr"]
+    global_items = [a for a in items_sorted if a.get("region") != "kr"]
+
+    for a in kr_items:
+        s = a.get("source", "unknown")
+        if source_counts.get(s, 0) >= 3: continue
+        final_items.append(a)
+        source_counts[s] = source_counts.get(s, 0) + 1
+        if len(final_items) >= kr_target: break
+
+    for a in global_items:
+        s = a.get("source", "unknown")
+        if source_counts.get(s, 0) >= 3: continue
+        final_items.append(a)
+        source_counts[s] = source_counts.get(s, 0) + 1
+        if len(final_items) >= top_n: break
+
+    if len(final_items) < top_n:
+        for a in [art for art in kr_items if art not in final_items]:
+            final_items.append(a)
+            if len(final_items) >= top_n: break
+
+    final_items.sort(key=lambda x: -relevance_score(x))
+    return final_items
+
+
+def make_items(n, rng, sources=SOURCES):
+    # 관련도는 동점이 많도록 작은 범위의 정수로 (안정 정렬 순서까지 비교하기 위함)
+    items = []
+    for i in range(n):
+        source = rng.choice(sources)
+        items.append({
+            "id": i,
+            "title": f"item {i}",
+            "source": source,
+            "region": "kr" if source in KR_SOURCES else "global",
+            "category": "기타",
+            "relevance": rng.randint(0, 8),
+        })
+    return items
+
+
+def check_equivalence(cases, rng):
+    """무작위 입력에서 두 구현의 결과가 다른 경우의 수를 반환합니다."""
+    mismatches = 0
+    for _ in range(cases):
+        # 소스가 몇 개뿐이면 소스 제한에 자주 걸려 후보 확장/국내 보충 경로까지 검사됨
+        sources = rng.choice([SOURCES, ["매드타임스", "블로터", "AdAge"]])
+        items = make_items(rng.randint(0, 200), rng, sources)
+        top_n = rng.randint(0, 40)
+        kr_ratio = rng.choice([0.0, 0.1, 0.3, 0.5, 1.0])
+        expected = [a["id"] for a in legacy_select_top_items(items, top_n, kr_ratio)]
+        actual = [a["id"] for a in select_top_items(items, top_n, kr_ratio)]
+        if expected != actual:
+            mismatches += 1
+            if mismatches <= 3:
+                print(f"  불일치: n={len(items)} top_n={top_n} kr_ratio={kr_ratio}\n"
+                      f"    기존 {expected}\n    신규 {actual}")
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="select_top_items 벤치마크 + 동일성 검사")
+    parser.add_argument("--cases", type=int, default=500, help="동일성 검사 무작위 입력 수")
+    parser.add_argument("--items", type=int, default=20000, help="시간 측정용 항목 수")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    mismatches = check_equivalence(args.cases, rng)
+    print(f"동일성 검사: {args.cases - mismatches}/{args.cases}건 일치")
+
+    items = make_items(args.items, rng)
+    score_items(items)
+    # (이름, top_n, 대상 항목): 일반 보고서 / 해외 기사가 부족해 국내 기사로 채우는 경우
+    scenarios = [
+        ("top 10", 10, items),
+        ("top 500, 국내 위주", 500, [a for a in items if a["region"] == "kr" or a["id"] % 50 == 0]),
+    ]
+    for name, top_n, pool in scenarios:
+        start = time.perf_counter()
+        legacy_select_top_items(pool, top_n, 0.3)
+        legacy_s = time.perf_counter() - start
+        start = time.perf_counter()
+        select_top_items(pool, top_n, 0.3)
+        new_s = time.perf_counter() - start
+        print(f"{name} ({len(pool)}건): 기존 {legacy_s * 1000:.1f} ms, 신규 {new_s * 1000:.1f} ms "
+              f"({legacy_s / new_s:.1f}x)")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+"""
+오프라인 벤치마크 모음 + 성능 회귀 검사
+- stub_server의 로컬 대역 서버로 RSS/기사/Semantic Scholar/arXiv/LLM/번역 응답을 재생
+  (외부 네트워크·API 키 없이 매번 같은 입력)
+- 항목 규모(1x/10x/100x)별로 다음 구간의 실행 시간과 처리량을 측정
+    collect      collect_all (3개 소스 동시 수집 → 저장소 → 중복 제거 → 저장 → 인덱스)
+    fulltext     fetch_article_fulltext (캐시 없는 상태, 동시 수집 + 본문 추출)
+    select       categorize_item_best + select_top_items (점수 초기화 후)
+    report       generate_report (본문 수집 → LLM 요약 → 번역 → 보고서 작성)
+- 결과를 JSON으로 저장하고, 기준 결과와 비교해 허용치 이상 느려지면 종료 코드 1
+- 데이터/캐시는 임시 디렉토리에 만들고 끝나면 지움 (data/, cache/ 는 건드리지 않음)
+- API 요청 속도 제한(Semantic Scholar 1 RPS, arXiv 3초 간격)은 우리 코드의 처리량이
+  아니므로 끔. LLM 응답 지연은 --llm-latency로 흉내 낼 수 있음
+
+사용 예시:
+  python benchmarks/bench_suite.py                                   # 1x, 10x, 100x
+  python benchmarks/bench_suite.py --scales 1,10 --output bench.json
+  python benchmarks/bench_suite.py --baseline bench.json --max-regression 0.25
+"""
+
+import argparse
+import functools
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# 로컬 대역 서버 요청이 프록시 설정을 타지 않도록
+os.environ["NO_PROXY"] = ",".join(filter(None, [os.environ.get("NO_PROXY"), "127.0.0.1", "localhost"]))
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import arxiv  # noqa: E402
+
+import analyze_and_report  # noqa: E402
+import collect_trends  # noqa: E402
+import llm_dispatch  # noqa: E402
+from config import FULLTEXT_MAX_WORKERS, FULLTEXT_PER_HOST_LIMIT, RSS_FEEDS  # noqa: E402
+from http_client import HostLimiter, make_session  # noqa: E402
+from item_io import iter_items  # noqa: E402
+from metrics import METRICS  # noqa: E402
+from scoring import CATEGORY_FIELD, RELEVANCE_FIELD  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+from trend_index import TrendIndex  # noqa: E402
+
+BENCHMARKS = ["collect", "fulltext", "select", "report"]
+FULLTEXT_PER_SCALE = 10   # fulltext 구간에서 가져올 기사 수 = 10 × scale
+MIN_REGRESSION_SECONDS = 0.2  # 이보다 작은 차이는 측정 잡음(번역 요청 간 대기 등)으로 보고 무시
+
+
+# ──────────────────────────────────────────────
+# 대역 서버 연결
+# ──────────────────────────────────────────────
+def _call_replay(url, client, model, prompt, system, max_tokens):
+    resp = client.post(url, json={"model": model, "prompt": prompt, "system": system}, timeout=30)
+    resp.raise_for_status()
+    return resp.json()["text"]
+
+
+def configure(server, workdir):
+    """
+    수집/보고서 모듈이 대역 서버와 workdir 안의 데이터·캐시를 쓰도록 설정합니다.
+    캐시·분배기 싱글턴도 초기화하므로 매 측정이 같은 (빈 캐시) 상태에서 시작합니다.
+    """
+    data_dir = workdir / "data" / "bench-day"
+    cache_dir = workdir / "cache"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    today_data_dir = lambda: data_dir  # noqa: E731
+
+    # 수집
+    collect_trends.RSS_FEEDS = {name: server.feed_url(name, i) for i, name in enumerate(RSS_FEEDS)}
+    collect_trends.FEED_CACHE_PATH = cache_dir / "feeds.sqlite3"
+    collect_trends.SEMANTIC_SCHOLAR_API = server.url("s2/search")
+    collect_trends.SEMANTIC_SCHOLAR_BATCH_API = server.url("s2/batch")
+    collect_trends.SEMANTIC_SCHOLAR_RPS = 1000.0
+    collect_trends.ITEM_STORE_PATH = workdir / "data" / "items.sqlite3"
+    collect_trends.get_today_data_dir = today_data_dir
+    collect_trends.TrendIndex = functools.partial(TrendIndex, workdir / "data" / "trend_index.sqlite3")
+    client = arxiv.Client(page_size=100, delay_seconds=0.0, num_retries=0)
+    client.query_url_format = server.url("arxiv") + "?{}"
+    collect_trends.ARXIV_CLIENT = client
+
+    # 보고서 (캐시 경로는 처음 사용할 때 읽으므로 싱글턴을 비워 둠)
+    ar = analyze_and_report
+    ar.get_today_data_dir = today_data_dir
+    ar.get_today_report_path = lambda: workdir / "report.md"
+    ar.FULLTEXT_CACHE_PATH = cache_dir / "fulltext.sqlite3"
+    ar.SUMMARY_CACHE_PATH = cache_dir / "summaries.sqlite3"
+    ar.TRANSLATION_CACHE_PATH = cache_dir / "translations.sqlite3"
+    ar._fulltext_cache = ar._summary_cache = ar._translation_cache = None
+    ar._translation_memo.clear()
+    if ar.HAS_TRANSLATOR:
+        ar.translator._base_url = server.url("translate")
+
+    # LLM: 대역 서버의 /llm을 부르는 제공자 하나
+    llm_dispatch.PROVIDER_IMPLS["replay"] = (
+        lambda api_key: make_session(pool_size=4),
+        functools.partial(_call_replay, server.url("llm")),
+    )
+    ar._llm_dispatcher = llm_dispatch.build_dispatcher(
+        [{"name": "replay", "model": "replay-1", "rpm": 6000, "concurrency": 4}],
+        {"replay": "stub"},
+    )
+    return data_dir
+
+
+# ──────────────────────────────────────────────
+# 측정 구간
+# ──────────────────────────────────────────────
+def load_items(data_dir):
+    articles, papers = [], []
+    for item in iter_items(data_dir):
+        (papers if item.get("type") == "academic" else articles).append(item)
+    return articles, papers
+
+
+def bench_collect(server, workdir):
+    configure(server, workdir)
+    start = time.perf_counter()
+    result = collect_trends.collect_all()
+    elapsed = time.perf_counter() - start
+    return elapsed, len(result["articles"]) + len(result["papers"])
+
+
+def bench_fulltext(server, workdir, articles):
+    configure(server, workdir)
+    urls = [a["url"] for a in articles if a.get("url")][:FULLTEXT_PER_SCALE * server.scale]
+    host_limiter = HostLimiter(per_host=FULLTEXT_PER_HOST_LIMIT)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=FULLTEXT_MAX_WORKERS) as executor:
+        texts = list(executor.map(lambda u: analyze_and_report.fetch_article_fulltext(u, host_limiter), urls))
+    elapsed = time.perf_counter() - start
+    empty = sum(1 for t in texts if not t)
+    if empty:
+        logging.warning(f"본문 추출 실패 {empty}/{len(urls)}건")
+    return elapsed, len(urls)
+
+
+def bench_select(articles, papers):
+    items = [dict(item) for item in articles + papers]
+    for item in items:
+        item.pop(CATEGORY_FIELD, None)
+        item.pop(RELEVANCE_FIELD, None)
+    start = time.perf_counter()
+    for item in items:
+        analyze_and_report.categorize_item_best(item)
+    n_articles = len(articles)
+    analyze_and_report.select_top_items(items[:n_articles], top_n=10, kr_ratio=0.3)
+    analyze_and_report.select_top_items(items[n_articles:], top_n=5, kr_ratio=0.0)
+    return time.perf_counter() - start, len(items)
+
+
+def bench_report(server, workdir, articles, papers):
+    configure(server, workdir)
+    articles = [dict(item) for item in articles]
+    papers = [dict(item) for item in papers]
+    start = time.perf_counter()
+    report = analyze_and_report.generate_report(articles, papers)
+    elapsed = time.perf_counter() - start
+    if "재생 응답" not in report:
+        logging.warning("보고서에 LLM 요약이 들어가지 않았습니다")
+    return elapsed, len(articles) + len(papers)
+
+
+def run_scale(scale, repeat, llm_latency):
+    """scale 하나의 측정 결과 {구간: {"seconds", "items", "items_per_sec"}} (repeat회 중 최솟값)"""
+    best = {}
+
+    def keep(name, elapsed, items):
+        if name not in best or elapsed < best[name]["seconds"]:
+            best[name] = {
+                "seconds": round(elapsed, 4),
+                "items": items,
+                "items_per_sec": round(items / elapsed, 1) if elapsed > 0 else None,
+            }
+
+    with StubServer(scale, llm_latency=llm_latency) as server:
+        for _ in range(repeat):
+            workdir = Path(tempfile.mkdtemp(prefix=f"bench-{scale}x-"))
+            try:
+                METRICS.reset()
+                keep("collect", *bench_collect(server, workdir))
+                articles, papers = load_items(workdir / "data" / "bench-day")
+                keep("fulltext", *bench_fulltext(server, workdir / "fulltext", articles))
+                keep("select", *bench_select(articles, papers))
+                keep("report", *bench_report(server, workdir / "report", articles, papers))
+                counters = METRICS.snapshot()["counters"]
+            finally:
+                shutil.rmtree(workdir, ignore_errors=True)
+    best["counters"] = {k: v for k, v in counters.items() if k.startswith(("http.", "llm.", "translate."))}
+    return best
+
+
+# ──────────────────────────────────────────────
+# 회귀 검사
+# ──────────────────────────────────────────────
+def compare(results, baseline, max_regression):
+    """
+    기준 결과보다 (1 + max_regression)배 넘게 느려진 구간 목록을 반환합니다.
+    차이가 MIN_REGRESSION_SECONDS 미만이면 잡음으로 보고 무시합니다.
+    """
+    regressions = []
+    for scale, benches in results.items():
+        for name in BENCHMARKS:
+            base = baseline.get(scale, {}).get(name)
+            new = benches.get(name)
+            if not base or not new:
+                continue
+            limit = base["seconds"] * (1 + max_regression)
+            if new["seconds"] > limit and new["seconds"] - base["seconds"] >= MIN_REGRESSION_SECONDS:
+                regressions.append((scale, name, base["seconds"], new["seconds"]))
+    return regressions
+
+
+def print_table(results, baseline=None):
+    header = f"{'규모':>6} {'구간':<10} {'항목':>7} {'시간(s)':>9} {'항목/s':>10}"
+    if baseline:
+        header += f" {'기준(s)':>9} {'변화':>8}"
+    print(header)
+    print("-" * len(header))
+    for scale, benches in results.items():
+        for name in BENCHMARKS:
+            r = benches.get(name)
+            if not r:
+                continue
+            line = f"{scale:>6} {name:<10} {r['items']:>7} {r['seconds']:>9.3f} {r['items_per_sec'] or 0:>10.1f}"
+            base = (baseline or {}).get(scale, {}).get(name)
+            if base:
+                line += f" {base['seconds']:>9.3f} {(r['seconds'] / base['seconds'] - 1) * 100:>+7.1f}%"
+            print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 벤치마크 모음 + 성능 회귀 검사")
+    parser.add_argument("--scales", default="1,10,100", help="항목 배수 목록 (쉼표 구분)")
+    parser.add_argument("--repeat", type=int, default=1, help="규모별 반복 횟수 (최솟값 사용)")
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="대역 LLM 응답 지연 (초)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON")
+    parser.add_argument("--max-regression", type=float, default=0.25,
+                        help="허용 지연 비율 (0.25 = 기준보다 25%%까지 느려져도 통과)")
+    parser.add_argument("--verbose", action="store_true", help="파이프라인 로그 출력")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+        datefmt="%H:%M:%S",
+    )
+
+    results = {}
+    for scale in [int(s) for s in args.scales.split(",") if s.strip()]:
+        print(f"▶ {scale}x 측정 중...", flush=True)
+        results[f"{scale}x"] = run_scale(scale, max(1, args.repeat), args.llm_latency)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+
+    print()
+    print_table(results, baseline)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version.split()[0], "results": results}, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+    if baseline:
+        regressions = compare(results, baseline, args.max_regression)
+        if regressions:
+            print(f"\n❌ 성능 회귀 {len(regressions)}건 (허용 {args.max_regression:.0%}):")
+            for scale, name, base, new in regressions:
+                print(f"  {scale} {name}: {base:.3f}s → {new:.3f}s")
+            return 1
+        print(f"\n✅ 성능 회귀 없음 (허용 {args.max_regression:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
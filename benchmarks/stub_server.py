@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+"""
+벤치마크용 로컬 대역 서버 (외부 네트워크 없이 수집/보고서 전 과정 재현)
+- fixtures/ 의 저장된 응답을 재생: RSS XML, 기사 HTML, Semantic Scholar JSON, arXiv Atom
+- LLM/번역 응답은 요청 내용으로 만든 고정 형식 응답 (LLM: /llm, 번역: Google 번역 모바일 페이지 형식)
+- scale배로 항목 수를 늘릴 수 있음 (복제 항목은 단어 순서를 섞어 유사 중복 제거에 걸리지 않게 함)
+
+사용 예시:
+  python benchmarks/stub_server.py --port 8765 --scale 10
+"""
+
+import argparse
+import email.utils
+import html
+import json
+import random
+import re
+import threading
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, quote, urlparse
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures"
+HTML_FIXTURES = sorted((FIXTURE_DIR / "html").glob("*.html"))
+
+HANGUL_RE = re.compile(r"[가-힣]")
+BATCH_ARTICLE_RE = re.compile(r"^### 기사 (\d+)$", re.MULTILINE)
+ATOM_NS = {"atom": "http://www.w3.org/2005/Atom"}
+DC_CREATOR = "{http://purl.org/dc/elements/1.1/}creator"
+
+
+def shuffle_words(text, rng):
+    """단어 순서를 섞은 문장 (복제 항목끼리 shingle이 겹치지 않도록)"""
+    words = text.split()
+    rng.shuffle(words)
+    return " ".join(words)
+
+
+def _load_rss_items(name):
+    root = ET.parse(FIXTURE_DIR / "feeds" / name).getroot()
+    return [
+        {
+            "title": item.findtext("title", ""),
+            "description": item.findtext("description", ""),
+            "author": item.findtext(DC_CREATOR, ""),
+        }
+        for item in root.iter("item")
+    ]
+
+
+def _load_arxiv_entries():
+    root = ET.parse(FIXTURE_DIR / "api" / "arxiv.xml").getroot()
+    return [
+        {
+            "title": entry.findtext("atom:title", "", ATOM_NS),
+            "summary": entry.findtext("atom:summary", "", ATOM_NS),
+            "authors": [a.findtext("atom:name", "", ATOM_NS) for a in entry.findall("atom:author", ATOM_NS)],
+            "category": entry.find("atom:category", ATOM_NS).get("term"),
+        }
+        for entry in root.findall("atom:entry", ATOM_NS)
+    ]
+
+
+class Fixtures:
+    """
+    저장된 픽스처를 scale배로 늘려 응답 본문을 만듭니다.
+    같은 (scale, 요청)에는 항상 같은 응답을 돌려줍니다 (날짜는 현재 시각 기준).
+    """
+
+    def __init__(self, base_url, scale=1):
+        self.base_url = base_url
+        self.scale = max(1, int(scale))
+        self.rss = {"global": _load_rss_items("global.xml"), "kr": _load_rss_items("kr.xml")}
+        self.papers = json.loads((FIXTURE_DIR / "api" / "s2_papers.json").read_text(encoding="utf-8"))
+        self.arxiv = _load_arxiv_entries()
+        self.html = [p.read_bytes() for p in HTML_FIXTURES]
+
+    @staticmethod
+    def feed_kind(name):
+        return "kr" if HANGUL_RE.search(name) else "global"
+
+    def _variant(self, records, n, seed):
+        """(원본 인덱스, 복제 번호, rng) 목록. 복제 번호 0은 원본 그대로"""
+        rng = random.Random(seed)
+        return [(i % len(records), i // len(records), rng) for i in range(n)]
+
+    # ── RSS ──
+    def rss_feed(self, feed_id):
+        kind, _, index = feed_id.partition("-")
+        records = self.rss[kind]
+        n = len(records) * self.scale
+        now = datetime.now(timezone.utc)
+        # 최신순, 모든 항목이 수집 기간(7일) 안에 들어오도록 간격 조정
+        step = min(timedelta(minutes=30), timedelta(days=6) / n)
+        parts = []
+        for i, (src, copy, rng) in enumerate(self._variant(records, n, f"rss-{feed_id}")):
+            record = records[src]
+            title, description = record["title"], record["description"]
+            if copy or index != "0":
+                title, description = shuffle_words(title, rng), shuffle_words(description, rng)
+            parts.append(
+                "<item>"
+                f"<title>{html.escape(title)}</title>"
+                f"<link>{self.base_url}/article/{feed_id}/{i}</link>"
+                f"<dc:creator>{html.escape(record['author'])}</dc:creator>"
+                f"<pubDate>{email.utils.format_datetime(now - step * (i + 1))}</pubDate>"
+                f"<description>{html.escape(description)}</description>"
+                "</item>"
+            )
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/"><channel>'
+            f"<title>{feed_id}</title><link>{self.base_url}/</link><description>stub</description>"
+            + "".join(parts) + "</channel></rss>"
+        ).encode("utf-8")
+
+    def article(self, feed_id, index):
+        return self.html[(sum(feed_id.encode("utf-8")) + index) % len(self.html)]
+
+    # ── Semantic Scholar ──
+    def s2_search(self, query):
+        # 키워드마다 일부가 겹치는 id 목록 (실제 API처럼 여러 키워드에 같은 논문이 걸림)
+        offset = sum(query.encode("utf-8")) % len(self.papers)
+        n = len(self.papers) * self.scale
+        return {"total": n, "data": [{"paperId": f"s2-{offset + j}"} for j in range(n)]}
+
+    def s2_paper(self, paper_id):
+        j = int(paper_id.rsplit("-", 1)[1])
+        src, copy = j % len(self.papers), j // len(self.papers)
+        paper = dict(self.papers[src])
+        paper["paperId"] = paper_id
+        if copy:
+            rng = random.Random(paper_id)
+            paper["title"] = shuffle_words(paper["title"], rng)
+            paper["abstract"] = shuffle_words(paper["abstract"], rng)
+            paper["externalIds"] = {}
+            paper["url"] = f"{self.base_url}/paper/{paper_id}"
+        return paper
+
+    def s2_batch(self, ids):
+        return [self.s2_paper(paper_id) if paper_id.startswith("s2-") else None for paper_id in ids]
+
+    # ── arXiv ──
+    def arxiv_page(self, start, max_results):
+        n = len(self.arxiv) * self.scale
+        now = datetime.now(timezone.utc)
+        entries = []
+        for i in range(start, min(n, start + max_results)):
+            src, copy = i % len(self.arxiv), i // len(self.arxiv)
+            record = self.arxiv[src]
+            title, summary = record["title"], record["summary"]
+            if copy:
+                rng = random.Random(f"arxiv-{i}")
+                title, summary = shuffle_words(title, rng), shuffle_words(summary, rng)
+            stamp = (now - timedelta(hours=i + 1)).strftime("%Y-%m-%dT%H:%M:%SZ")
+            arxiv_id = f"http://arxiv.org/abs/2510.{i:05d}v1"
+            authors = "".join(f"<author><name>{html.escape(a)}</name></author>" for a in record["authors"])
+            entries.append(
+                f"<entry><id>{arxiv_id}</id><updated>{stamp}</updated><published>{stamp}</published>"
+                f"<title>{html.escape(title)}</title><summary>{html.escape(summary)}</summary>{authors}"
+                f'<link href="{arxiv_id}" rel="alternate" type="text/html"/>'
+                f'<arxiv:primary_category term="{record["category"]}" scheme="http://arxiv.org/schemas/atom"/>'
+                f'<category term="{record["category"]}" scheme="http://arxiv.org/schemas/atom"/></entry>'
+            )
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<feed xmlns="http://www.w3.org/2005/Atom" xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/"'
+            ' xmlns:arxiv="http://arxiv.org/schemas/atom">'
+            f"<id>{self.base_url}/arxiv</id><title>stub</title><updated>{now.isoformat()}</updated>"
+            f"<opensearch:totalResults>{n}</opensearch:totalResults>"
+            f"<opensearch:startIndex>{start}</opensearch:startIndex>"
+            f"<opensearch:itemsPerPage>{max_results}</opensearch:itemsPerPage>"
+            + "".join(entries) + "</feed>"
+        ).encode("utf-8")
+
+    # ── LLM / 번역 ──
+    @staticmethod
+    def llm_completion(prompt):
+        """배치 프롬프트("### 기사 N")면 JSON 배열, 아니면 요약 한 건"""
+        ids = [int(m) for m in BATCH_ARTICLE_RE.findall(prompt)]
+        if ids:
+            return json.dumps(
+                [{"id": i, "summary": f"기사 {i}의 핵심 내용을 요약한 재생 응답입니다. 업계 영향이 큽니다."} for i in ids],
+                ensure_ascii=False,
+            )
+        return "핵심 내용을 요약한 재생 응답입니다. 광고 업계에 미칠 영향이 큽니다."
+
+    @staticmethod
+    def translation_page(text):
+        translated = "\n".join(f"[번역] {line}" for line in text.split("\n"))
+        return (
+            '<html><body><div class="result-container">'
+            f"{html.escape(translated)}</div></body></html>"
+        ).encode("utf-8")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # 연결 재사용 (클라이언트 연결 풀 동작 그대로)
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, body, content_type, status=200):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, data):
+        self._send(json.dumps(data, ensure_ascii=False).encode("utf-8"), "application/json")
+
+    def do_GET(self):
+        fixtures = self.server.fixtures
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        parts = url.path.strip("/").split("/")
+
+        if parts[0] == "rss" and len(parts) == 2:
+            self._send(fixtures.rss_feed(parts[1]), "application/rss+xml; charset=utf-8")
+        elif parts[0] == "article" and len(parts) == 3:
+            self._send(fixtures.article(parts[1], int(parts[2])), "text/html; charset=utf-8")
+        elif parts[0] == "s2" and parts[1:] == ["search"]:
+            self._send_json(fixtures.s2_search(query.get("query", "")))
+        elif parts[0] == "arxiv":
+            page = fixtures.arxiv_page(int(query.get("start", 0)), int(query.get("max_results", 100)))
+            self._send(page, "application/atom+xml; charset=utf-8")
+        elif parts[0] == "translate":
+            self._send(fixtures.translation_page(query.get("q", "")), "text/html; charset=utf-8")
+        else:
+            self._send(b"not found", "text/plain", status=404)
+
+    def do_POST(self):
+        fixtures = self.server.fixtures
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"null")
+        path = urlparse(self.path).path.strip("/")
+        if path == "s2/batch":
+            self._send_json(fixtures.s2_batch(body.get("ids", [])))
+        elif path == "llm":
+            if self.server.llm_latency:
+                time.sleep(self.server.llm_latency)
+            self._send_json({"text": fixtures.llm_completion(body.get("prompt", ""))})
+        else:
+            self._send(b"not found", "text/plain", status=404)
+
+
+class StubServer:
+    """
+    백그라운드 스레드에서 도는 대역 서버.
+
+    Args:
+        scale: 픽스처 항목 배수
+        llm_latency: /llm 응답 지연 (초, 실제 API 응답 시간 흉내)
+    """
+
+    def __init__(self, scale=1, host="127.0.0.1", port=0, llm_latency=0.0):
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self.base_url = f"http://{host}:{self._httpd.server_address[1]}"
+        self._httpd.fixtures = Fixtures(self.base_url, scale)
+        self._httpd.llm_latency = llm_latency
+        self._thread = None
+
+    @property
+    def scale(self):
+        return self._httpd.fixtures.scale
+
+    def feed_url(self, name, index):
+        return f"{self.base_url}/rss/{Fixtures.feed_kind(name)}-{index}"
+
+    def url(self, path):
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="stub-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크용 로컬 대역 서버")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--scale", type=int, default=1, help="픽스처 항목 배수")
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="/llm 응답 지연 (초)")
+    args = parser.parse_args()
+
+    server = StubServer(args.scale, port=args.port, llm_latency=args.llm_latency)
+    print(f"대역 서버 실행 중: {server.base_url} (scale {server.scale}x, Ctrl+C로 종료)")
+    print(f"  RSS:    {server.feed_url('AdAge', 0)}")
+    print(f"  번역:   {server.url('translate')}?q={quote('hello')}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
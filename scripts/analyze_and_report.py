@@ -8,21 +8,51 @@
 - 요약 길이 및 문장 완결성 로직 유지
 """
 
+import argparse
+import hashlib
+import heapq
+import itertools
 import json
 import logging
 import re
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 
-import requests
-from bs4 import BeautifulSoup
 from config import (
-    TREND_CATEGORIES,
+    FULLTEXT_MAX_WORKERS,
+    FULLTEXT_PER_HOST_LIMIT,
+    FULLTEXT_TIMEOUT,
+    FULLTEXT_TOTAL_TIMEOUT,
+    FULLTEXT_CACHE_PATH,
+    FULLTEXT_CACHE_TTL,
+    FULLTEXT_CACHE_MAX_BYTES,
+    SUMMARY_CACHE_PATH,
+    SUMMARY_CACHE_MAX_BYTES,
+    LLM_BATCH_SIZE,
+    REPORT_CHECKPOINT_FILENAME,
+    TRANSLATION_CACHE_PATH,
+    TRANSLATION_CACHE_MAX_BYTES,
+    TRANSLATION_MEMO_SIZE,
+    TRANSLATION_BATCH_CHARS,
     get_today_data_dir,
     get_today_str,
     get_today_report_path,
 )
+from disk_cache import DiskCache
+from html_extract import extract_article_text
+from http_client import BROWSER_HEADERS, HostLimiter, make_session
+from item_io import iter_items
+from metrics import incr, span, timed
+from pipeline import Stage, run_stages
+from report_checkpoint import ReportCheckpoint
+from lang_detect import is_korean, item_language
+from scoring import RELEVANCE_FIELD, categorize, relevance, score_items
+from llm_dispatch import build_dispatcher
 
 logger = logging.getLogger(__name__)
 
@@ -38,125 +68,221 @@ except ImportError:
     logger.warning("deep-translator 미설치")
 
 
+_translation_memo = OrderedDict()
+_translation_cache = None
+_translation_lock = threading.Lock()
+# GoogleTranslator는 요청 파라미터를 인스턴스에 저장하므로 동시에 호출하면 서로의 텍스트가 섞임
+# → 요청을 한 번에 하나씩 보내고, 요청 간격(0.5초)도 스레드 전체에서 지켜지도록 대기까지 잠금 안에서 수행
+_translator_lock = threading.Lock()
+
+
+def get_translation_cache():
+    """번역 디스크 캐시 (처음 사용할 때 생성)"""
+    global _translation_cache
+    with _translation_lock:
+        if _translation_cache is None:
+            _translation_cache = DiskCache(TRANSLATION_CACHE_PATH, max_bytes=TRANSLATION_CACHE_MAX_BYTES)
+        return _translation_cache
+
+
+def _translation_key(text):
+    return "ko:" + hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _request_translation(text):
+    """번역 API 호출 (스레드 간 직렬화)"""
+    incr("translate.requests")
+    with _translator_lock:
+        result = translator.translate(text)
+        time.sleep(0.5)
+    return result
+
+
+def _lookup_translation(text):
+    """메모리 LRU → 디스크 캐시 순으로 번역을 찾습니다 (없으면 None)."""
+    with _translation_lock:
+        if text in _translation_memo:
+            _translation_memo.move_to_end(text)
+            incr("translate.memo_hit")
+            return _translation_memo[text]
+    result = get_translation_cache().get(_translation_key(text))
+    if result is not None:
+        _remember_translation(text, result, persist=False)
+    return result
+
+
+def _remember_translation(text, result, persist=True):
+    with _translation_lock:
+        _translation_memo[text] = result
+        _translation_memo.move_to_end(text)
+        while len(_translation_memo) > TRANSLATION_MEMO_SIZE:
+            _translation_memo.popitem(last=False)
+    if persist:
+        get_translation_cache().set(_translation_key(text), result)
+
+
+@timed("translate")
 def translate(text):
-    if not text or not HAS_TRANSLATOR:
+    # 이미 한국어인 텍스트는 번역 요청 없이 그대로 사용
+    if not text or not HAS_TRANSLATOR or is_korean(text):
         return text
+    if len(text) > 4500:
+        text = text[:4500]
+    cached = _lookup_translation(text)
+    if cached is not None:
+        return cached
     try:
-        if len(text) > 4500:
-            text = text[:4500]
-        result = translator.translate(text)
-        time.sleep(0.5)
-        return result if result else text
+        result = _request_translation(text)
     except Exception as e:
+        incr("translate.errors")
         logger.debug(f"번역 실패: {e}")
         return text
+    if not result:
+        return text
+    _remember_translation(text, result)
+    return result
+
+
+@timed("translate.batch")
+def translate_batch(texts):
+    """
+    여러 개의 짧은 문자열(제목 등)을 한꺼번에 번역합니다.
+    캐시에 없는 한 줄짜리 문자열을 줄바꿈으로 이어 TRANSLATION_BATCH_CHARS 단위로 요청하고,
+    응답 줄 수가 맞지 않으면 해당 묶음만 한 건씩 번역합니다.
+
+    Returns:
+        list: texts 순서의 번역 결과
+    """
+    if not HAS_TRANSLATOR:
+        return list(texts)
+
+    pending = []
+    for text in dict.fromkeys(t for t in texts if t and not is_korean(t)):
+        if _lookup_translation(text[:4500]) is None:
+            pending.append(text)
+
+    chunk, chunk_chars = [], 0
+    chunks = []
+    for text in pending:
+        if "\n" in text or len(text) > TRANSLATION_BATCH_CHARS:
+            chunks.append([text])  # 여러 줄이거나 긴 문자열은 단건 번역
+            continue
+        if chunk and chunk_chars + len(text) + 1 > TRANSLATION_BATCH_CHARS:
+            chunks.append(chunk)
+            chunk, chunk_chars = [], 0
+        chunk.append(text)
+        chunk_chars += len(text) + 1
+    if chunk:
+        chunks.append(chunk)
+
+    for chunk in chunks:
+        if len(chunk) == 1:
+            translate(chunk[0])
+            continue
+        try:
+            result = _request_translation("\n".join(chunk))
+            lines = result.split("\n") if result else []
+        except Exception as e:
+            incr("translate.errors")
+            logger.debug(f"배치 번역 실패: {e}")
+            lines = []
+        if len(lines) == len(chunk) and all(line.strip() for line in lines):
+            for text, line in zip(chunk, lines):
+                _remember_translation(text, line.strip())
+        else:
+            for text in chunk:
+                translate(text)
+
+    results = []
+    for text in texts:
+        cached = _lookup_translation(text[:4500]) if text and not is_korean(text) else None
+        results.append(cached if cached is not None else text)
+    return results
 
 
 # ──────────────────────────────────────────────
 # 원문 기사 전문 수집
 # ──────────────────────────────────────────────
-HEADERS = {
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                  "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-}
+# 전문 수집용 공유 세션 (연결 재사용)
+FULLTEXT_SESSION = make_session(pool_size=FULLTEXT_MAX_WORKERS, headers=BROWSER_HEADERS)
+
+
+_fulltext_cache = None
+_fulltext_cache_lock = threading.Lock()
+
 
+def get_fulltext_cache():
+    """기사 전문 디스크 캐시 (처음 사용할 때 생성)"""
+    global _fulltext_cache
+    with _fulltext_cache_lock:
+        if _fulltext_cache is None:
+            _fulltext_cache = DiskCache(
+                FULLTEXT_CACHE_PATH, ttl=FULLTEXT_CACHE_TTL, max_bytes=FULLTEXT_CACHE_MAX_BYTES
+            )
+        return _fulltext_cache
 
-def fetch_article_fulltext(url):
+
+@timed("fulltext.fetch")
+def fetch_article_fulltext(url, host_limiter=None):
+    """
+    기사 본문을 가져옵니다. URL별로 정제된 본문·수집 시각·ETag/Last-Modified를
+    디스크 캐시에 저장하며, FULLTEXT_CACHE_TTL 안이면 네트워크 요청 없이 캐시를
+    반환하고, 지났으면 조건부 요청으로 재검증합니다.
+    """
     if not url: return ""
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=20, allow_redirects=True)
-        resp.raise_for_status()
-        soup = BeautifulSoup(resp.content, "html.parser")
+        cache = get_fulltext_cache()
+        cached = cache.get(url, include_expired=True)
+        if cached and time.time() - cached["fetched_at"] <= FULLTEXT_CACHE_TTL:
+            return cached["text"]
+
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        incr("http.calls")
+        if host_limiter is not None:
+            with host_limiter.slot(url):
+                resp = FULLTEXT_SESSION.get(url, headers=headers, timeout=FULLTEXT_TIMEOUT, allow_redirects=True)
+        else:
+            resp = FULLTEXT_SESSION.get(url, headers=headers, timeout=FULLTEXT_TIMEOUT, allow_redirects=True)
 
-        for tag in soup.find_all(["script", "style", "nav", "footer", "header",
-                                   "aside", "iframe", "noscript", "form", "svg", "button"]):
-            tag.decompose()
+        # 변경 없음: 캐시된 본문의 수집 시각만 갱신
+        if resp.status_code == 304 and cached:
+            incr("fulltext.not_modified")
+            cached["fetched_at"] = time.time()
+            cache.set(url, cached)
+            return cached["text"]
 
-        body_text = ""
-        article = soup.find("article")
-        if article:
-            body_text = article.get_text(separator="\n", strip=True)
-        
-        if len(body_text) < 500:
-            for selector in [
-                ".article-content", ".post-content", ".entry-content",
-                ".story-body", ".article-body", ".content-body",
-                '[itemprop="articleBody"]', ".article__body",
-                "#article-body", ".node-body", ".wysiwyg"
-            ]:
-                el = soup.select_one(selector)
-                if el:
-                    body_text = el.get_text(separator="\n", strip=True)
-                    if len(body_text) > 500: break
-        
-        if len(body_text) < 500:
-            paragraphs = soup.find_all("p")
-            valid_paragraphs = [
-                p.get_text(strip=True) for p in paragraphs
-                if len(p.get_text(strip=True)) > 40
-            ]
-            body_text = "\n".join(valid_paragraphs)
-
-        # ── 잡음 텍스트 필터링 (강화됨) ──
-        noise_patterns = [
-            r'(?i)subscribe.*?newsletter',
-            r'(?i)sign up for.*?email',
-            r'(?i)get your.*?ticket',
-            r'(?i)secure your spot.*?summit',
-            r'(?i)digiday media buying summit.*?\.',
-            r'(?i)subscribe to continue reading',
-            r'(?i)subscription only',
-            r'(?i)become a member',
-            r'(?i)already a subscriber',
-            r'(?i)read more about.*?membership',
-            r'(?i)all rights reserved',
-            r'(?i)copyright \d{4}',
-            r'(?i)advertisement',
-            r'(?i)follow us on',
-            # AdAge/Digiday 특정 문구
-            r'(?i)answers to common questions brands might have about the nation.*?s semiquincentennial',
-            r'(?i)play them all',
-            r'(?i)future of marketing briefing',
-            r'(?i)latest marketing briefing',
-        ]
-        for pattern in noise_patterns:
-            body_text = re.sub(pattern, '', body_text)
-
-        lines = body_text.split('\n')
-        clean_lines = []
-        for line in lines:
-            line_strip = line.strip()
-            if len(line_strip) < 30: continue
-            if line_strip.lower().startswith(('author:', 'by:', 'written by:', 'published:', 'source:')): continue
-            # 특정 반복 문구 제거
-            if "digiday media buying summit" in line_strip.lower(): continue
-            if "answers to common questions brands might have" in line_strip.lower(): continue
-            
-            clean_lines.append(line_strip)
-        
-        body_text = '\n\n'.join(clean_lines)
-        return body_text[:4000]
+        resp.raise_for_status()
+        incr("http.bytes", len(resp.content))
+        with span("fulltext.extract"):
+            body_text = extract_article_text(resp.content, url)
+        cache.set(url, {
+            "text": body_text,
+            "fetched_at": time.time(),
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+        })
+        return body_text
 
     except Exception as e:
+        incr("fulltext.errors")
         logger.debug(f"본문 수집 실패 ({url}): {e}")
         return ""
 
 
-# LLM 지원 설정
-try:
-    from google import genai
-    from config import GEMINI_API_KEY, OPENAI_API_KEY, CLAUDE_API_KEY
-except ImportError:
-    GEMINI_API_KEY = ""
-    OPENAI_API_KEY = ""
-    CLAUDE_API_KEY = ""
-
-def generate_llm_summary(text, title=None):
-    """LLM을 사용하여 기사의 심층 핵심 요약을 생성합니다."""
-    prompt = f"""당신은 글로벌 탑티어 광고대행사의 시니어 마케팅 트렌드 분석가입니다.
+# ──────────────────────────────────────────────
+# LLM 요약
+# ──────────────────────────────────────────────
+SUMMARY_SYSTEM_PROMPT = "당신은 시니어 광고 기획자이자 트렌드 분석가입니다."
+SUMMARY_PROMPT_TEMPLATE = """당신은 글로벌 탑티어 광고대행사의 시니어 마케팅 트렌드 분석가입니다.
 다음은 해외 및 국내 광고/마케팅/미디어 업계 최신 기사 원문(또는 요약본)입니다.
 
-제목: {title if title else '없음'}
+제목: {title}
 원문:
 {text}
 
@@ -167,86 +293,260 @@ def generate_llm_summary(text, title=None):
 - 매끄럽고 세련된 비즈니스 한국어('-습니다/입니다' 체)를 사용하세요.
 - 첫 문장은 가장 중요한 핵심 결론으로 시작하세요.
 """
-    try:
-        # 1순위: Gemini (Google)
-        if GEMINI_API_KEY:
-            try:
-                client = genai.Client(api_key=GEMINI_API_KEY)
-                response = client.models.generate_content(
-                    model='gemini-2.5-flash',
-                    contents=prompt
-                )
-                logger.info("✅ Gemini API 심층 요약 완료")
-                time.sleep(13) # Rate limit 방지 (5 RPM)
-                return response.text.strip()
-            except Exception as e:
-                logger.warning(f"⚠️ Gemini 요약 실패, 다음 LLM으로 전환 시도: {e}")
-                
-        # 2순위: Claude (Anthropic)
-        if CLAUDE_API_KEY:
-            try:
-                import anthropic
-                client = anthropic.Anthropic(api_key=CLAUDE_API_KEY)
-                response = client.messages.create(
-                    model="claude-3-5-sonnet-20241022",
-                    max_tokens=300,
-                    system="당신은 시니어 광고 기획자이자 트렌드 분석가입니다.",
-                    messages=[
-                        {"role": "user", "content": prompt}
-                    ]
-                )
-                logger.info("✅ Claude API 심층 요약 완료")
-                time.sleep(1)
-                return response.content[0].text.strip()
-            except Exception as e:
-                logger.warning(f"⚠️ Claude 요약 실패, 다음 LLM으로 전환 시도: {e}")
-                
-        # 3순위: OpenAI (ChatGPT)
-        if OPENAI_API_KEY:
-            try:
-                import openai
-                client = openai.OpenAI(api_key=OPENAI_API_KEY)
-                response = client.chat.completions.create(
-                    model="gpt-3.5-turbo",
-                    messages=[
-                        {"role": "system", "content": "당신은 시니어 광고 기획자이자 트렌드 분석가입니다."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    max_tokens=300,
-                    temperature=0.5
-                )
-                logger.info("✅ OpenAI API 심층 요약 완료")
-                time.sleep(1)
-                return response.choices[0].message.content.strip()
-            except Exception as e:
-                logger.warning(f"⚠️ OpenAI 요약 실패: {e}")
-                
-    except Exception as e:
-        logger.warning(f"❌ 모든 LLM 요약 실패, 기본 요약으로 대체: {e}")
+
+
+_llm_dispatcher = None
+_llm_dispatcher_lock = threading.Lock()
+
+
+def get_llm_dispatcher():
+    """LLM 분배기 (처음 사용할 때 생성, 클라이언트는 실행 동안 재사용)"""
+    global _llm_dispatcher
+    with _llm_dispatcher_lock:
+        if _llm_dispatcher is None:
+            _llm_dispatcher = build_dispatcher()
+        return _llm_dispatcher
+
+
+def available_llm_models():
+    """API 키가 설정된 (제공자, 모델) 목록을 폴백 순서대로 반환합니다."""
+    return get_llm_dispatcher().models()
+
+
+_summary_cache = None
+_summary_cache_lock = threading.Lock()
+
+
+def get_summary_cache():
+    """LLM 요약 디스크 캐시 (처음 사용할 때 생성)"""
+    global _summary_cache
+    with _summary_cache_lock:
+        if _summary_cache is None:
+            _summary_cache = DiskCache(SUMMARY_CACHE_PATH, max_bytes=SUMMARY_CACHE_MAX_BYTES)
+        return _summary_cache
+
+
+def summary_cache_key(model, prompt):
+    """
+    요약 캐시 키: 모델 + 시스템 프롬프트 + 완성된 프롬프트(템플릿·제목·본문 포함)의 해시.
+    템플릿 문구를 고치면 키가 달라지므로 이전 요약은 자동으로 무효화됩니다.
+    """
+    payload = "\x00".join([model, SUMMARY_SYSTEM_PROMPT, prompt])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _cached_summary(cache, models, prompt):
+    """사용 가능한 모델 중 하나로 만들어 둔 요약이 있으면 반환합니다."""
+    for _, model in models:
+        cached = cache.get(summary_cache_key(model, prompt))
+        if cached:
+            return cached
     return None
 
 
+@timed("llm.summary")
+def generate_llm_summary(text, title=None):
+    """
+    LLM을 사용하여 기사의 심층 핵심 요약을 생성합니다.
+    캐시에 같은 프롬프트의 요약이 있으면 API를 호출하지 않고,
+    없으면 분배기가 Gemini → Claude → OpenAI 중 여유가 있는 제공자에게 보냅니다.
+    """
+    prompt = SUMMARY_PROMPT_TEMPLATE.format(title=title if title else '없음', text=text)
+    dispatcher = get_llm_dispatcher()
+    models = dispatcher.models()
+    if not models:
+        return None
+    cache = get_summary_cache()
+
+    cached = _cached_summary(cache, models, prompt)
+    if cached:
+        logger.info("✅ 요약 캐시 사용")
+        return cached
+
+    result = dispatcher.complete(prompt, system=SUMMARY_SYSTEM_PROMPT, max_tokens=300)
+    if result is None:
+        logger.warning("❌ 모든 LLM 요약 실패, 기본 요약으로 대체")
+        return None
+    model, summary = result
+    logger.info(f"✅ {model} 심층 요약 완료")
+    cache.set(summary_cache_key(model, prompt), summary)
+    return summary
+
+
+# ── 배치 요약 ──
+BATCH_PROMPT_TEMPLATE = """당신은 글로벌 탑티어 광고대행사의 시니어 마케팅 트렌드 분석가입니다.
+다음은 해외 및 국내 광고/마케팅/미디어 업계 최신 기사 {count}건의 원문(또는 요약본)입니다.
+
+{articles}
+
+[요청 사항]
+각 기사를 읽고, 바쁜 C레벨 임원이나 실무 기획자(AE)가 즉시 핵심을 파악할 수 있도록 한국어로 심층 요약해주세요.
+- 불필요한 도입부나 직역투(예: "이 기사는 ~을 다룹니다")는 절대 금지합니다.
+- 단순 사실 전달을 넘어 '이 현상이 왜 중요한지(인사이트)'와 '광고/마케팅 업계에 미칠 영향'이 명확히 드러나게 3~4문장으로 압축하세요.
+- 매끄럽고 세련된 비즈니스 한국어('-습니다/입니다' 체)를 사용하세요.
+- 첫 문장은 가장 중요한 핵심 결론으로 시작하세요.
+- 기사끼리 내용을 섞지 말고 기사별로 따로 요약하세요.
+
+[출력 형식]
+다른 설명 없이 아래 형식의 JSON 배열만 출력하세요. 모든 기사 번호(id)를 한 번씩 포함해야 합니다.
+[{{"id": 1, "summary": "..."}}, {{"id": 2, "summary": "..."}}]
+"""
+BATCH_ARTICLE_TEMPLATE = """### 기사 {id}
+제목: {title}
+원문:
+{text}
+"""
+JSON_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+
+def parse_batch_summaries(raw, count):
+    """
+    배치 응답(JSON 배열)을 검증하고 {id: 요약} 딕셔너리를 반환합니다.
+    형식이 맞지 않으면 빈 딕셔너리를, 일부만 올바르면 올바른 항목만 반환합니다.
+    """
+    try:
+        data = json.loads(JSON_FENCE_RE.sub("", raw.strip()))
+    except (ValueError, AttributeError):
+        return {}
+    if not isinstance(data, list):
+        return {}
+
+    summaries = {}
+    for entry in data:
+        if not isinstance(entry, dict):
+            continue
+        item_id, summary = entry.get("id"), entry.get("summary")
+        if (isinstance(item_id, int) and 1 <= item_id <= count and item_id not in summaries
+                and isinstance(summary, str) and summary.strip()):
+            summaries[item_id] = summary.strip()
+    return summaries
+
+
+@timed("llm.summary_batch")
+def _summarize_batch(batch, cache):
+    """
+    batch: [(title, text, prompt)] → 요약 목록 (응답에서 빠진 항목은 None).
+    모든 제공자가 실패하거나 대기 한도를 넘겨 응답을 받지 못하면 None을 반환합니다.
+    """
+    articles = "\n".join(
+        BATCH_ARTICLE_TEMPLATE.format(id=i, title=title or '없음', text=text)
+        for i, (title, text, _) in enumerate(batch, 1)
+    )
+    batch_prompt = BATCH_PROMPT_TEMPLATE.format(count=len(batch), articles=articles)
+
+    # 형식이 잘못된 응답은 validate에서 걸러져 다음 제공자로 넘어감
+    result = get_llm_dispatcher().complete(
+        batch_prompt,
+        system=SUMMARY_SYSTEM_PROMPT,
+        max_tokens=400 * len(batch),
+        validate=lambda raw: parse_batch_summaries(raw, len(batch)),
+    )
+    if result is None:
+        return None
+
+    model, parsed = result
+    logger.info(f"✅ {model} 배치 요약 완료 ({len(parsed)}/{len(batch)}건)")
+    # 단건 요약과 같은 키로 저장 → 배치/단건 모드가 캐시를 공유
+    for i, summary in parsed.items():
+        cache.set(summary_cache_key(model, batch[i - 1][2]), summary)
+    return [parsed.get(i) for i in range(1, len(batch) + 1)]
+
+
+def _summarize_chunk(chunk, cache):
+    """
+    chunk: [(title, text, prompt)] → 요약 목록. 받은 응답에서 빠진 항목만 단건 요청으로 재시도하고,
+    응답 자체를 받지 못했으면 (제공자 포화·시간 초과) 단건 재시도 없이 모두 None
+    (항목마다 다시 LLM_MAX_WAIT까지 기다리지 않도록)
+    """
+    if len(chunk) == 1:
+        title, text, _ = chunk[0]
+        return [generate_llm_summary(text, title)]
+    summaries = _summarize_batch(chunk, cache)
+    if summaries is None:
+        logger.warning(f"❌ 배치 요약 실패, {len(chunk)}건 기본 요약으로 대체")
+        return [None] * len(chunk)
+    return [
+        summary or generate_llm_summary(text, title)
+        for (title, text, _), summary in zip(chunk, summaries)
+    ]
+
+
+def generate_llm_summaries(entries, batch_size=LLM_BATCH_SIZE):
+    """
+    여러 기사를 묶어 요약합니다. 묶음들은 분배기의 동시 요청 한도까지 병렬로 처리됩니다.
+
+    Args:
+        entries: [(본문, 제목)] 목록
+        batch_size: 한 요청에 넣을 기사 수 (1이면 기사별 단건 요청)
+
+    Returns:
+        list: entries 순서의 요약 목록 (LLM 요약 실패 시 None)
+    """
+    dispatcher = get_llm_dispatcher()
+    models = dispatcher.models()
+    if not models:
+        return [None] * len(entries)
+
+    cache = get_summary_cache()
+    results = [None] * len(entries)
+    pending = []  # (entries 인덱스, (제목, 본문, 단건 프롬프트))
+    for idx, (text, title) in enumerate(entries):
+        prompt = SUMMARY_PROMPT_TEMPLATE.format(title=title if title else '없음', text=text)
+        cached = _cached_summary(cache, models, prompt)
+        if cached:
+            results[idx] = cached
+        else:
+            pending.append((idx, (title, text, prompt)))
+    if len(pending) < len(entries):
+        logger.info(f"✅ 요약 캐시 사용: {len(entries) - len(pending)}/{len(entries)}건")
+
+    batch_size = max(1, batch_size)
+    chunks = [pending[start:start + batch_size] for start in range(0, len(pending), batch_size)]
+    if not chunks:
+        return results
+
+    with ThreadPoolExecutor(max_workers=min(dispatcher.max_workers, len(chunks))) as executor:
+        futures = [executor.submit(_summarize_chunk, [entry for _, entry in chunk], cache) for chunk in chunks]
+        for chunk, future in zip(chunks, futures):
+            for (idx, _), summary in zip(chunk, future.result()):
+                results[idx] = summary
+
+    return results
+
+
 # ──────────────────────────────────────────────
 # 상세 요약 생성
 # ──────────────────────────────────────────────
-def create_improved_summary(item, fulltext):
+def summary_source_text(item, fulltext):
+    """요약에 사용할 원문: 전문 > RSS 요약 > 제목 순"""
     title = item.get("title", "")
     rss_summary = item.get("summary", "")
     
     if fulltext and len(fulltext) > 300:
-        source_text = fulltext[:2000]
+        return fulltext[:2000]
     elif rss_summary and len(rss_summary) > 100:
-        source_text = rss_summary
+        return rss_summary
     else:
-        source_text = f"{title}. {fulltext[:500]}" if fulltext else title
+        return f"{title}. {fulltext[:500]}" if fulltext else title
+
+
+def create_improved_summaries(pairs, return_source=False):
+    """
+    [(item, fulltext)] 목록을 배치 LLM 요약으로 한꺼번에 처리합니다.
+    LLM 요약이 실패한 항목만 룰 기반 요약으로 대체합니다.
+    return_source=True이면 (요약, LLM 요약 여부) 목록을 반환합니다.
+    """
+    entries = [(summary_source_text(item, fulltext), item.get("title", "")) for item, fulltext in pairs]
+    llm_summaries = generate_llm_summaries(entries)
+    results = [
+        (llm_summary, True) if llm_summary else (rule_based_summary(source_text, title), False)
+        for (source_text, title), llm_summary in zip(entries, llm_summaries)
+    ]
+    return results if return_source else [summary for summary, _ in results]
 
-    # LLM 요약 시도
-    if GEMINI_API_KEY or OPENAI_API_KEY:
-        llm_summary = generate_llm_summary(source_text, title)
-        if llm_summary:
-            return llm_summary
 
-    # LLM 실패 시 기존 룰 기반 요약 (Fallback)
+def rule_based_summary(source_text, title):
+    """LLM 실패 시 기존 룰 기반 요약 (번역 + 문장 정리)"""
     kr_text = translate(source_text[:1500])
 
     noise_phrases = [
@@ -301,72 +601,97 @@ TOPIC_KOREAN = {
 }
 
 def categorize_item_best(item):
-    text = f"{item.get('title', '')} {item.get('summary', '')}".lower()
-    best_cat, best_score = "기타", 0
-    for category, keywords in TREND_CATEGORIES.items():
-        if category == "기타": continue
-        score = sum(1 for kw in keywords if kw in text)
-        if category == "AI/자동화": score *= 1.5
-        if score > best_score:
-            best_score = score
-            best_cat = category
-    return best_cat
+    return categorize(item)
 
 
 def relevance_score(item):
-    text = f"{item.get('title', '')} {item.get('summary', '')}".lower()
-    core_kw = [
-        "advertis", "marketing", "media", "campaign", "brand", "consumer",
-        "digital", "tech", "data", "platform", "content", "strategy", "research", "study", "analysis"
-    ]
-    score = sum(1 for kw in core_kw if kw in text)
-    if item.get("type") == "academic": score += 3
-    if "ai" in text or "gpt" in text or "generative" in text: score += 2
-    if item.get("region") == "kr": score += 2  # 국내 기사 가중치
-    return score
+    return relevance(item)
 
 
-def select_top_items(items, top_n=10, kr_ratio=0.3):
-    items_sorted = sorted(items, key=lambda x: -relevance_score(x))
-    
-    if kr_ratio == 0:
-        return items_sorted[:top_n]
-        
+MAX_PER_SOURCE = 3  # 선별 시 소스당 최대 항목 수
+
+
+def _pick_top_items(kr_top, global_top, kr_complete, global_complete, top_n, kr_ratio):
+    """
+    관련도 순으로 정렬된 후보 목록에서 국내 비중·소스 제한을 적용해 고릅니다.
+    후보가 잘린 목록(*_complete=False)인데 그 안에서 다 고르지 못하면 None을 반환합니다.
+    """
     final_items = []
     source_counts = {}
     
     kr_target = int(top_n * kr_ratio)
-    
-    kr_items = [a for a in items_sorted if a.get("region") == "kr"]
-    global_items = [a for a in items_sorted if a.get("region") != "kr"]
+    kr_skipped = []  # 소스 제한으로 건너뛴 국내 기사 (관련도 순)
+    kr_next = len(kr_top)
     
     # 국내 기사 먼저 확보
-    for a in kr_items:
+    for i, a in enumerate(kr_top):
         s = a.get("source", "unknown")
-        if source_counts.get(s, 0) >= 3: continue
+        if source_counts.get(s, 0) >= MAX_PER_SOURCE:
+            kr_skipped.append(a)
+            continue
         final_items.append(a)
         source_counts[s] = source_counts.get(s, 0) + 1
-        if len(final_items) >= kr_target: break
+        if len(final_items) >= kr_target:
+            kr_next = i + 1
+            break
+    else:
+        if not kr_complete: return None
         
     # 나머지 해외 기사로 채움
-    for a in global_items:
+    for a in global_top:
         s = a.get("source", "unknown")
-        if source_counts.get(s, 0) >= 3: continue
+        if source_counts.get(s, 0) >= MAX_PER_SOURCE: continue
         final_items.append(a)
         source_counts[s] = source_counts.get(s, 0) + 1
         if len(final_items) >= top_n: break
+    else:
+        if not global_complete: return None
     
-    # 여전히 부족하면 국내로 변통 시도
+    # 여전히 부족하면 국내로 변통 시도 (건너뛴 기사가 남은 기사보다 관련도 순으로 앞섬)
     if len(final_items) < top_n:
-        for a in [art for art in kr_items if art not in final_items]:
+        for a in itertools.chain(kr_skipped, kr_top[kr_next:]):
             final_items.append(a)
             if len(final_items) >= top_n: break
+        else:
+            if not kr_complete: return None
 
-    # 관련도 순으로 재정렬
-    final_items.sort(key=lambda x: -relevance_score(x))
+    # 관련도 순으로 재정렬 (reverse 정렬도 동점 항목의 순서는 유지)
+    final_items.sort(key=itemgetter(RELEVANCE_FIELD), reverse=True)
     return final_items
 
 
+def select_top_items(items, top_n=10, kr_ratio=0.3):
+    """
+    관련도 상위 top_n개를 고릅니다.
+    국내 기사를 top_n × kr_ratio개까지 먼저 채우고 해외 기사로 나머지를 채우며,
+    소스당 MAX_PER_SOURCE개 제한을 둡니다. 그래도 모자라면 남은 국내 기사로 채웁니다.
+
+    전체를 정렬하지 않고 크기 k의 힙(heapq.nlargest, O(n log k))으로 상위 후보만 뽑습니다.
+    소스 제한 때문에 후보가 모자라면 k를 늘려 다시 뽑습니다.
+    nlargest는 sorted(..., reverse=True)[:k]와 같은 (동점 순서 유지) 결과를 냅니다.
+    """
+    score_items(items)
+    key = itemgetter(RELEVANCE_FIELD)
+
+    if kr_ratio == 0:
+        return heapq.nlargest(top_n, items, key=key)
+
+    kr_items = [a for a in items if a.get("region") == "kr"]
+    global_items = [a for a in items if a.get("region") != "kr"]
+
+    k = max(top_n * 4, 16)
+    while True:
+        kr_top = heapq.nlargest(k, kr_items, key=key)
+        global_top = heapq.nlargest(k, global_items, key=key)
+        final_items = _pick_top_items(
+            kr_top, global_top, len(kr_top) == len(kr_items), len(global_top) == len(global_items),
+            top_n, kr_ratio,
+        )
+        if final_items is not None:
+            return final_items
+        k *= 4
+
+
 def format_date_str(date_str):
     if not date_str:
         return ""
@@ -380,34 +705,104 @@ def format_date_str(date_str):
 # ──────────────────────────────────────────────
 # 보고서 생성
 # ──────────────────────────────────────────────
-def generate_report(articles_all, papers_all):
+def analyze_items(items, checkpoint=None):
+    """
+    선별된 항목을 본문 수집 → LLM 요약 단계로 흘려 보내고, 그동안 제목을 번역합니다.
+    checkpoint(ReportCheckpoint)가 주어지면 항목별 결과를 기록하고,
+    이미 기록된 단계(본문/요약/번역 제목)는 다시 처리하지 않습니다.
+
+    Returns:
+        list: {"item", "fulltext", "summary", "title_kr"} 레코드 목록 (items 순서)
+    """
+    host_limiter = HostLimiter(per_host=FULLTEXT_PER_HOST_LIMIT)
+    fetch_deadline = time.monotonic() + FULLTEXT_TOTAL_TIMEOUT
+
+    def fetch_stage(record):
+        item = record["item"]
+        if "fulltext" in record:
+            return  # 체크포인트에서 복원
+        if item.get("type") == "academic":
+            record["fulltext"] = item.get("summary", "")
+        elif time.monotonic() < fetch_deadline:
+            record["fulltext"] = fetch_article_fulltext(item.get("url", ""), host_limiter) if item.get("url") else ""
+            if record["fulltext"] and checkpoint is not None:
+                checkpoint.update(item, fulltext=record["fulltext"])
+        else:
+            # 전체 시간 예산을 넘기면 새 요청을 시작하지 않음 (RSS 요약으로 대체)
+            logger.warning(f"본문 수집 시간 초과 ({item.get('url', '')})")
+            record["fulltext"] = ""
+
+    def summarize_stage(batch):
+        summaries = create_improved_summaries(
+            [(r["item"], r.get("fulltext", "")) for r in batch], return_source=True
+        )
+        for record, (summary, from_llm) in zip(batch, summaries):
+            record["summary"] = summary
+            # LLM 실패로 대체된 룰 기반 요약은 기록하지 않음 → 다음 실행에서 LLM 요약을 다시 시도
+            if checkpoint is not None and (from_llm or not llm_enabled):
+                checkpoint.update(record["item"], summary=summary)
+
+    llm_enabled = bool(available_llm_models())
+    records = []
+    for item in items:
+        item.setdefault("lang", item_language(item))
+        record = checkpoint.get(item) if checkpoint is not None else {}
+        record["item"] = item
+        records.append(record)
+    pending = [r for r in records if "summary" not in r]
+
+    # 제목 번역은 본문·요약과 무관하므로 파이프라인과 동시에 한 번에 처리 (한국어·번역 완료 항목 제외)
+    # 요약 단계의 translate()와 번역기를 함께 쓰지만 API 호출은 _translator_lock으로 직렬화됨
+    foreign = [r for r in records if r["item"]["lang"] != "ko" and "title_kr" not in r]
+    if len(pending) < len(records) or len(foreign) < sum(1 for r in records if r["item"]["lang"] != "ko"):
+        logger.info(f"[체크포인트] 이어서 처리: 요약 {len(records) - len(pending)}/{len(records)}건 완료, "
+                    f"제목 번역 대기 {len(foreign)}건")
+    translator_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="translate")
+    titles_future = translator_pool.submit(translate_batch, [r["item"].get("title", "") for r in foreign])
+
+    fetched = sum(1 for r in pending if "fulltext" not in r and r["item"].get("type") != "academic"
+                  and r["item"].get("url"))
+    logger.info(f"분석 파이프라인 시작: {len(pending)}건 (본문 수집 {fetched}건, 요약 배치 {LLM_BATCH_SIZE})")
+    run_stages(pending, [
+        Stage("fulltext", fetch_stage, workers=FULLTEXT_MAX_WORKERS),
+        # 배치는 수집 스레드 하나가 채우고, 채워진 배치들만 제공자 동시 요청 한도까지 병렬 처리
+        Stage("summary", summarize_stage, workers=get_llm_dispatcher().max_workers, batch_size=LLM_BATCH_SIZE),
+    ])
+
+    try:
+        for record, title_kr in zip(foreign, titles_future.result()):
+            title = record["item"].get("title", "")
+            if title_kr and title_kr != title:
+                record["title_kr"] = title_kr
+                if checkpoint is not None:
+                    checkpoint.update(record["item"], title_kr=title_kr)
+    except Exception as e:
+        logger.warning(f"제목 번역 실패: {e}")
+    translator_pool.shutdown()
+    return records
+
+
+def generate_report(articles_all, papers_all, checkpoint=None):
     now = datetime.now().strftime("%Y-%m-%d %H:%M")
     
     logger.info(f"분석 대상: 기사 10건, 논문 5건")
     # 국내 비중 30% 보장 로직을 위해 전체 목록에서 선별
-    articles = select_top_items(articles_all, top_n=10, kr_ratio=0.3)
-    papers = select_top_items(papers_all, top_n=5, kr_ratio=0.0)
+    with span("report.select"):
+        articles = select_top_items(articles_all, top_n=10, kr_ratio=0.3)
+        papers = select_top_items(papers_all, top_n=5, kr_ratio=0.0)
     
     analyzed_articles = []
     all_items = articles + papers
     logger.info(f"분석 대상: 기사 {len(articles)}건, 논문 {len(papers)}건")
     
-    detail_map = {}
-    
-    for idx, item in enumerate(all_items, 1):
-        title = item.get("title", "")
-        url = item.get("url", "")
-        is_academic = (item.get("type") == "academic")
-        logger.info(f"[{idx}/{len(all_items)}] 분석 중: {title[:30]}...")
-        
-        fulltext = ""
-        if not is_academic:
-            fulltext = fetch_article_fulltext(url)
-        else:
-            fulltext = item.get("summary", "") 
-            
-        summary = create_improved_summary(item, fulltext)
-        detail_map[title] = summary
+    # 본문 수집 → 요약을 단계별 파이프라인으로 실행 (한 기사를 요약하는 동안 다음 기사의 본문을 가져옴)
+    with span("report.analyze"):
+        records = analyze_items(all_items, checkpoint)
+    detail_map = {r["item"].get("title", ""): r.get("summary", "") for r in records}
+    title_map = {r["item"].get("title", ""): r["title_kr"] for r in records if r.get("title_kr")}
+
+    def korean_title(title):
+        return title_map.get(title) or translate(title)
 
     categorized = {}
     for item in all_items:
@@ -427,13 +822,13 @@ def generate_report(articles_all, papers_all):
     ai_items = categorized.get("AI/자동화", [])
     if ai_items:
         top_ai = ai_items[0]
-        report += f"### 🤖 AI 트렌드: {translate(top_ai.get('title'))}\n"
+        report += f"### 🤖 AI 트렌드: {korean_title(top_ai.get('title'))}\n"
         report += f"{detail_map.get(top_ai.get('title'))}\n\n"
         
     papers_only = [i for i in all_items if i.get("type") == "academic"]
     if papers_only:
         top_paper = papers_only[0]
-        report += f"### 📚 주목할 연구: {translate(top_paper.get('title'))}\n"
+        report += f"### 📚 주목할 연구: {korean_title(top_paper.get('title'))}\n"
         report += f"{detail_map.get(top_paper.get('title'))}\n\n"
 
     report += "---\n\n"
@@ -450,7 +845,7 @@ def generate_report(articles_all, papers_all):
         report += f"### {info['emoji']} {info['title']}\n\n"
         
         for item in items:
-            title_kr = translate(item.get("title"))
+            title_kr = korean_title(item.get("title"))
             summary_kr = detail_map.get(item.get("title"), "")
             source = item.get("source", "")
             url = item.get("url", "")
@@ -470,7 +865,7 @@ def generate_report(articles_all, papers_all):
     report += "## 📚 최신 학술 연구 및 이론 (Research & Theory)\n\n"
     if papers_only:
         for p in papers_only:
-            title_kr = translate(p.get("title", ""))
+            title_kr = korean_title(p.get("title", ""))
             summary_kr = detail_map.get(p.get("title", ""), "")
             source = p.get("source", "Academic Source")
             url = p.get("url", "")
@@ -494,14 +889,23 @@ def generate_report(articles_all, papers_all):
     return report
 
 
-def create_report():
+def create_report(resume=True):
+    """
+    오늘 수집 데이터로 보고서를 만듭니다. 항목별 진행은 날짜 디렉토리의
+    체크포인트에 기록되므로, 중간에 실패한 뒤 다시 실행하면 끝난 항목은
+    건너뛰고 (모두 끝났으면 보고서 본문만 다시 작성) 이어서 처리합니다.
+
+    Args:
+        resume: False이면 기존 체크포인트를 지우고 처음부터 생성
+    """
     data_dir = get_today_data_dir()
     articles, papers = [], []
     try:
-        with open(data_dir / "raw_articles.json", "r", encoding="utf-8") as f:
-            articles = json.load(f)
-        with open(data_dir / "raw_papers.json", "r", encoding="utf-8") as f:
-            papers = json.load(f)
+        for item in iter_items(data_dir):
+            if item.get("type") == "academic":
+                papers.append(item)
+            else:
+                articles.append(item)
     except Exception as e:
         logger.error(f"데이터 로드 실패: {e}")
         return None
@@ -511,7 +915,14 @@ def create_report():
         return None
         
     logger.info("보고서 생성 프로세스 시작...")
-    report_content = generate_report(articles, papers)
+    checkpoint_path = data_dir / REPORT_CHECKPOINT_FILENAME
+    if not resume and checkpoint_path.exists():
+        checkpoint_path.unlink()
+    checkpoint = ReportCheckpoint(checkpoint_path)
+    try:
+        report_content = generate_report(articles, papers, checkpoint)
+    finally:
+        checkpoint.close()
     
     report_path = get_today_report_path()
     with open(report_path, "w", encoding="utf-8") as f:
@@ -522,5 +933,9 @@ def create_report():
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s", datefmt="%H:%M:%S")
-    path = create_report()
+    parser = argparse.ArgumentParser(description="오늘 수집 데이터로 보고서 생성")
+    parser.add_argument("--no-resume", action="store_true",
+                        help="체크포인트를 지우고 모든 항목을 처음부터 다시 처리합니다")
+    args = parser.parse_args()
+    path = create_report(resume=not args.no_resume)
     if path: print(f"Report Created: {path}")
@@ -6,11 +6,10 @@
 - arXiv API에서 프리프린트 검색
 """
 
-import json
-import time
+import re
 import logging
-from datetime import datetime, timedelta
-from dateutil import parser as date_parser
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
 
 import feedparser
 import requests
@@ -18,101 +17,227 @@ import arxiv
 
 from config import (
     RSS_FEEDS,
+    RSS_MAX_WORKERS,
+    RSS_PER_HOST_LIMIT,
+    RSS_FETCH_TIMEOUT,
+    RSS_TOTAL_TIMEOUT,
+    RSS_STREAM_CHUNK_SIZE,
+    RSS_EARLY_STOP_AFTER,
+    FEED_CACHE_PATH,
     SEARCH_KEYWORDS,
     SEMANTIC_SCHOLAR_API,
     SEMANTIC_SCHOLAR_FIELDS,
     SEMANTIC_SCHOLAR_LIMIT,
+    SEMANTIC_SCHOLAR_BATCH_API,
+    SEMANTIC_SCHOLAR_BATCH_SIZE,
+    SEMANTIC_SCHOLAR_API_KEY,
+    SEMANTIC_SCHOLAR_RPS,
+    SEMANTIC_SCHOLAR_MAX_WORKERS,
+    SEMANTIC_SCHOLAR_MAX_RETRIES,
+    SEMANTIC_SCHOLAR_TIMEOUT,
     ARXIV_MAX_RESULTS,
+    ARXIV_SEARCH_QUERIES,
+    ARXIV_TIMEOUT,
+    SOURCE_RETRIES,
     MEDIA_FILTER_KEYWORDS,
+    ITEM_STORE_PATH,
+    ITEM_STORE_KEEP_DAYS,
     get_today_data_dir,
     get_today_str,
 )
+from disk_cache import DiskCache
+from http_client import (
+    BROWSER_HEADERS,
+    HostLimiter,
+    TokenBucket,
+    make_session,
+    request_with_backoff,
+)
+from item_io import write_items
+from item_store import ItemStore, STATUS_UNCHANGED
+from metrics import count_bytes, incr, span, timed
+from near_dedup import remove_near_duplicates
+from sources import SOURCES, register_source, run_sources
+from trend_index import TrendIndex
+from rss_stream import FeedStreamFallback, parse_feed_date, stream_feed_entries
 
 logger = logging.getLogger(__name__)
 
+HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# 항목 유형별 수집 기간 (일)
+WINDOW_DAYS = {"industry": 7, "academic": 30}
+
 
 # ──────────────────────────────────────────────
 # RSS 피드 수집
 # ──────────────────────────────────────────────
-def collect_rss_feeds(days_back=7):
+def _parse_feed_entries(source_name, entries, region):
     """
-    RSS 피드에서 최근 기사를 수집합니다.
-
-    Args:
-        days_back: 며칠 전까지의 기사를 수집할지 (기본 7일)
-
-    Returns:
-        list[dict]: 수집된 기사 목록
+    피드 엔트리(feedparser 또는 rss_stream 결과)를 기사 dict 목록으로
+    변환합니다 (날짜 필터 전).
     """
-    cutoff = datetime.now() - timedelta(days=days_back)
     articles = []
+    for entry in entries:
+        # 날짜 파싱 (스트리밍 파서는 pub_date를 미리 계산해 둠)
+        pub_date = entry.get("pub_date")
+        if pub_date is None:
+            for date_field in ["published", "updated", "created"]:
+                pub_date = parse_feed_date(entry.get(date_field))
+                if pub_date:
+                    break
+
+        # 기사 정보 추출
+        title = entry.get("title", "").strip()
+        link = entry.get("link", "").strip()
+        summary = entry.get("summary", entry.get("description", "")).strip()
+
+        # HTML 태그 간단 제거
+        summary = HTML_TAG_RE.sub("", summary).strip()
+
+        articles.append({
+            "source": source_name,
+            "type": "industry",
+            "region": region,
+            "title": title,
+            "url": link,
+            "summary": summary[:1000],  # 요약 길이 제한
+            "published_date": pub_date.isoformat() if pub_date else None,
+            "authors": entry.get("author", ""),
+        })
+    return articles
 
-    for source_name, feed_url in RSS_FEEDS.items():
-        logger.info(f"[RSS] {source_name} 수집 중: {feed_url}")
-        try:
-            # 봇 차단을 막기 위해 requests로 먼저 가져와서 feedparser에 넘기기
-            headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'}
-            resp = requests.get(feed_url, headers=headers, timeout=15)
-            
-            # 응답이 성공적이면 파싱
-            if resp.status_code == 200:
-                feed = feedparser.parse(resp.content)
+
+def _filter_recent(articles, cutoff):
+    """published_date가 cutoff 이전인 기사를 제외합니다 (날짜 없는 기사는 유지)."""
+    recent = []
+    for article in articles:
+        pub_date = article.get("published_date")
+        if pub_date and datetime.fromisoformat(pub_date) < cutoff:
+            continue
+        recent.append(article)
+    return recent
+
+
+@timed("rss.feed")
+def _fetch_rss_feed(source_name, feed_url, cutoff, host_limiter, feed_cache):
+    """
+    단일 RSS 피드를 가져와 cutoff 이후의 기사를 반환합니다.
+    캐시에 ETag/Last-Modified가 있으면 조건부 요청을 보내고, 304 응답이면
+    캐시된 엔트리를 그대로 사용합니다.
+    오류는 이 함수 안에서 로깅하고 빈 목록을 반환합니다.
+    """
+    logger.info(f"[RSS] {source_name} 수집 중: {feed_url}")
+    try:
+        cached = feed_cache.get(feed_url)
+
+        # 봇 차단을 막기 위해 requests로 먼저 가져와서 feedparser에 넘기기
+        headers = dict(BROWSER_HEADERS)
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        raw_entries = None
+        content = None
+        with host_limiter.slot(feed_url):
+            incr("http.calls")
+            with requests.get(feed_url, headers=headers, timeout=RSS_FETCH_TIMEOUT, stream=True) as resp:
+                # 변경 없음: 캐시된 엔트리 사용
+                if resp.status_code == 304 and cached:
+                    incr("rss.not_modified")
+                    logger.debug(f"[RSS] {source_name}: 변경 없음 (캐시 사용)")
+                    articles = _filter_recent(cached["entries"], cutoff)
+                    logger.info(f"[RSS] {source_name}: {len(articles)}건 수집")
+                    return articles
+
+                # 응답이 성공적이면 스트리밍 파싱 (오래된 엔트리가 이어지면 중단)
+                if resp.status_code == 200:
+                    try:
+                        raw_entries = stream_feed_entries(
+                            count_bytes(resp.iter_content(chunk_size=RSS_STREAM_CHUNK_SIZE)),
+                            cutoff, stop_after_old=RSS_EARLY_STOP_AFTER,
+                        )
+                    except FeedStreamFallback as e:
+                        logger.debug(f"[RSS] {source_name}: 스트리밍 파싱 불가, feedparser 사용 ({e})")
+                        content = e.content
+
+        if raw_entries is None:
+            if content is not None:
+                feed = feedparser.parse(content)
             else:
                 # 우회 실패 시 기존 방식 시도
                 feed = feedparser.parse(feed_url)
 
             if feed.bozo and not feed.entries:
                 logger.warning(f"[RSS] {source_name} 파싱 실패: {feed.bozo_exception}")
-                continue
-
-            count = 0
-            for entry in feed.entries:
-                # 날짜 파싱
-                pub_date = None
-                for date_field in ["published", "updated", "created"]:
-                    if hasattr(entry, date_field) and getattr(entry, date_field):
-                        try:
-                            pub_date = date_parser.parse(getattr(entry, date_field))
-                            # timezone-naive로 변환
-                            if pub_date.tzinfo:
-                                pub_date = pub_date.replace(tzinfo=None)
-                            break
-                        except (ValueError, TypeError):
-                            continue
-
-                # 날짜 필터링
-                if pub_date and pub_date < cutoff:
-                    continue
-
-                # 기사 정보 추출
-                title = entry.get("title", "").strip()
-                link = entry.get("link", "").strip()
-                summary = entry.get("summary", entry.get("description", "")).strip()
-
-                # HTML 태그 간단 제거
-                import re
-                summary = re.sub(r"<[^>]+>", "", summary).strip()
-
-                # 지역 판별 (간단 로직: 이름에 한글 포함 여부 또는 특정 소스명)
-                is_korean = any("\uac00" <= c <= "\ud7a3" for c in source_name)
-                region = "kr" if is_korean else "global"
-
-                articles.append({
-                    "source": source_name,
-                    "type": "industry",
-                    "region": region,
-                    "title": title,
-                    "url": link,
-                    "summary": summary[:1000],  # 요약 길이 제한
-                    "published_date": pub_date.isoformat() if pub_date else None,
-                    "authors": entry.get("author", ""),
+                return []
+            raw_entries = feed.entries
+
+        # 지역 판별 (간단 로직: 이름에 한글 포함 여부 또는 특정 소스명)
+        is_korean = any("\uac00" <= c <= "\ud7a3" for c in source_name)
+        region = "kr" if is_korean else "global"
+
+        entries = _parse_feed_entries(source_name, raw_entries, region)
+
+        # 검증자(validator)가 있을 때만 캐시에 저장
+        if resp.status_code == 200:
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+            if etag or last_modified:
+                feed_cache.set(feed_url, {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "entries": entries,
                 })
-                count += 1
 
-            logger.info(f"[RSS] {source_name}: {count}건 수집")
+        articles = _filter_recent(entries, cutoff)
+        logger.info(f"[RSS] {source_name}: {len(articles)}건 수집")
+
+    except Exception as e:
+        logger.error(f"[RSS] {source_name} 오류: {e}")
+        return []
+
+    return articles
+
+
+@register_source("RSS", item_type="industry", timeout=RSS_TOTAL_TIMEOUT + 15,
+                 days_back=WINDOW_DAYS["industry"])
+def collect_rss_feeds(days_back=7):
+    """
+    RSS 피드에서 최근 기사를 수집합니다.
+    피드들은 스레드 풀에서 동시에 가져오며, 호스트별 동시 연결 수와
+    단계 전체 제한 시간(RSS_TOTAL_TIMEOUT)을 적용합니다.
+    피드별 ETag/Last-Modified와 파싱된 엔트리는 FEED_CACHE_PATH에 보관됩니다.
+
+    Args:
+        days_back: 며칠 전까지의 기사를 수집할지 (기본 7일)
+
+    Returns:
+        list[dict]: 수집된 기사 목록 (RSS_FEEDS 순서 유지)
+    """
+    cutoff = datetime.now() - timedelta(days=days_back)
+    host_limiter = HostLimiter(per_host=RSS_PER_HOST_LIMIT)
+    feed_cache = DiskCache(FEED_CACHE_PATH)
+
+    executor = ThreadPoolExecutor(max_workers=RSS_MAX_WORKERS, thread_name_prefix="rss")
+    futures = {
+        source_name: executor.submit(
+            _fetch_rss_feed, source_name, feed_url, cutoff, host_limiter, feed_cache
+        )
+        for source_name, feed_url in RSS_FEEDS.items()
+    }
+    wait(futures.values(), timeout=RSS_TOTAL_TIMEOUT)
+    # 제한 시간을 넘긴 피드는 기다리지 않고 버림
+    executor.shutdown(wait=False, cancel_futures=True)
 
-        except Exception as e:
-            logger.error(f"[RSS] {source_name} 오류: {e}")
+    articles = []
+    for source_name, future in futures.items():
+        if not future.done():
+            logger.error(f"[RSS] {source_name} 오류: 수집 제한 시간({RSS_TOTAL_TIMEOUT}초) 초과")
+            continue
+        articles.extend(future.result())
 
     logger.info(f"[RSS] 총 {len(articles)}건 수집 완료")
     return articles
@@ -121,9 +246,52 @@ def collect_rss_feeds(days_back=7):
 # ──────────────────────────────────────────────
 # Semantic Scholar 검색
 # ──────────────────────────────────────────────
+def _s2_search_ids(session, bucket, keyword, cutoff_date):
+    """키워드로 검색해 paperId 목록만 가져옵니다 (상세 정보는 배치로 조회)."""
+    logger.info(f"[Semantic Scholar] 검색: {keyword}")
+    params = {
+        "query": keyword,
+        "fields": "paperId",
+        "limit": SEMANTIC_SCHOLAR_LIMIT,
+        "publicationDateOrYear": f"{cutoff_date}:",
+    }
+    resp = request_with_backoff(
+        session, "GET", SEMANTIC_SCHOLAR_API, bucket=bucket,
+        max_retries=SEMANTIC_SCHOLAR_MAX_RETRIES, params=params, timeout=15,
+    )
+    if resp.status_code != 200:
+        logger.warning(f"[Semantic Scholar] HTTP {resp.status_code} ({keyword})")
+        return []
+    return [p["paperId"] for p in resp.json().get("data", []) if p.get("paperId")]
+
+
+def _s2_fetch_batch(session, bucket, paper_ids):
+    """배치 엔드포인트로 논문 상세 정보를 한 번에 조회합니다."""
+    details = {}
+    for i in range(0, len(paper_ids), SEMANTIC_SCHOLAR_BATCH_SIZE):
+        chunk = paper_ids[i:i + SEMANTIC_SCHOLAR_BATCH_SIZE]
+        resp = request_with_backoff(
+            session, "POST", SEMANTIC_SCHOLAR_BATCH_API, bucket=bucket,
+            max_retries=SEMANTIC_SCHOLAR_MAX_RETRIES,
+            params={"fields": SEMANTIC_SCHOLAR_FIELDS}, json={"ids": chunk}, timeout=30,
+        )
+        if resp.status_code != 200:
+            logger.warning(f"[Semantic Scholar] 배치 조회 HTTP {resp.status_code}")
+            continue
+        # 응답은 요청한 id 순서대로이며, 찾지 못한 id는 null
+        for paper_id, paper in zip(chunk, resp.json()):
+            if paper:
+                details[paper_id] = paper
+    return details
+
+
+@register_source("Semantic Scholar", item_type="academic", timeout=SEMANTIC_SCHOLAR_TIMEOUT,
+                 retries=SOURCE_RETRIES, days_back=WINDOW_DAYS["academic"])
 def search_semantic_scholar(days_back=30):
     """
     Semantic Scholar API로 광고/미디어 관련 최신 논문을 검색합니다.
+    모든 키워드를 토큰 버킷(SEMANTIC_SCHOLAR_RPS) 한도 안에서 동시에 검색해
+    paperId만 받고, 상세 정보는 배치 엔드포인트로 한 번에 조회합니다.
 
     Args:
         days_back: 며칠 이내 출판된 논문 검색 (기본 30일)
@@ -135,61 +303,72 @@ def search_semantic_scholar(days_back=30):
     seen_titles = set()
     cutoff_date = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
 
-    for keyword in SEARCH_KEYWORDS[:5]:  # 상위 5개 키워드만 (API 제한 고려)
-        logger.info(f"[Semantic Scholar] 검색: {keyword}")
-        try:
-            params = {
-                "query": keyword,
-                "fields": SEMANTIC_SCHOLAR_FIELDS,
-                "limit": SEMANTIC_SCHOLAR_LIMIT,
-                "publicationDateOrYear": f"{cutoff_date}:",
-            }
-            resp = requests.get(SEMANTIC_SCHOLAR_API, params=params, timeout=15)
-
-            if resp.status_code == 429:
-                logger.warning("[Semantic Scholar] Rate limit. 5초 대기...")
-                time.sleep(5)
-                resp = requests.get(SEMANTIC_SCHOLAR_API, params=params, timeout=15)
-
-            if resp.status_code != 200:
-                logger.warning(f"[Semantic Scholar] HTTP {resp.status_code}")
-                continue
-
-            data = resp.json()
-            for paper in data.get("data", []):
-                title = paper.get("title", "").strip()
-                if not title or title.lower() in seen_titles:
-                    continue
-                seen_titles.add(title.lower())
-
-                authors = ", ".join(
-                    a.get("name", "") for a in paper.get("authors", [])[:5]
-                )
-
-                # DOI 또는 URL
-                ext_ids = paper.get("externalIds", {}) or {}
-                doi = ext_ids.get("DOI", "")
-                url = paper.get("url", "")
-                if doi and not url:
-                    url = f"https://doi.org/{doi}"
-
-                papers.append({
-                    "source": "Semantic Scholar",
-                    "type": "academic",
-                    "title": title,
-                    "url": url,
-                    "summary": (paper.get("abstract") or "")[:1500],
-                    "published_date": paper.get("publicationDate"),
-                    "authors": authors,
-                    "year": paper.get("year"),
-                    "citations": paper.get("citationCount", 0),
-                    "keyword": keyword,
-                })
-
-            time.sleep(1)  # API rate limit 준수
-
-        except Exception as e:
-            logger.error(f"[Semantic Scholar] 오류 ({keyword}): {e}")
+    headers = {"x-api-key": SEMANTIC_SCHOLAR_API_KEY} if SEMANTIC_SCHOLAR_API_KEY else None
+    session = make_session(pool_size=SEMANTIC_SCHOLAR_MAX_WORKERS, headers=headers)
+    bucket = TokenBucket(rate=SEMANTIC_SCHOLAR_RPS)
+
+    # 1) 키워드별 검색 (동시 실행, 속도는 토큰 버킷이 제어)
+    ids_by_keyword = {}
+    with ThreadPoolExecutor(max_workers=SEMANTIC_SCHOLAR_MAX_WORKERS, thread_name_prefix="s2") as executor:
+        futures = {
+            keyword: executor.submit(_s2_search_ids, session, bucket, keyword, cutoff_date)
+            for keyword in SEARCH_KEYWORDS
+        }
+        for keyword, future in futures.items():
+            try:
+                ids_by_keyword[keyword] = future.result()
+            except Exception as e:
+                logger.error(f"[Semantic Scholar] 오류 ({keyword}): {e}")
+
+    # 논문별로 처음 찾은 키워드를 기록
+    keyword_of = {}
+    for keyword in SEARCH_KEYWORDS:
+        for paper_id in ids_by_keyword.get(keyword, []):
+            keyword_of.setdefault(paper_id, keyword)
+
+    # 2) 상세 정보 배치 조회
+    try:
+        details = _s2_fetch_batch(session, bucket, list(keyword_of))
+    except Exception as e:
+        logger.error(f"[Semantic Scholar] 배치 조회 오류: {e}")
+        details = {}
+    finally:
+        session.close()
+
+    for paper_id, keyword in keyword_of.items():
+        paper = details.get(paper_id)
+        if not paper:
+            continue
+        title = (paper.get("title") or "").strip()
+        if not title or title.lower() in seen_titles:
+            continue
+        seen_titles.add(title.lower())
+
+        authors = ", ".join(
+            a.get("name", "") for a in (paper.get("authors") or [])[:5]
+        )
+
+        # DOI 또는 URL
+        ext_ids = paper.get("externalIds", {}) or {}
+        doi = ext_ids.get("DOI", "")
+        url = paper.get("url", "")
+        if doi and not url:
+            url = f"https://doi.org/{doi}"
+
+        papers.append({
+            "source": "Semantic Scholar",
+            "type": "academic",
+            "title": title,
+            "url": url,
+            "summary": (paper.get("abstract") or "")[:1500],
+            "published_date": paper.get("publicationDate"),
+            "authors": authors,
+            "year": paper.get("year"),
+            "citations": paper.get("citationCount", 0),
+            "keyword": keyword,
+            "doi": doi,
+            "arxiv_id": ext_ids.get("ArXiv", ""),
+        })
 
     logger.info(f"[Semantic Scholar] 총 {len(papers)}건 검색 완료")
     return papers
@@ -198,59 +377,74 @@ def search_semantic_scholar(days_back=30):
 # ──────────────────────────────────────────────
 # arXiv 검색
 # ──────────────────────────────────────────────
+# 모든 검색에서 재사용하는 arXiv 클라이언트 (요청 간격 3초는 arXiv API 권장값)
+ARXIV_CLIENT = arxiv.Client(page_size=ARXIV_MAX_RESULTS * len(ARXIV_SEARCH_QUERIES),
+                            delay_seconds=3.0, num_retries=3)
+
+
+def build_arxiv_query(queries):
+    """검색어 목록을 하나의 OR 결합 쿼리로 만듭니다."""
+    clauses = []
+    for query in queries:
+        terms = " AND ".join(f"all:{term}" for term in query.split())
+        clauses.append(f"({terms})")
+    return " OR ".join(clauses)
+
+
+@register_source("arXiv", item_type="academic", timeout=ARXIV_TIMEOUT,
+                 retries=SOURCE_RETRIES, days_back=WINDOW_DAYS["academic"])
 def search_arxiv(days_back=30):
     """
     arXiv에서 광고/미디어 관련 최신 논문을 검색합니다.
+    ARXIV_SEARCH_QUERIES를 OR로 결합한 단일 쿼리를 최신순으로 조회하고,
+    days_back보다 오래된 결과가 나오면 페이지 조회를 멈춥니다.
+
+    Args:
+        days_back: 며칠 이내 제출된 논문 검색 (기본 30일)
 
     Returns:
         list[dict]: 검색된 논문 목록
     """
     papers = []
     seen_titles = set()
+    cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
+
+    query = build_arxiv_query(ARXIV_SEARCH_QUERIES)
+    logger.info(f"[arXiv] 검색: {query}")
+    try:
+        search = arxiv.Search(
+            query=query,
+            max_results=ARXIV_MAX_RESULTS * len(ARXIV_SEARCH_QUERIES),
+            sort_by=arxiv.SortCriterion.SubmittedDate,
+            sort_order=arxiv.SortOrder.Descending,
+        )
+
+        for result in ARXIV_CLIENT.results(search):
+            pub_date = result.published
+            # 제출일 내림차순이므로 cutoff 이전 결과부터는 더 볼 필요 없음
+            if pub_date and pub_date < cutoff:
+                break
+
+            title = result.title.strip()
+            if title.lower() in seen_titles:
+                continue
+            seen_titles.add(title.lower())
 
-    search_queries = [
-        "advertising media",
-        "digital advertising",
-        "ad technology",
-        "programmatic advertising",
-        "social media marketing",
-    ]
+            authors = ", ".join(a.name for a in result.authors[:5])
 
-    for query in search_queries:
-        logger.info(f"[arXiv] 검색: {query}")
-        try:
-            search = arxiv.Search(
-                query=query,
-                max_results=ARXIV_MAX_RESULTS,
-                sort_by=arxiv.SortCriterion.SubmittedDate,
-                sort_order=arxiv.SortOrder.Descending,
-            )
-
-            client = arxiv.Client()
-            for result in client.results(search):
-                title = result.title.strip()
-                if title.lower() in seen_titles:
-                    continue
-                seen_titles.add(title.lower())
-
-                authors = ", ".join(a.name for a in result.authors[:5])
-                pub_date = result.published
-
-                papers.append({
-                    "source": "arXiv",
-                    "type": "academic",
-                    "title": title,
-                    "url": result.entry_id,
-                    "summary": (result.summary or "")[:1500],
-                    "published_date": pub_date.strftime("%Y-%m-%d") if pub_date else None,
-                    "authors": authors,
-                    "categories": [c for c in result.categories],
-                })
+            papers.append({
+                "source": "arXiv",
+                "type": "academic",
+                "title": title,
+                "url": result.entry_id,
+                "summary": (result.summary or "")[:1500],
+                "published_date": pub_date.strftime("%Y-%m-%d") if pub_date else None,
+                "authors": authors,
+                "categories": [c for c in result.categories],
+            })
 
-            time.sleep(1)
-
-        except Exception as e:
-            logger.error(f"[arXiv] 오류 ({query}): {e}")
+    except Exception as e:
+        logger.error(f"[arXiv] 오류 ({query}): {e}")
 
     logger.info(f"[arXiv] 총 {len(papers)}건 검색 완료")
     return papers
@@ -260,7 +454,7 @@ def search_arxiv(days_back=30):
 # 중복 제거
 # ──────────────────────────────────────────────
 def deduplicate(items):
-    """제목 기반으로 중복 항목 제거"""
+    """제목 기반으로 중복 항목 제거 후, 제목/요약이 유사한 항목도 하나로 합침"""
     seen = set()
     unique = []
     for item in items:
@@ -271,7 +465,7 @@ def deduplicate(items):
         if title_key not in seen:
             seen.add(title_key)
             unique.append(item)
-    return unique
+    return remove_near_duplicates(unique)
 
 
 # ──────────────────────────────────────────────
@@ -280,47 +474,75 @@ def deduplicate(items):
 def collect_all():
     """
     모든 소스에서 데이터를 수집하고 저장합니다.
+    소스는 sources 레지스트리에 등록된 수집 함수들이며 동시에 실행됩니다.
+    수집 결과는 항목 저장소(ITEM_STORE_PATH)에 누적되며, articles/papers는
+    기간(기사 7일, 논문 30일) 내 전체 항목, new_items는 이번 수집에서
+    새로 들어왔거나 내용이 바뀐 항목입니다.
 
     Returns:
-        dict: {"articles": [...], "papers": [...]}
+        dict: {"articles": [...], "papers": [...], "new_items": [...]}
     """
     logger.info("=" * 60)
     logger.info(f"광고업계 트렌드 수집 시작: {get_today_str()}")
     logger.info("=" * 60)
 
-    # 1) RSS 피드에서 업계 기사 수집
-    articles = collect_rss_feeds(days_back=7)
-
-    # 2) Semantic Scholar에서 학술 논문 검색
-    ss_papers = search_semantic_scholar(days_back=30)
-
-    # 3) arXiv에서 프리프린트 검색
-    arxiv_papers = search_arxiv(days_back=30)
-
-    # 4) 학술 논문 통합 & 중복 제거
-    all_papers = deduplicate(ss_papers + arxiv_papers)
+    store = ItemStore(ITEM_STORE_PATH)
+    try:
+        # 1) 등록된 모든 소스를 동시에 실행하고, 끝나는 대로 저장소에 반영
+        status_of = {}
+
+        def on_result(source, items):
+            for item, status in zip(items, store.upsert(items)):
+                # 같은 항목이 여러 번 들어오면 처음 판별된 신규/변경 상태를 유지
+                if status_of.get(item["item_id"], STATUS_UNCHANGED) == STATUS_UNCHANGED:
+                    status_of[item["item_id"]] = status
+            logger.info(f"[{source.name}] 저장소 반영: {len(items)}건")
+
+        results = run_sources(SOURCES, on_result=on_result)
+        collected = {item_type: [] for item_type in WINDOW_DAYS}
+        for source in SOURCES:
+            for item in results[source.name]:
+                collected.setdefault(item["type"], []).append(item)
+
+        # 2) 기간 내 누적 항목 보강 (이번에 응답하지 않은 소스의 항목 포함)
+        articles = store.window("industry", days_back=WINDOW_DAYS["industry"], current=collected["industry"])
+        all_papers = store.window("academic", days_back=WINDOW_DAYS["academic"], current=collected["academic"])
+        store.prune(keep_days=ITEM_STORE_KEEP_DAYS)
+    finally:
+        store.close()
+
+    # 3) 중복 제거 (논문은 제목 일치 + 유사 중복, 기사는 매체 간 유사 중복)
+    with span("collect.dedup"):
+        all_papers = deduplicate(all_papers)
+        n_articles = len(articles)
+        articles = remove_near_duplicates(articles)
+    logger.info(f"유사 중복 제거: 기사 {n_articles} → {len(articles)}건")
+
+    new_items = [
+        item for item in articles + all_papers
+        if status_of.get(item["item_id"], STATUS_UNCHANGED) != STATUS_UNCHANGED
+    ]
+    logger.info(f"신규/변경 항목: {len(new_items)}건 (이번 수집 {len(status_of)}건)")
 
-    # 5) 저장
+    # 4) 저장 (기사 + 논문을 압축 JSON Lines 파일 하나로)
     data_dir = get_today_data_dir()
+    with span("collect.write"):
+        items_file = write_items(data_dir, articles + all_papers)
+    logger.info(f"수집 데이터 저장: {items_file} (기사 {len(articles)}건, 논문 {len(all_papers)}건)")
 
-    articles_path = data_dir / "raw_articles.json"
-    with open(articles_path, "w", encoding="utf-8") as f:
-        json.dump(articles, f, ensure_ascii=False, indent=2)
-    logger.info(f"업계 기사 저장: {articles_path} ({len(articles)}건)")
-
-    papers_path = data_dir / "raw_papers.json"
-    with open(papers_path, "w", encoding="utf-8") as f:
-        json.dump(all_papers, f, ensure_ascii=False, indent=2)
-    logger.info(f"학술 논문 저장: {papers_path} ({len(all_papers)}건)")
-
-    # 통합 데이터
-    all_items = articles + all_papers
-    trends_path = data_dir / "trends.json"
-    with open(trends_path, "w", encoding="utf-8") as f:
-        json.dump(all_items, f, ensure_ascii=False, indent=2)
-    logger.info(f"통합 데이터 저장: {trends_path} ({len(all_items)}건)")
+    # 5) 누적 트렌드 인덱스 갱신 (실패해도 수집 결과에는 영향 없음)
+    try:
+        index = TrendIndex()
+        try:
+            with span("collect.index"):
+                added = index.index_day(data_dir)
+        finally:
+            index.close()
+        logger.info(f"트렌드 인덱스 갱신: {added}건 추가")
+    except Exception as e:
+        logger.warning(f"트렌드 인덱스 갱신 실패: {e}")
 
-    return {"articles": articles, "papers": all_papers}
+    return {"articles": articles, "papers": all_papers, "new_items": new_items}
 
 
 if __name__ == "__main__":
@@ -330,4 +552,5 @@ if __name__ == "__main__":
         datefmt="%H:%M:%S",
     )
     result = collect_all()
-    print(f"\n✅ 수집 완료: 업계 기사 {len(result['articles'])}건, 학술 논문 {len(result['papers'])}건")
+    print(f"\n✅ 수집 완료: 업계 기사 {len(result['articles'])}건, 학술 논문 {len(result['papers'])}건 "
+          f"(신규/변경 {len(result['new_items'])}건)")
@@ -13,6 +13,7 @@ from datetime import datetime
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 REPORTS_DIR = PROJECT_ROOT / "reports"
+CACHE_DIR = PROJECT_ROOT / "cache"
 
 def get_today_str():
     """오늘 날짜 문자열 반환 (YYYY-MM-DD)"""
@@ -48,12 +49,63 @@ RSS_FEEDS = {
     "아주경제(광고)": "https://www.ajunews.com/rss/040106",
 }
 
+# RSS 동시 수집 설정
+RSS_MAX_WORKERS = 8        # 동시에 가져올 최대 피드 수
+RSS_PER_HOST_LIMIT = 2     # 같은 호스트에 대한 최대 동시 연결 수
+RSS_FETCH_TIMEOUT = 15     # 피드당 요청 타임아웃 (초)
+RSS_TOTAL_TIMEOUT = 60     # RSS 수집 단계 전체 제한 시간 (초)
+RSS_STREAM_CHUNK_SIZE = 16 * 1024  # 스트리밍 파싱 청크 크기 (바이트)
+RSS_EARLY_STOP_AFTER = 3   # cutoff 이전 엔트리가 연속 N건이면 읽기 중단
+FEED_CACHE_PATH = CACHE_DIR / "feeds.sqlite3"  # ETag/Last-Modified + 파싱된 엔트리
+
+# ──────────────────────────────────────────────
+# 기사 전문 수집 (보고서 생성 단계)
+# ──────────────────────────────────────────────
+FULLTEXT_MAX_WORKERS = 8       # 동시에 가져올 최대 기사 수
+FULLTEXT_PER_HOST_LIMIT = 2    # 같은 호스트에 대한 최대 동시 연결 수
+FULLTEXT_TIMEOUT = 20          # 기사당 요청 타임아웃 (초)
+FULLTEXT_TOTAL_TIMEOUT = 60    # 전문 수집 전체 시간 예산 (초)
+FULLTEXT_CACHE_PATH = CACHE_DIR / "fulltext.sqlite3"  # URL별 정제 본문 + 검증자
+FULLTEXT_CACHE_TTL = 3 * 24 * 3600          # 이 시간 안에는 재요청 없이 캐시 사용 (초)
+FULLTEXT_CACHE_MAX_BYTES = 50 * 1024 * 1024  # 캐시 전체 크기 상한 (LRU 삭제)
+
+# 보고서 생성 파이프라인: 본문 수집 → LLM 요약을 단계별로 겹쳐 실행
+PIPELINE_QUEUE_SIZE = 8     # 단계 사이 대기 큐 크기
+PIPELINE_BATCH_WAIT = 2.0   # 요약 배치를 채우기 위해 기다릴 최대 시간 (초)
+# 항목별 본문·요약·번역 제목 기록 (날짜 데이터 디렉토리). 중단 후 다시 실행하면 이어서 처리
+REPORT_CHECKPOINT_FILENAME = "report_checkpoint.jsonl"
+
 # ──────────────────────────────────────────────
 # AI 분석 API 키 (택 1, 환경 변수)
 # ──────────────────────────────────────────────
 GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "")
+CLAUDE_API_KEY = os.environ.get("CLAUDE_API_KEY", "")
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "")
 
+# LLM 요약 캐시: 같은 본문·프롬프트·모델이면 API를 다시 호출하지 않음
+SUMMARY_CACHE_PATH = CACHE_DIR / "summaries.sqlite3"
+SUMMARY_CACHE_MAX_BYTES = 20 * 1024 * 1024  # 캐시 전체 크기 상한 (LRU 삭제)
+
+# 배치 요약: 여러 기사를 한 번의 요청으로 요약 (1이면 기사별 단건 요청)
+LLM_BATCH_SIZE = 5
+
+# LLM 제공자 (폴백 순서). rpm: 분당 요청 한도, concurrency: 동시 요청 수
+# 429 응답을 받으면 해당 제공자의 속도를 자동으로 낮추고 다음 제공자로 넘김
+LLM_PROVIDERS = [
+    {"name": "gemini", "model": "gemini-2.5-flash", "rpm": 5, "concurrency": 2},
+    {"name": "claude", "model": "claude-3-5-sonnet-20241022", "rpm": 50, "concurrency": 4},
+    {"name": "openai", "model": "gpt-3.5-turbo", "rpm": 60, "concurrency": 4},
+]
+LLM_MAX_WAIT = 300  # 모든 제공자가 포화일 때 요청 하나가 기다릴 최대 시간 (초)
+
+# ──────────────────────────────────────────────
+# 번역 (Google 번역, deep-translator)
+# ──────────────────────────────────────────────
+TRANSLATION_CACHE_PATH = CACHE_DIR / "translations.sqlite3"  # 원문 → 한국어 번역
+TRANSLATION_CACHE_MAX_BYTES = 20 * 1024 * 1024  # 캐시 전체 크기 상한 (LRU 삭제)
+TRANSLATION_MEMO_SIZE = 2048    # 실행 중 메모리에 보관할 번역 수 (LRU)
+TRANSLATION_BATCH_CHARS = 4500  # 배치 번역 요청 하나에 넣을 최대 글자 수
+
 # ──────────────────────────────────────────────
 # 학술 검색 키워드
 # ──────────────────────────────────────────────
@@ -74,9 +126,40 @@ SEARCH_KEYWORDS = [
 SEMANTIC_SCHOLAR_API = "https://api.semanticscholar.org/graph/v1/paper/search"
 SEMANTIC_SCHOLAR_FIELDS = "title,authors,abstract,url,year,citationCount,publicationDate,externalIds"
 SEMANTIC_SCHOLAR_LIMIT = 10  # 키워드당 최대 결과 수
+SEMANTIC_SCHOLAR_BATCH_API = "https://api.semanticscholar.org/graph/v1/paper/batch"
+SEMANTIC_SCHOLAR_BATCH_SIZE = 500  # 배치 엔드포인트 요청당 최대 id 수
+SEMANTIC_SCHOLAR_API_KEY = os.environ.get("SEMANTIC_SCHOLAR_API_KEY", "")
+SEMANTIC_SCHOLAR_RPS = 1.0  # 초당 요청 수 (토큰 버킷)
+SEMANTIC_SCHOLAR_MAX_WORKERS = 4
+SEMANTIC_SCHOLAR_MAX_RETRIES = 4  # 429/5xx 재시도 횟수 (Retry-After 우선)
+SEMANTIC_SCHOLAR_TIMEOUT = 120  # 소스 전체 제한 시간 (초)
 
 # arXiv 설정
 ARXIV_MAX_RESULTS = 10  # 키워드당 최대 결과 수
+ARXIV_SEARCH_QUERIES = [  # 하나의 OR 쿼리로 결합되어 검색됨
+    "advertising media",
+    "digital advertising",
+    "ad technology",
+    "programmatic advertising",
+    "social media marketing",
+]
+ARXIV_TIMEOUT = 90  # 소스 전체 제한 시간 (초)
+
+# 소스 실패(예외) 시 재시도 횟수
+SOURCE_RETRIES = 1
+
+# ──────────────────────────────────────────────
+# 수집 항목 저장소 (신규/변경 판별, 기간 누적)
+# ──────────────────────────────────────────────
+ITEM_STORE_PATH = DATA_DIR / "items.sqlite3"
+ITEM_STORE_KEEP_DAYS = 90  # 이 기간 동안 다시 수집되지 않은 항목은 삭제
+TREND_INDEX_PATH = DATA_DIR / "trend_index.sqlite3"  # 날짜 디렉토리 전체 누적 인덱스 (FTS5)
+
+# ──────────────────────────────────────────────
+# 실행 계측 (run_daily.py, metrics.py)
+# ──────────────────────────────────────────────
+# 실행마다 구간 시간·카운터를 그날 데이터 디렉토리에 JSON으로 저장
+METRICS_FILENAME = "metrics.json"
 
 # ──────────────────────────────────────────────
 # 이메일 설정
@@ -106,6 +189,27 @@ TREND_CATEGORIES = {
     "기타": [],
 }
 
+# ──────────────────────────────────────────────
+# 관련도 점수 키워드 (기사/논문 선별용)
+# ──────────────────────────────────────────────
+# 키워드는 단어 단위로 매칭 (복수형 s/es 허용). 끝에 *를 붙이면 접두어 매칭 (advertis* → advertising)
+RELEVANCE_KEYWORDS = [
+    "advertis*", "marketing", "media", "campaign", "brand", "consumer",
+    "digital", "tech*", "data", "platform", "content", "strategy", "research", "study", "analysis",
+]
+RELEVANCE_AI_KEYWORDS = ["ai", "gpt", "chatgpt", "generative"]  # 하나라도 있으면 가산점
+
+# ──────────────────────────────────────────────
+# 의미 기반 분류 (선택: numpy + sentence-transformers 설치 시)
+# ──────────────────────────────────────────────
+# 켜면 키워드 분류 대신 임베딩과 카테고리 중심 벡터의 코사인 유사도로 분류
+# (유사도가 기준 미만이면 키워드 분류 결과 유지). 바꾼 뒤에는 trend_index.py rebuild 권장
+SEMANTIC_CATEGORIZER = os.environ.get("SEMANTIC_CATEGORIZER", "") == "1"
+SEMANTIC_MODEL = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"  # CPU용 소형 다국어 모델
+SEMANTIC_MIN_SIMILARITY = 0.35  # 이 값 미만이면 키워드 분류 결과 사용
+SEMANTIC_BATCH_SIZE = 64        # 임베딩 계산 배치 크기
+EMBEDDING_CACHE_PATH = CACHE_DIR / "embeddings.sqlite3"  # 텍스트 해시 → 임베딩 벡터
+
 # ──────────────────────────────────────────────
 # 기사/논문 필터링 키워드 (미디어/매체 관련)
 # ──────────────────────────────────────────────
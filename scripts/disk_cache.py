@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+디스크 캐시 (SQLite 기반 key-value 저장소)
+- 값은 JSON으로 직렬화하여 저장
+- 여러 스레드에서 동시에 사용할 수 있음
+- 선택: 유효 기간(ttl) 및 전체 크기 제한(max_bytes, LRU 방식 삭제)
+- 조회 결과는 cache.<파일 이름>.hit / .miss 카운터로 기록 (metrics)
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from metrics import incr
+
+
+class DiskCache:
+    """
+    JSON 값을 저장하는 간단한 영속 캐시
+
+    Args:
+        path: SQLite 파일 경로
+        ttl: 값의 유효 기간 (초). None이면 만료 없음
+        max_bytes: 저장 값 전체 크기 상한. 넘으면 가장 오래 사용하지 않은 항목부터 삭제
+    """
+
+    def __init__(self, path, ttl=None, max_bytes=None):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._metric = f"cache.{self.path.stem}"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " updated_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key, default=None, include_expired=False):
+        """
+        값을 반환합니다. ttl이 지난 값은 default를 반환합니다
+        (include_expired=True이면 재검증용으로 만료된 값도 반환).
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, updated_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                incr(f"{self._metric}.miss")
+                return default
+            if self.ttl is not None and not include_expired and time.time() - row[1] > self.ttl:
+                incr(f"{self._metric}.miss")
+                return default
+            incr(f"{self._metric}.hit")
+            self._conn.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+        return json.loads(row[0])
+
+    def set(self, key, value):
+        data = json.dumps(value, ensure_ascii=False)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, updated_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, data, now, now),
+            )
+            if self.max_bytes is not None:
+                self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        total = self._conn.execute("SELECT COALESCE(SUM(LENGTH(value)), 0) FROM cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT key, LENGTH(value) FROM cache ORDER BY accessed_at ASC"
+        ).fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            total -= size
+
+    def delete(self, key):
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""
+기사 HTML 본문 추출 엔진
+- selectolax(설치 시) > BeautifulSoup+lxml(설치 시) > BeautifulSoup+html.parser 순으로 사용
+- 도메인별 추출 규칙: 알려진 매체는 본문 컨테이너를 바로 선택
+- 잡음 문구 정규식은 하나의 alternation으로 미리 컴파일
+"""
+
+import re
+from urllib.parse import urlparse
+
+try:
+    from selectolax.parser import HTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml  # noqa: F401  (BeautifulSoup 파서 백엔드)
+    BS4_PARSER = "lxml"
+except ImportError:
+    BS4_PARSER = "html.parser"
+
+# 본문과 무관한 태그
+STRIP_TAGS = ["script", "style", "nav", "footer", "header",
+              "aside", "iframe", "noscript", "form", "svg", "button"]
+
+# 도메인 규칙이 없거나 실패했을 때 순서대로 시도할 본문 선택자
+GENERIC_SELECTORS = [
+    ".article-content", ".post-content", ".entry-content",
+    ".story-body", ".article-body", ".content-body",
+    '[itemprop="articleBody"]', ".article__body",
+    "#article-body", ".node-body", ".wysiwyg",
+]
+
+# 도메인별 본문 선택자 (먼저 시도)
+DOMAIN_RULES = {
+    "adage.com": [".article-body", '[itemprop="articleBody"]'],
+    "adweek.com": [".article-content", ".entry-content"],
+    "digiday.com": [".article-content", ".entry-content"],
+    "marketingdive.com": [".article-body", ".large.medium-10.columns"],
+    "thedrum.com": [".article-body", ".article__body"],
+    "mediapost.com": ["#article-body", ".article-body"],
+    "madtimes.org": ["#article-view-content-div"],
+    "bloter.net": ["#article-view-content-div", ".article-body"],
+    "mobiinside.co.kr": [".entry-content"],
+    "ajunews.com": ["#articleBody", ".article_con"],
+}
+
+MIN_BODY_CHARS = 500
+MAX_BODY_CHARS = 4000
+
+# ── 잡음 텍스트 필터링 ──
+NOISE_PATTERNS = [
+    r'subscribe.*?newsletter',
+    r'sign up for.*?email',
+    r'get your.*?ticket',
+    r'secure your spot.*?summit',
+    r'digiday media buying summit.*?\.',
+    r'subscribe to continue reading',
+    r'subscription only',
+    r'become a member',
+    r'already a subscriber',
+    r'read more about.*?membership',
+    r'all rights reserved',
+    r'copyright \d{4}',
+    r'advertisement',
+    r'follow us on',
+    # AdAge/Digiday 특정 문구
+    r'answers to common questions brands might have about the nation.*?s semiquincentennial',
+    r'play them all',
+    r'future of marketing briefing',
+    r'latest marketing briefing',
+]
+NOISE_RE = re.compile("|".join(f"(?:{p})" for p in NOISE_PATTERNS), re.IGNORECASE)
+
+SKIP_LINE_PREFIXES = ('author:', 'by:', 'written by:', 'published:', 'source:')
+SKIP_LINE_PHRASES = ("digiday media buying summit", "answers to common questions brands might have")
+
+
+def _selectors_for(url):
+    """url에 맞는 본문 후보 선택자 목록 (도메인 규칙 → <article> → 공통 선택자)"""
+    host = urlparse(url or "").netloc.lower()
+    for domain, selectors in DOMAIN_RULES.items():
+        if host == domain or host.endswith("." + domain):
+            return selectors + ["article"] + [s for s in GENERIC_SELECTORS if s not in selectors]
+    return ["article"] + GENERIC_SELECTORS
+
+
+def _extract_selectolax(html, selectors):
+    tree = HTMLParser(html)
+    tree.strip_tags(STRIP_TAGS)
+
+    body_text = ""
+    for selector in selectors:
+        el = tree.css_first(selector)
+        if el is not None:
+            body_text = el.text(separator="\n", strip=True)
+            if len(body_text) > MIN_BODY_CHARS: break
+
+    if len(body_text) < MIN_BODY_CHARS:
+        texts = (p.text(strip=True) for p in tree.css("p"))
+        body_text = "\n".join(t for t in texts if len(t) > 40)
+    return body_text
+
+
+def _extract_bs4(html, selectors):
+    soup = BeautifulSoup(html, BS4_PARSER)
+    for tag in soup.find_all(STRIP_TAGS):
+        tag.decompose()
+
+    body_text = ""
+    for selector in selectors:
+        el = soup.select_one(selector)
+        if el:
+            body_text = el.get_text(separator="\n", strip=True)
+            if len(body_text) > MIN_BODY_CHARS: break
+
+    if len(body_text) < MIN_BODY_CHARS:
+        texts = (p.get_text(strip=True) for p in soup.find_all("p"))
+        body_text = "\n".join(t for t in texts if len(t) > 40)
+    return body_text
+
+
+def clean_body_text(body_text):
+    """잡음 문구와 짧은/메타 줄을 제거하고 문단 단위로 다시 합칩니다."""
+    body_text = NOISE_RE.sub('', body_text)
+
+    clean_lines = []
+    for line in body_text.split('\n'):
+        line_strip = line.strip()
+        if len(line_strip) < 30: continue
+        lower = line_strip.lower()
+        if lower.startswith(SKIP_LINE_PREFIXES): continue
+        # 특정 반복 문구 제거
+        if any(phrase in lower for phrase in SKIP_LINE_PHRASES): continue
+        clean_lines.append(line_strip)
+
+    return '\n\n'.join(clean_lines)[:MAX_BODY_CHARS]
+
+
+def extract_article_text(html, url=None):
+    """
+    HTML에서 기사 본문을 추출합니다.
+    url이 DOMAIN_RULES의 매체이면 해당 선택자를 <article>보다 먼저 시도합니다.
+    """
+    selectors = _selectors_for(url)
+    if HAS_SELECTOLAX:
+        body_text = _extract_selectolax(html, selectors)
+    else:
+        body_text = _extract_bs4(html, selectors)
+    return clean_body_text(body_text)
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+HTTP 공통 유틸리티
+- 브라우저 User-Agent 헤더
+- 호스트별 동시 연결 수 제한
+- 토큰 버킷 요청 속도 제한
+- 연결 풀을 공유하는 requests.Session
+- Retry-After를 따르는 지수 백오프 재시도
+"""
+
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from metrics import incr
+
+logger = logging.getLogger(__name__)
+
+# 재시도 대상 HTTP 상태 코드
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# 봇 차단을 피하기 위한 브라우저 헤더
+BROWSER_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                  "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+}
+
+
+class HostLimiter:
+    """호스트(도메인)별로 동시에 열 수 있는 요청 수를 제한합니다."""
+
+    def __init__(self, per_host=2):
+        self.per_host = per_host
+        self._lock = threading.Lock()
+        self._semaphores = {}
+
+    def _semaphore(self, url):
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            sem = self._semaphores.get(host)
+            if sem is None:
+                sem = threading.BoundedSemaphore(self.per_host)
+                self._semaphores[host] = sem
+            return sem
+
+    @contextmanager
+    def slot(self, url):
+        """url의 호스트에 대한 슬롯을 확보한 동안 블록을 실행합니다."""
+        sem = self._semaphore(url)
+        with sem:
+            yield
+
+
+class TokenBucket:
+    """
+    토큰 버킷 방식의 요청 속도 제한기 (스레드 안전).
+    rate: 초당 토큰 보충 속도, capacity: 최대 버스트 크기
+    """
+
+    def __init__(self, rate, capacity=1):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens=1):
+        """토큰을 얻을 때까지 대기합니다."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait_time = (tokens - self._tokens) / self.rate
+            time.sleep(wait_time)
+
+    def try_acquire(self, tokens=1):
+        """토큰이 있으면 바로 차감하고 True, 없으면 기다리지 않고 False를 반환합니다."""
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def time_until_available(self, tokens=1):
+        """토큰을 얻을 수 있을 때까지 남은 시간 (초)"""
+        with self._lock:
+            self._refill()
+            return max(0.0, (tokens - self._tokens) / self.rate)
+
+
+def make_session(pool_size=10, headers=None):
+    """연결 풀 크기를 지정한 requests.Session을 생성합니다."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+def parse_retry_after(value):
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 초로 변환합니다."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def request_with_backoff(session, method, url, bucket=None, max_retries=4,
+                         base_delay=1.0, max_delay=60.0, **kwargs):
+    """
+    429/5xx 응답이나 연결 오류 시 지수 백오프로 재시도합니다.
+    Retry-After 헤더가 있으면 그 값을 우선합니다.
+    bucket(TokenBucket)이 주어지면 매 시도 전에 토큰을 얻습니다.
+
+    Returns:
+        requests.Response: 마지막 응답 (재시도 소진 시 실패 응답 그대로)
+    """
+    for attempt in range(max_retries + 1):
+        if bucket is not None:
+            bucket.acquire()
+
+        incr("http.calls")
+        if attempt:
+            incr("http.retries")
+        try:
+            resp = session.request(method, url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            incr("http.errors")
+            if attempt >= max_retries:
+                raise
+            delay = min(max_delay, base_delay * 2 ** attempt) * (1 + random.random() * 0.25)
+            logger.warning(f"[HTTP] 연결 오류, {delay:.1f}초 후 재시도 ({attempt + 1}/{max_retries}): {e}")
+            time.sleep(delay)
+            continue
+
+        if not kwargs.get("stream"):
+            incr("http.bytes", len(resp.content))
+        if resp.status_code not in RETRY_STATUS_CODES or attempt >= max_retries:
+            return resp
+
+        delay = parse_retry_after(resp.headers.get("Retry-After"))
+        if delay is None:
+            delay = min(max_delay, base_delay * 2 ** attempt) * (1 + random.random() * 0.25)
+        delay = min(delay, max_delay)
+        logger.warning(f"[HTTP] {resp.status_code} 응답, {delay:.1f}초 후 재시도 ({attempt + 1}/{max_retries})")
+        time.sleep(delay)
+
+    return resp
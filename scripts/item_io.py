@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+일별 수집 항목 파일 입출력
+- 한 줄에 항목 하나인 압축 JSON Lines 파일 하나로 저장
+  (zstandard 설치 시 .jsonl.zst, 아니면 .jsonl.gz)
+- 스트리밍 읽기 + 필드(column) 선택 + 유형 필터
+- 이전 형식(raw_articles.json / raw_papers.json)도 읽기 지원
+"""
+
+import gzip
+import json
+from pathlib import Path
+
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+ITEMS_BASENAME = "items.jsonl"
+LEGACY_FILES = ("raw_articles.json", "raw_papers.json")
+
+
+def _open_text(path, mode):
+    path = Path(path)
+    if path.suffix == ".zst":
+        if not HAS_ZSTD:
+            raise RuntimeError(f"zstandard 미설치: {path} 를 읽을 수 없습니다")
+        return zstandard.open(path, mode, encoding="utf-8")
+    if path.suffix == ".gz":
+        return gzip.open(path, mode, encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def items_path(data_dir):
+    """data_dir에 있는 항목 파일 경로 (없으면 새로 쓸 경로)"""
+    data_dir = Path(data_dir)
+    for suffix in (".zst", ".gz", ""):
+        path = data_dir / f"{ITEMS_BASENAME}{suffix}"
+        if path.exists():
+            return path
+    return data_dir / f"{ITEMS_BASENAME}{'.zst' if HAS_ZSTD else '.gz'}"
+
+
+def write_items(data_dir, items):
+    """항목 목록을 data_dir의 압축 JSON Lines 파일로 저장하고 경로를 반환합니다."""
+    data_dir = Path(data_dir)
+    path = data_dir / f"{ITEMS_BASENAME}{'.zst' if HAS_ZSTD else '.gz'}"
+    tmp_path = path.with_name(path.name + ".tmp" + path.suffix)
+    with _open_text(tmp_path, "wt") as f:
+        for item in items:
+            f.write(json.dumps(item, ensure_ascii=False, separators=(",", ":")))
+            f.write("\n")
+    tmp_path.replace(path)
+
+    # 다른 압축 형식의 이전 파일은 제거 (한 디렉토리에 항목 파일은 하나)
+    for suffix in (".zst", ".gz", ""):
+        other = data_dir / f"{ITEMS_BASENAME}{suffix}"
+        if other != path and other.exists():
+            other.unlink()
+    return path
+
+
+def iter_items(data_dir, columns=None, item_type=None):
+    """
+    data_dir의 항목을 한 건씩 읽습니다.
+
+    Args:
+        columns: 가져올 필드 목록 (None이면 전체)
+        item_type: "industry" / "academic" 중 하나만 읽을 때 지정
+
+    Yields:
+        dict: 항목 (columns 지정 시 해당 필드만)
+    """
+    path = items_path(data_dir)
+    if path.exists():
+        with _open_text(path, "rt") as f:
+            rows = (json.loads(line) for line in f if line.strip())
+            yield from _select(rows, columns, item_type)
+        return
+
+    # 이전 형식 (raw_articles.json + raw_papers.json)
+    for name in LEGACY_FILES:
+        legacy = Path(data_dir) / name
+        if legacy.exists():
+            with open(legacy, "r", encoding="utf-8") as f:
+                yield from _select(json.load(f), columns, item_type)
+
+
+def _select(rows, columns, item_type):
+    for row in rows:
+        if item_type and row.get("type") != item_type:
+            continue
+        if columns:
+            row = {col: row.get(col) for col in columns}
+        yield row
+
+
+def load_items(data_dir, columns=None, item_type=None):
+    """iter_items 결과를 리스트로 반환합니다."""
+    return list(iter_items(data_dir, columns=columns, item_type=item_type))
+
+
+def has_items(data_dir):
+    """data_dir에 읽을 수 있는 항목 파일이 있는지 여부"""
+    data_dir = Path(data_dir)
+    return items_path(data_dir).exists() or any((data_dir / name).exists() for name in LEGACY_FILES)
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+수집 항목 저장소 (SQLite)
+- 정규화된 URL / DOI / arXiv ID를 키로 항목을 영속 저장
+- 매 수집마다 신규/변경 항목을 판별
+- 기간(rolling window) 기준으로 항목을 조회
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 추적용 쿼리 파라미터 (URL 정규화 시 제거)
+TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "ref", "cmpid", "ncid", "sr_share"}
+
+ARXIV_ID_RE = re.compile(r"arxiv\.org/(?:abs|pdf)/([^?#\s]+?)(?:v\d+)?(?:\.pdf)?$", re.IGNORECASE)
+
+STATUS_NEW = "new"
+STATUS_CHANGED = "changed"
+STATUS_UNCHANGED = "unchanged"
+
+
+def normalize_url(url):
+    """비교용 URL 정규화 (스킴/www/추적 파라미터/프래그먼트/끝 슬래시 제거)"""
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = [
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS
+    ]
+    path = parts.path.rstrip("/")
+    return urlunsplit(("", host, path, urlencode(query), "")).lstrip("/")
+
+
+def item_key(item):
+    """
+    항목의 고유 키를 반환합니다.
+    우선순위: DOI > arXiv ID > 정규화 URL > 제목
+    """
+    doi = (item.get("doi") or "").strip().lower()
+    if doi:
+        return f"doi:{doi}"
+
+    arxiv_id = (item.get("arxiv_id") or "").strip().lower()
+    url = item.get("url") or ""
+    if not arxiv_id:
+        m = ARXIV_ID_RE.search(url)
+        if m:
+            arxiv_id = m.group(1).lower()
+    if arxiv_id:
+        return f"arxiv:{arxiv_id}"
+
+    norm = normalize_url(url)
+    if norm:
+        return f"url:{norm}"
+    return "title:" + " ".join((item.get("title") or "").lower().split())
+
+
+def content_hash(item):
+    """변경 감지용 해시 (제목 + 요약)"""
+    text = f"{item.get('title', '')}\n{item.get('summary', '')}"
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class ItemStore:
+    """수집 항목을 키 단위로 저장하고 신규/변경 여부를 판별합니다."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS items ("
+            " item_key TEXT PRIMARY KEY,"
+            " type TEXT,"
+            " content_hash TEXT NOT NULL,"
+            " published_date TEXT,"
+            " first_seen TEXT NOT NULL,"
+            " last_seen TEXT NOT NULL,"
+            " data TEXT NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_items_type ON items (type)")
+        self._conn.commit()
+
+    def upsert(self, items):
+        """
+        항목들을 저장하고 각 항목의 상태(new/changed/unchanged)를 반환합니다.
+        각 항목에는 "item_id" 키가 추가됩니다.
+
+        Returns:
+            list[str]: items와 같은 순서의 상태 목록
+        """
+        now = datetime.now().isoformat(timespec="seconds")
+        statuses = []
+        for item in items:
+            key = item_key(item)
+            item["item_id"] = key
+            digest = content_hash(item)
+            row = self._conn.execute(
+                "SELECT content_hash FROM items WHERE item_key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                status = STATUS_NEW
+                self._conn.execute(
+                    "INSERT INTO items VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, item.get("type"), digest, item.get("published_date"),
+                     now, now, json.dumps(item, ensure_ascii=False)),
+                )
+            else:
+                status = STATUS_UNCHANGED if row[0] == digest else STATUS_CHANGED
+                self._conn.execute(
+                    "UPDATE items SET content_hash = ?, published_date = ?, last_seen = ?, data = ?"
+                    " WHERE item_key = ?",
+                    (digest, item.get("published_date"), now,
+                     json.dumps(item, ensure_ascii=False), key),
+                )
+            statuses.append(status)
+        self._conn.commit()
+        return statuses
+
+    def window(self, item_type, days_back, current=()):
+        """
+        기간 내 항목 목록(rolling window)을 반환합니다.
+        current(이번 수집분)를 앞에 두고, 이번에 수집되지 않았지만
+        기간 안에 있는 저장 항목을 최근 확인 순으로 뒤에 붙입니다.
+        """
+        since = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
+        current = list(current)
+        current_keys = {item.get("item_id") or item_key(item) for item in current}
+
+        rows = self._conn.execute(
+            "SELECT item_key, data FROM items"
+            " WHERE type = ? AND COALESCE(published_date, first_seen) >= ?"
+            " ORDER BY last_seen DESC",
+            (item_type, since),
+        ).fetchall()
+        carried = [json.loads(data) for key, data in rows if key not in current_keys]
+        return current + carried
+
+    def prune(self, keep_days):
+        """keep_days 동안 다시 확인되지 않은 항목을 삭제합니다."""
+        since = (datetime.now() - timedelta(days=keep_days)).isoformat(timespec="seconds")
+        cur = self._conn.execute("DELETE FROM items WHERE last_seen < ?", (since,))
+        self._conn.commit()
+        return cur.rowcount
+
+    def close(self):
+        self._conn.close()
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+간단한 언어 판별 (한글 비율 기준)
+- 글자(문자) 중 한글 음절·자모 비율이 기준 이상이면 한국어로 판단
+- 외부 라이브러리 없이 정규식만 사용 (제목·요약 수준의 짧은 텍스트용)
+"""
+
+import re
+
+HANGUL_RE = re.compile(r"[가-힣ᄀ-ᇿ㄰-㆏]")
+LATIN_RE = re.compile(r"[A-Za-z]")
+
+# 한글 비율이 이 값 이상이면 한국어 (영문 브랜드명·약어가 섞인 국내 기사 고려)
+KOREAN_RATIO = 0.4
+# 한글 음절 하나는 영문 약 3글자에 해당하는 정보량으로 계산
+HANGUL_WEIGHT = 3
+
+
+def hangul_ratio(text):
+    """문자(한글+라틴) 중 한글이 차지하는 가중 비율 (문자가 없으면 0.0)"""
+    if not text:
+        return 0.0
+    hangul = len(HANGUL_RE.findall(text)) * HANGUL_WEIGHT
+    letters = hangul + len(LATIN_RE.findall(text))
+    return hangul / letters if letters else 0.0
+
+
+def detect_language(text):
+    """'ko' | 'en' | '' (판별 불가)"""
+    if not text:
+        return ""
+    if hangul_ratio(text) >= KOREAN_RATIO:
+        return "ko"
+    return "en" if LATIN_RE.search(text) else ""
+
+
+def is_korean(text):
+    return detect_language(text) == "ko"
+
+
+def item_language(item):
+    """항목의 언어: 수집 시 기록된 lang 필드, 없으면 제목+요약으로 판별"""
+    return item.get("lang") or detect_language(
+        f"{item.get('title', '')} {(item.get('summary') or '')[:500]}"
+    )
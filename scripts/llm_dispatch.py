@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+"""
+LLM 요청 분배기
+- 제공자(Gemini/Claude/OpenAI)별 클라이언트를 한 번만 만들어 재사용
+- 제공자별 분당 요청 한도(RPM) 토큰 버킷 + 동시 요청 수 제한
+- 429 응답을 받으면 해당 제공자 속도를 낮추고(Retry-After 존중) 성공이 이어지면 서서히 복구
+- 한 제공자가 포화(한도 소진·429)이면 오류를 기다리지 않고 다음 제공자로 넘김
+"""
+
+import logging
+import threading
+import time
+
+from config import (
+    CLAUDE_API_KEY,
+    GEMINI_API_KEY,
+    LLM_MAX_WAIT,
+    LLM_PROVIDERS,
+    OPENAI_API_KEY,
+)
+from http_client import TokenBucket, parse_retry_after
+from metrics import incr, span
+
+logger = logging.getLogger(__name__)
+
+API_KEYS = {
+    "gemini": GEMINI_API_KEY,
+    "claude": CLAUDE_API_KEY,
+    "openai": OPENAI_API_KEY,
+}
+
+# 429를 연속으로 받으면 이 요청에서는 해당 제공자를 제외
+MAX_RATE_LIMIT_HITS = 3
+
+
+class RateLimitError(Exception):
+    """제공자가 요청 한도 초과(429)로 거절함"""
+
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class AdaptiveRateLimiter(TokenBucket):
+    """
+    RPM 기준 토큰 버킷. 429를 받으면 속도를 절반으로 낮추고
+    (Retry-After가 있으면 그때까지 차단), 성공할 때마다 설정값 쪽으로 조금씩 되돌립니다.
+    """
+
+    def __init__(self, rpm, burst=1, min_rpm=1):
+        super().__init__(rpm / 60.0, capacity=burst)
+        self.base_rate = rpm / 60.0
+        self.min_rate = min_rpm / 60.0
+        self._blocked_until = 0.0
+
+    def try_acquire(self, tokens=1):
+        if time.monotonic() < self._blocked_until:
+            return False
+        return super().try_acquire(tokens)
+
+    def time_until_available(self, tokens=1):
+        blocked = self._blocked_until - time.monotonic()
+        return max(blocked, super().time_until_available(tokens))
+
+    def penalize(self, retry_after=None):
+        with self._lock:
+            self._refill()
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+            pause = retry_after if retry_after is not None else 1.0 / self.rate
+            self._blocked_until = max(self._blocked_until, time.monotonic() + pause)
+
+    def reward(self):
+        with self._lock:
+            if self.rate < self.base_rate:
+                self._refill()
+                self.rate = min(self.base_rate, self.rate + self.base_rate * 0.1)
+
+
+# ──────────────────────────────────────────────
+# 제공자별 호출
+# ──────────────────────────────────────────────
+def _make_gemini(api_key):
+    from google import genai
+    return genai.Client(api_key=api_key)
+
+
+def _call_gemini(client, model, prompt, system, max_tokens):
+    response = client.models.generate_content(model=model, contents=prompt)
+    return response.text.strip()
+
+
+def _make_claude(api_key):
+    import anthropic
+    return anthropic.Anthropic(api_key=api_key)
+
+
+def _call_claude(client, model, prompt, system, max_tokens):
+    response = client.messages.create(
+        model=model,
+        max_tokens=max_tokens,
+        system=system,
+        messages=[
+            {"role": "user", "content": prompt}
+        ]
+    )
+    return response.content[0].text.strip()
+
+
+def _make_openai(api_key):
+    import openai
+    return openai.OpenAI(api_key=api_key)
+
+
+def _call_openai(client, model, prompt, system, max_tokens):
+    response = client.chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "system", "content": system},
+            {"role": "user", "content": prompt}
+        ],
+        max_tokens=max_tokens,
+        temperature=0.5
+    )
+    return response.choices[0].message.content.strip()
+
+
+PROVIDER_IMPLS = {
+    "gemini": (_make_gemini, _call_gemini),
+    "claude": (_make_claude, _call_claude),
+    "openai": (_make_openai, _call_openai),
+}
+
+
+def _rate_limit_info(error):
+    """예외가 429(요청 한도 초과)이면 (True, Retry-After 초)를 반환합니다."""
+    status = getattr(error, "status_code", None) or getattr(error, "code", None)
+    text = str(error)
+    if status != 429 and "429" not in text and "RESOURCE_EXHAUSTED" not in text:
+        return False, None
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    return True, parse_retry_after(headers.get("retry-after"))
+
+
+class Provider:
+    """LLM 제공자 하나: 재사용 클라이언트 + 속도/동시성 제한"""
+
+    def __init__(self, name, model, api_key, rpm, concurrency=1):
+        self.name = name
+        self.model = model
+        self.api_key = api_key
+        self.concurrency = concurrency
+        self.limiter = AdaptiveRateLimiter(rpm)
+        self._slots = threading.BoundedSemaphore(concurrency)
+        self._make, self._call = PROVIDER_IMPLS[name]
+        self._client = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def client(self):
+        with self._client_lock:
+            if self._client is None:
+                self._client = self._make(self.api_key)
+            return self._client
+
+    def try_reserve(self):
+        """동시 요청 자리와 RPM 토큰을 모두 얻으면 True (포화면 False)"""
+        if not self._slots.acquire(blocking=False):
+            return False
+        if not self.limiter.try_acquire():
+            self._slots.release()
+            return False
+        return True
+
+    def call(self, prompt, system, max_tokens):
+        """try_reserve()로 자리를 얻은 뒤 호출합니다. 429이면 RateLimitError를 던집니다."""
+        incr(f"llm.{self.name}.calls")
+        try:
+            with span(f"llm.{self.name}.call"):
+                text = self._call(self.client, self.model, prompt, system, max_tokens)
+        except Exception as e:
+            limited, retry_after = _rate_limit_info(e)
+            if limited:
+                incr(f"llm.{self.name}.rate_limited")
+                self.limiter.penalize(retry_after)
+                raise RateLimitError(str(e), retry_after) from e
+            raise
+        finally:
+            self._slots.release()
+        self.limiter.reward()
+        return text
+
+
+class LLMDispatcher:
+    """여러 제공자에 요청을 분배합니다 (스레드 안전)."""
+
+    def __init__(self, providers, max_wait=LLM_MAX_WAIT):
+        self.providers = providers
+        self.max_wait = max_wait
+
+    @property
+    def max_workers(self):
+        """모든 제공자의 동시 요청 수 합 (요청 스레드 풀 크기로 사용)"""
+        return max(1, sum(p.concurrency for p in self.providers))
+
+    def models(self):
+        """사용 가능한 (제공자, 모델) 목록 (폴백 순서)"""
+        return [(p.name, p.model) for p in self.providers]
+
+    def complete(self, prompt, system="", max_tokens=300, validate=None):
+        """
+        프롬프트를 처리할 수 있는 첫 제공자에게 보냅니다.
+        포화된 제공자는 건너뛰고, 모두 포화이면 가장 먼저 풀리는 시점까지 기다립니다.
+
+        Args:
+            validate: 응답 텍스트를 검사해 결과를 반환하는 함수 (선택).
+                      falsy를 반환하면 다음 제공자로 넘어갑니다.
+
+        Returns:
+            (모델, 결과) 튜플. 모든 제공자가 실패하면 None
+        """
+        failed = set()
+        rate_limit_hits = {}
+        deadline = time.monotonic() + self.max_wait
+
+        while True:
+            candidates = [p for p in self.providers if p.name not in failed]
+            if not candidates:
+                return None
+
+            provider = next((p for p in candidates if p.try_reserve()), None)
+            if provider is None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.warning("[LLM] 모든 제공자가 포화 상태, 대기 시간 초과")
+                    return None
+                wait_time = min(p.limiter.time_until_available() for p in candidates)
+                with span("llm.wait"):
+                    time.sleep(min(remaining, max(wait_time, 0.05)))
+                continue
+
+            try:
+                text = provider.call(prompt, system, max_tokens)
+            except RateLimitError as e:
+                hits = rate_limit_hits.get(provider.name, 0) + 1
+                rate_limit_hits[provider.name] = hits
+                logger.warning(f"[LLM] {provider.name} 429, 속도 조정 후 다른 제공자로 넘김 ({hits}회): {e}")
+                if hits >= MAX_RATE_LIMIT_HITS:
+                    failed.add(provider.name)
+                continue
+            except Exception as e:
+                logger.warning(f"⚠️ {provider.name} 요청 실패, 다음 LLM으로 전환 시도: {e}")
+                failed.add(provider.name)
+                continue
+
+            result = validate(text) if validate else text
+            if not result:
+                logger.warning(f"⚠️ {provider.name} 응답 형식 오류, 다음 LLM으로 전환 시도")
+                failed.add(provider.name)
+                continue
+            return provider.model, result
+
+
+def build_dispatcher(provider_configs=LLM_PROVIDERS, api_keys=None):
+    """API 키가 설정된 제공자만으로 분배기를 만듭니다."""
+    api_keys = API_KEYS if api_keys is None else api_keys
+    providers = []
+    for cfg in provider_configs:
+        api_key = api_keys.get(cfg["name"])
+        if not api_key:
+            continue
+        if cfg["name"] == "gemini":
+            try:
+                from google import genai  # noqa: F401
+            except ImportError:
+                logger.warning("google-genai 미설치, Gemini 제외")
+                continue
+        providers.append(Provider(
+            cfg["name"], cfg["model"], api_key, cfg["rpm"], cfg.get("concurrency", 1)
+        ))
+    return LLMDispatcher(providers)
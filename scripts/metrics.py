@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+실행 계측 (구간 시간 + 카운터)
+- span("이름"): with 블록의 소요 시간을 이름별로 누적 (횟수/합계/최대)
+- @timed("이름"): 함수 호출 시간을 같은 방식으로 누적
+- incr("이름", n): HTTP 호출 수, 바이트 수, 캐시 적중, 재시도 등 카운터
+- 실행이 끝나면 JSON 파일로 저장하고, --profile 옵션이면 요약 표를 출력
+여러 스레드에서 동시에 기록할 수 있으며, 병렬 구간의 합계는 스레드 시간의 합입니다.
+"""
+
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+
+class Metrics:
+    """구간 시간과 카운터를 모으는 저장소 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._timers = {}    # 이름 → [횟수, 합계, 최대]
+            self._counters = {}  # 이름 → 값
+            self._started = time.monotonic()
+            self._started_at = datetime.now().isoformat(timespec="seconds")
+
+    def record(self, name, seconds):
+        with self._lock:
+            timer = self._timers.get(name)
+            if timer is None:
+                self._timers[name] = [1, seconds, seconds]
+            else:
+                timer[0] += 1
+                timer[1] += seconds
+                timer[2] = max(timer[2], seconds)
+
+    def incr(self, name, value=1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    @contextmanager
+    def span(self, name):
+        """블록 실행 시간을 name으로 기록합니다 (예외가 나도 기록)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def timed(self, name):
+        """함수 호출 시간을 name으로 기록하는 데코레이터"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def count_bytes(self, chunks, name="http.bytes"):
+        """바이트 청크 이터레이터를 그대로 넘기면서 크기를 name 카운터에 더합니다."""
+        for chunk in chunks:
+            self.incr(name, len(chunk))
+            yield chunk
+
+    def snapshot(self):
+        """
+        Returns:
+            dict: {"started_at", "elapsed", "timers": {이름: {count, total, mean, max}}, "counters": {...}}
+        """
+        with self._lock:
+            timers = {
+                name: {
+                    "count": count,
+                    "total": round(total, 4),
+                    "mean": round(total / count, 4),
+                    "max": round(longest, 4),
+                }
+                for name, (count, total, longest) in sorted(self._timers.items())
+            }
+            return {
+                "started_at": self._started_at,
+                "elapsed": round(time.monotonic() - self._started, 3),
+                "timers": timers,
+                "counters": dict(sorted(self._counters.items())),
+            }
+
+    def write(self, path, **extra):
+        """스냅샷(+ extra 필드)을 JSON으로 저장하고 경로를 반환합니다."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = self.snapshot()
+        data.update(extra)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        return path
+
+    def format_table(self):
+        """구간 시간(합계 내림차순)과 카운터를 사람이 읽을 표 문자열로 만듭니다."""
+        data = self.snapshot()
+        lines = [f"{'구간':<32} {'횟수':>6} {'합계(s)':>10} {'평균(s)':>10} {'최대(s)':>10}"]
+        lines.append("-" * len(lines[0]))
+        timers = sorted(data["timers"].items(), key=lambda kv: -kv[1]["total"])
+        for name, t in timers:
+            lines.append(f"{name:<32} {t['count']:>6} {t['total']:>10.3f} {t['mean']:>10.3f} {t['max']:>10.3f}")
+        if data["counters"]:
+            lines.append("")
+            lines.append(f"{'카운터':<32} {'값':>10}")
+            lines.append("-" * 43)
+            for name, value in data["counters"].items():
+                lines.append(f"{name:<32} {value:>10}")
+        lines.append("")
+        lines.append(f"전체 실행 시간: {data['elapsed']:.1f}초 (병렬 구간의 합계는 스레드 시간의 합)")
+        return "\n".join(lines)
+
+
+# 실행 전체에서 공유하는 기본 저장소
+METRICS = Metrics()
+span = METRICS.span
+timed = METRICS.timed
+incr = METRICS.incr
+record = METRICS.record
+count_bytes = METRICS.count_bytes
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+유사 중복 제거 (MinHash LSH)
+- 제목 + 요약 앞부분의 단어 shingle로 MinHash 서명 생성
+- LSH 밴딩으로 후보 쌍만 찾아 실제 Jaccard 유사도로 확인 (전체 쌍 비교 없음)
+- 같은 클러스터에서는 정보가 가장 많은 항목 하나만 남김
+"""
+
+import hashlib
+import random
+import re
+
+NUM_PERM = 64          # MinHash 해시 함수 수
+NUM_BANDS = 16         # LSH 밴드 수 (밴드당 NUM_PERM // NUM_BANDS 행)
+SHINGLE_SIZE = 3       # 단어 n-gram 크기
+SUMMARY_CHARS = 400    # shingle에 사용할 요약 앞부분 길이
+JACCARD_THRESHOLD = 0.6
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(20240601)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERM)
+]
+
+WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def shingles(item):
+    """항목의 단어 shingle 집합 (해시값)"""
+    text = f"{item.get('title', '')} {(item.get('summary') or '')[:SUMMARY_CHARS]}".lower()
+    words = WORD_RE.findall(text)
+    if len(words) < SHINGLE_SIZE:
+        grams = [" ".join(words)] if words else []
+    else:
+        grams = [" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)]
+    return {
+        int.from_bytes(hashlib.blake2b(g.encode("utf-8"), digest_size=8).digest(), "big")
+        for g in grams
+    }
+
+
+def minhash(shingle_set):
+    """shingle 집합의 MinHash 서명"""
+    return [
+        min((a * h + b) % _MERSENNE_PRIME for h in shingle_set)
+        for a, b in _PERMUTATIONS
+    ]
+
+
+def jaccard(a, b):
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def _quality(item):
+    """대표 항목 선정 기준: 요약 길이 > 인용 수"""
+    return (len(item.get("summary") or ""), item.get("citations") or 0)
+
+
+def remove_near_duplicates(items, threshold=JACCARD_THRESHOLD):
+    """
+    유사 중복 항목을 클러스터로 묶고 클러스터마다 대표 항목 하나만 남깁니다.
+    대표 항목은 클러스터의 첫 항목 위치에 놓이며, 나머지 항목의 출처는
+    "also_in" 목록에 기록됩니다.
+
+    Returns:
+        list[dict]: 중복이 제거된 항목 목록 (입력 순서 유지)
+    """
+    rows = NUM_PERM // NUM_BANDS
+    sets = [shingles(item) for item in items]
+    parent = list(range(len(items)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    buckets = {}
+    for idx, shingle_set in enumerate(sets):
+        if not shingle_set:
+            continue
+        signature = minhash(shingle_set)
+        for band in range(NUM_BANDS):
+            key = (band, tuple(signature[band * rows:(band + 1) * rows]))
+            for other in buckets.setdefault(key, []):
+                if find(other) != find(idx) and jaccard(sets[idx], sets[other]) >= threshold:
+                    parent[find(idx)] = find(other)
+            buckets[key].append(idx)
+
+    clusters = {}
+    for idx in range(len(items)):
+        clusters.setdefault(find(idx), []).append(idx)
+
+    unique = []
+    for members in sorted(clusters.values(), key=lambda m: m[0]):
+        best = max(members, key=lambda i: (_quality(items[i]), -i))
+        item = items[best]
+        others = [
+            {"source": items[i].get("source", ""), "url": items[i].get("url", "")}
+            for i in members if i != best
+        ]
+        if others:
+            item["also_in"] = item.get("also_in", []) + others
+        unique.append(item)
+    return unique
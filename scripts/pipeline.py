@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""
+단계별 스트리밍 파이프라인 (생산자/소비자)
+- 각 단계는 여러 작업 스레드로 실행되고, 단계 사이는 크기 제한 큐로 연결
+- 앞 단계가 한 건을 끝내면 바로 다음 단계로 넘어가므로
+  전체 소요 시간이 단계별 시간의 합이 아니라 가장 느린 단계에 가까워짐
+- 배치 단계: 최대 batch_size건을 모아(또는 batch_wait초 동안 더 오지 않으면) 한 번에 처리.
+  배치는 수집 스레드 하나가 만들고 작업 스레드는 처리만 하므로, 작업 스레드가 많아도 배치가 잘게 쪼개지지 않음
+  (작업 스레드가 모두 바쁜 동안에는 다음 배치를 만들지 않아 그 사이 도착한 레코드가 한 배치로 모임)
+"""
+
+import logging
+import queue
+import threading
+import time
+
+from config import PIPELINE_BATCH_WAIT, PIPELINE_QUEUE_SIZE
+from metrics import span
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()  # 입력 끝 표시
+
+
+class Stage:
+    """
+    파이프라인 단계
+
+    Args:
+        name: 단계 이름 (로그용)
+        func: 레코드 하나(batch_size=1) 또는 레코드 목록을 받아 제자리에서 수정하는 함수
+        workers: 작업 스레드 수 (배치 단계에서는 동시에 처리할 최대 배치 수)
+        batch_size: 한 번에 처리할 최대 레코드 수
+        batch_wait: 배치를 채우기 위해 다음 레코드를 기다릴 최대 시간 (초)
+    """
+
+    def __init__(self, name, func, workers=1, batch_size=1, batch_wait=PIPELINE_BATCH_WAIT):
+        self.name = name
+        self.func = func
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+        self.batch_wait = batch_wait
+
+
+def _next_batch(stage, in_q):
+    """(레코드 목록, 입력 끝 여부). 첫 레코드는 기다리고, 이후는 batch_wait까지만 기다림"""
+    first = in_q.get()
+    if first is _DONE:
+        return [], True
+    batch = [first]
+    deadline = time.monotonic() + stage.batch_wait
+    while len(batch) < stage.batch_size:
+        remaining = deadline - time.monotonic()
+        try:
+            record = in_q.get(timeout=max(0.0, remaining)) if remaining > 0 else in_q.get_nowait()
+        except queue.Empty:
+            break
+        if record is _DONE:
+            return batch, True
+        batch.append(record)
+    return batch, False
+
+
+def _process(stage, batch, out_q):
+    try:
+        with span(f"pipeline.{stage.name}"):
+            stage.func(batch if stage.batch_size > 1 else batch[0])
+    except Exception as e:
+        # 한 레코드의 실패가 파이프라인 전체를 멈추지 않도록 그대로 다음 단계로 넘김
+        logger.warning(f"[파이프라인] {stage.name} 단계 실패 ({len(batch)}건): {e}")
+    for record in batch:
+        out_q.put(record)
+
+
+def _finish(state, out_q):
+    """작업 스레드 종료 처리. 마지막 스레드가 다음 단계에 입력 끝을 알림"""
+    with state["lock"]:
+        state["alive"] -= 1
+        last = state["alive"] == 0
+    if last:
+        out_q.put(_DONE)
+
+
+def _worker(stage, in_q, out_q, state):
+    """단건 단계 작업 스레드: 입력 큐에서 바로 꺼내 처리"""
+    while True:
+        batch, done = _next_batch(stage, in_q)
+        if batch:
+            _process(stage, batch, out_q)
+        if done:
+            in_q.put(_DONE)  # 같은 단계의 다른 작업 스레드도 끝나도록 되돌려 놓음
+            _finish(state, out_q)
+            return
+
+
+def _collector(stage, in_q, work_q, slots):
+    """배치 단계 수집 스레드: 쉬는 작업 스레드가 생기면 다음 배치를 만들어 넘김"""
+    while True:
+        slots.acquire()
+        batch, done = _next_batch(stage, in_q)
+        if batch:
+            work_q.put(batch)
+        else:
+            slots.release()
+        if done:
+            for _ in range(stage.workers):
+                work_q.put(_DONE)
+            return
+
+
+def _batch_worker(stage, work_q, out_q, state, slots):
+    """배치 단계 작업 스레드: 수집 스레드가 만든 배치만 처리"""
+    while True:
+        batch = work_q.get()
+        if batch is _DONE:
+            _finish(state, out_q)
+            return
+        _process(stage, batch, out_q)
+        slots.release()
+
+
+def run_stages(records, stages, queue_size=PIPELINE_QUEUE_SIZE):
+    """
+    레코드들을 단계 순서대로 흘려 보냅니다.
+
+    Args:
+        records: 처리할 레코드(dict) 목록. 각 단계 함수가 제자리에서 값을 채움
+        stages: Stage 목록 (앞에서부터 실행)
+        queue_size: 단계 사이 큐의 최대 크기 (앞 단계가 너무 앞서가지 않도록)
+
+    Returns:
+        list: records (모든 단계를 거친 뒤)
+    """
+    if not records or not stages:
+        return records
+
+    queues = [queue.Queue(maxsize=queue_size) for _ in range(len(stages) + 1)]
+    threads = []
+    for i, stage in enumerate(stages):
+        state = {"alive": stage.workers, "lock": threading.Lock()}
+        if stage.batch_size > 1:
+            work_q = queue.Queue()
+            slots = threading.Semaphore(stage.workers)
+            t = threading.Thread(
+                target=_collector, args=(stage, queues[i], work_q, slots),
+                name=f"{stage.name}-collect", daemon=True,
+            )
+            t.start()
+            threads.append(t)
+            target, args = _batch_worker, (stage, work_q, queues[i + 1], state, slots)
+        else:
+            target, args = _worker, (stage, queues[i], queues[i + 1], state)
+        for n in range(stage.workers):
+            t = threading.Thread(target=target, args=args, name=f"{stage.name}-{n}", daemon=True)
+            t.start()
+            threads.append(t)
+
+    def feed():
+        for record in records:
+            queues[0].put(record)
+        queues[0].put(_DONE)
+
+    threading.Thread(target=feed, name="pipeline-feed", daemon=True).start()
+
+    finished = 0
+    while queues[-1].get() is not _DONE:
+        finished += 1
+    for t in threads:
+        t.join()
+    logger.info(f"[파이프라인] {finished}/{len(records)}건 처리 완료")
+    return records
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+보고서 생성 체크포인트 (항목별 진행 기록)
+- 날짜 데이터 디렉토리에 항목별 본문·요약·번역 제목을 JSON Lines로 추가 기록
+- 보고서 생성이 중간에 실패하거나 중단되어도 다음 실행은 끝난 항목을 건너뛰고 이어서 처리
+- 한 줄 쓸 때마다 flush하므로 프로세스가 죽어도 그때까지의 기록은 남음
+  (마지막 줄이 잘려 있으면 읽을 때 무시)
+- 항목 키는 URL·제목·요약의 해시 → 다시 수집해 내용이 바뀐 항목은 새로 처리
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def checkpoint_key(item):
+    payload = "\x00".join([item.get("url", ""), item.get("title", ""), item.get("summary", "")])
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class ReportCheckpoint:
+    """
+    항목별 보고서 진행 기록 (스레드 안전).
+
+    Args:
+        path: JSON Lines 파일 경로. 한 줄은 {"key": 항목 키, 필드: 값, ...}이며
+              같은 키의 줄은 읽을 때 차례로 합쳐짐
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._records = {}
+        if self.path.exists():
+            self._load()
+        self._file = None
+
+    def _load(self):
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    key = entry.pop("key")
+                except (ValueError, KeyError, AttributeError):
+                    continue  # 중단 시 잘린 줄
+                self._records.setdefault(key, {}).update(entry)
+        logger.info(f"[체크포인트] {len(self._records)}개 항목 기록 읽음: {self.path}")
+
+    def __len__(self):
+        return len(self._records)
+
+    def get(self, item):
+        """항목의 기록된 필드 {필드: 값} (없으면 빈 dict)"""
+        with self._lock:
+            return dict(self._records.get(checkpoint_key(item), {}))
+
+    def update(self, item, **fields):
+        """항목의 필드를 기록하고 바로 파일에 씁니다."""
+        key = checkpoint_key(item)
+        line = json.dumps({"key": key, **fields}, ensure_ascii=False)
+        with self._lock:
+            self._records.setdefault(key, {}).update(fields)
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                torn = self.path.exists() and self.path.stat().st_size and not self.path.read_bytes().endswith(b"\n")
+                self._file = open(self.path, "a", encoding="utf-8")
+                if torn:
+                    self._file.write("\n")  # 잘린 줄 뒤에 이어 쓰지 않도록
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
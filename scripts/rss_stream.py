@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+RSS/Atom 스트리밍 파서
+- 응답 청크를 받는 대로 XMLPullParser로 파싱
+- 최신순 피드에서 cutoff 이전 엔트리가 이어지면 읽기를 중단
+- RFC 822 / ISO 8601 날짜 빠른 파싱 (실패 시 dateutil)
+
+XML이 잘못되었거나 expat이 지원하지 않는 인코딩(EUC-KR 등)이면
+FeedStreamFallback을 발생시키며, 호출 측은 전체 바이트를 feedparser로 파싱합니다.
+"""
+
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from xml.etree.ElementTree import ParseError, XMLPullParser
+
+from dateutil import parser as date_parser
+
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+DC_NS = "{http://purl.org/dc/elements/1.1/}"
+CONTENT_NS = "{http://purl.org/rss/1.0/modules/content/}"
+
+ENTRY_TAGS = {"item", "{http://purl.org/rss/1.0/}item", f"{ATOM_NS}entry"}
+
+# 태그 → (필드명) 매핑. 같은 필드에 여러 태그가 있으면 먼저 나온 값을 사용
+FIELD_TAGS = {
+    "title": "title", f"{ATOM_NS}title": "title", "{http://purl.org/rss/1.0/}title": "title",
+    "link": "link", "{http://purl.org/rss/1.0/}link": "link",
+    "description": "summary", f"{ATOM_NS}summary": "summary",
+    "{http://purl.org/rss/1.0/}description": "summary",
+    "pubDate": "published", f"{ATOM_NS}published": "published",
+    f"{ATOM_NS}updated": "updated", f"{DC_NS}date": "updated",
+    "author": "author", f"{DC_NS}creator": "author",
+}
+DATE_FIELDS = ("published", "updated", "created")
+# 본문 태그: 요약(description/summary)이 없는 엔트리에서만 summary로 사용 (feedparser와 동일)
+CONTENT_TAGS = {f"{ATOM_NS}content", f"{CONTENT_NS}encoded"}
+
+
+class FeedStreamFallback(Exception):
+    """스트리밍 파싱 불가. content에 응답 전체 바이트를 담습니다."""
+
+    def __init__(self, content, reason):
+        super().__init__(reason)
+        self.content = content
+
+
+def parse_feed_date(value):
+    """
+    피드 날짜 문자열을 timezone-naive datetime으로 변환합니다.
+    RFC 822(RSS)와 ISO 8601(Atom)은 표준 라이브러리로 처리하고,
+    그 외 형식만 dateutil을 사용합니다. 실패 시 None.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    dt = None
+    if value[:1].isdigit():
+        try:
+            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            dt = None
+    else:
+        try:
+            dt = parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError):
+            dt = None
+    if dt is None:
+        try:
+            dt = date_parser.parse(value)
+        except (ValueError, TypeError, OverflowError):
+            return None
+    # 기존 동작과 동일하게 시간대 정보만 제거
+    return dt.replace(tzinfo=None) if dt.tzinfo else dt
+
+
+def _entry_from_element(elem):
+    entry = {}
+    content = None
+    for child in elem:
+        tag = child.tag
+        if tag == f"{ATOM_NS}link":
+            if child.get("rel", "alternate") == "alternate" and "link" not in entry:
+                entry["link"] = child.get("href", "")
+            continue
+        if tag in CONTENT_TAGS:
+            if content is None:
+                content = "".join(child.itertext()).strip()
+            continue
+        if tag == f"{ATOM_NS}author":
+            name = child.find(f"{ATOM_NS}name")
+            if name is not None and name.text:
+                entry.setdefault("author", name.text.strip())
+            continue
+        field = FIELD_TAGS.get(tag)
+        if field and field not in entry:
+            entry[field] = (child.text or "").strip()
+    if content is not None:
+        entry.setdefault("summary", content)
+    return entry
+
+
+def stream_feed_entries(chunks, cutoff, stop_after_old=3):
+    """
+    바이트 청크 이터레이터에서 피드 엔트리를 파싱합니다.
+    날짜가 cutoff 이전인 엔트리가 stop_after_old번 연속으로 나오면 중단합니다.
+
+    Returns:
+        list[dict]: 엔트리 목록 (title/link/summary/author/날짜 필드 + pub_date)
+
+    Raises:
+        FeedStreamFallback: XML 파싱이 불가능한 경우
+    """
+    parser = XMLPullParser(events=("end",))
+    consumed = []
+    entries = []
+    old_streak = 0
+
+    chunks = iter(chunks)
+    try:
+        for chunk in chunks:
+            consumed.append(chunk)
+            parser.feed(chunk)
+            for _, elem in parser.read_events():
+                if elem.tag not in ENTRY_TAGS:
+                    continue
+                entry = _entry_from_element(elem)
+                elem.clear()
+
+                pub_date = None
+                for field in DATE_FIELDS:
+                    pub_date = parse_feed_date(entry.get(field))
+                    if pub_date:
+                        break
+                entry["pub_date"] = pub_date
+                entries.append(entry)
+
+                if pub_date and pub_date < cutoff:
+                    old_streak += 1
+                    if old_streak >= stop_after_old:
+                        return entries
+                else:
+                    old_streak = 0
+        parser.close()
+    except (ParseError, ValueError, LookupError) as e:
+        # ValueError: expat 미지원 멀티바이트 인코딩 (EUC-KR 등)
+        consumed.extend(chunks)
+        raise FeedStreamFallback(b"".join(consumed), str(e))
+
+    return entries
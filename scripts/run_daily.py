@@ -5,6 +5,7 @@
   1. 트렌드/논문 수집
   2. 분석 및 보고서 생성
   3. 이메일 발송
+실행마다 구간 시간·카운터를 그날 데이터 디렉토리의 metrics.json에 저장합니다.
 """
 
 import sys
@@ -25,17 +26,19 @@ sys.path.insert(0, str(Path(__file__).resolve().parent))
 from collect_trends import collect_all
 from analyze_and_report import create_report
 from send_email import send_report_email
-from config import get_today_str
+from config import METRICS_FILENAME, get_today_data_dir, get_today_str
+from metrics import METRICS, span
 
 logger = logging.getLogger("ad_research")
 
 
-def run_pipeline(skip_email=False):
+def run_pipeline(skip_email=False, resume=True):
     """
     전체 파이프라인을 실행합니다.
 
     Args:
         skip_email: True이면 이메일 발송을 건너뜁니다.
+        resume: False이면 보고서 체크포인트를 무시하고 처음부터 생성합니다.
     """
     start_time = datetime.now()
     today = get_today_str()
@@ -49,10 +52,12 @@ def run_pipeline(skip_email=False):
     # ── Step 1: 트렌드/논문 수집 ──
     print("📥 [1/3] 트렌드 및 논문 수집 중...")
     try:
-        result = collect_all()
+        with span("step.collect"):
+            result = collect_all()
         n_articles = len(result["articles"])
         n_papers = len(result["papers"])
-        print(f"   ✅ 업계 기사: {n_articles}건, 학술 논문: {n_papers}건 수집 완료")
+        n_new = len(result["new_items"])
+        print(f"   ✅ 업계 기사: {n_articles}건, 학술 논문: {n_papers}건 수집 완료 (신규/변경 {n_new}건)")
     except Exception as e:
         logger.error(f"수집 실패: {e}")
         print(f"   ❌ 수집 실패: {e}")
@@ -63,7 +68,8 @@ def run_pipeline(skip_email=False):
     # ── Step 2: 분석 & 보고서 생성 ──
     print("📊 [2/3] 분석 및 보고서 생성 중...")
     try:
-        report_path = create_report()
+        with span("step.report"):
+            report_path = create_report(resume=resume)
         if report_path:
             print(f"   ✅ 보고서 생성 완료: {report_path}")
         else:
@@ -82,7 +88,8 @@ def run_pipeline(skip_email=False):
     else:
         print("📧 [3/3] 이메일 발송 중...")
         try:
-            success = send_report_email(report_path)
+            with span("step.email"):
+                success = send_report_email(report_path)
             if success:
                 print("   ✅ 이메일 발송 완료!")
             else:
@@ -102,6 +109,18 @@ def run_pipeline(skip_email=False):
     return True
 
 
+def save_metrics(success, profile=False):
+    """이번 실행의 계측 결과를 저장하고, profile이면 요약 표를 출력합니다."""
+    try:
+        path = METRICS.write(get_today_data_dir() / METRICS_FILENAME, success=success)
+        logger.info(f"실행 계측 저장: {path}")
+    except Exception as e:
+        logger.warning(f"실행 계측 저장 실패: {e}")
+    if profile:
+        print()
+        print(METRICS.format_table())
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="광고업계 트렌드 분석 파이프라인",
@@ -111,6 +130,8 @@ def main():
   python run_daily.py              # 전체 실행 (수집 + 보고서 + 이메일)
   python run_daily.py --no-email   # 이메일 없이 실행
   python run_daily.py --debug      # 디버그 모드
+  python run_daily.py --profile    # 단계별 소요 시간/호출 수 표 출력
+  python run_daily.py --no-resume  # 보고서 체크포인트 없이 처음부터 생성
         """,
     )
     parser.add_argument(
@@ -124,6 +145,18 @@ def main():
         help="디버그 로그를 출력합니다",
     )
 
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="실행이 끝난 뒤 구간별 소요 시간과 카운터 표를 출력합니다",
+    )
+
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="보고서 체크포인트를 지우고 모든 항목을 처음부터 다시 처리합니다",
+    )
+
     args = parser.parse_args()
 
     # 로깅 설정
@@ -135,7 +168,8 @@ def main():
     )
 
     # 실행
-    success = run_pipeline(skip_email=args.no_email)
+    success = run_pipeline(skip_email=args.no_email, resume=not args.no_resume)
+    save_metrics(success, profile=args.profile)
     sys.exit(0 if success else 1)
 
 
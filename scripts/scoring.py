@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+키워드 기반 분류 및 관련도 점수
+- 한 단어 키워드는 텍스트를 바이트 치환 + split(C 구현)으로 나눈 단어와 사전 교집합으로 한 번에 매칭
+- 여러 단어·접두어 키워드만 부분 문자열 검사로 거른 뒤 단어 경계를 확인
+- 단어 경계 매칭: "ai"가 "said"에, "app"이 "apple"에 걸리지 않음 (복수형 s/es는 허용)
+- 계산한 분류/점수는 항목에 저장해 재사용 (정렬 키 등에서 반복 계산 없음)
+"""
+
+from config import RELEVANCE_AI_KEYWORDS, RELEVANCE_KEYWORDS, TREND_CATEGORIES
+from semantic import refine_categories
+
+# 카테고리 점수 가중치 (나머지는 1.0)
+CATEGORY_WEIGHTS = {"AI/자동화": 1.5}
+DEFAULT_CATEGORY = "기타"
+
+# 항목에 저장하는 계산 결과 필드
+CATEGORY_FIELD = "category"
+RELEVANCE_FIELD = "relevance"
+
+WORD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
+# UTF-8 바이트에서 영문 소문자/숫자만 남기고 나머지(한글 등 비 ASCII 포함)는 공백으로 바꾸는 표
+_WORD_BYTES = "".join(sorted(WORD_CHARS)).encode("ascii")
+_SPLIT_TABLE = bytes(b if b in _WORD_BYTES else 0x20 for b in range(256))
+
+
+def split_words(text):
+    """소문자 텍스트의 영문/숫자 단어 목록 (bytes). 정규식 findall보다 빠름"""
+    return text.encode("utf-8").translate(_SPLIT_TABLE).split()
+
+
+def _has_word(text, needle, prefix=False):
+    """
+    needle이 단어 시작 위치(앞 글자가 영문/숫자가 아닌 곳)에 등장하는지.
+    prefix가 아니면 뒤쪽도 단어 끝이어야 함 (복수형 s/es 허용)
+    """
+    pos = text.find(needle)
+    while pos != -1:
+        if pos == 0 or text[pos - 1] not in WORD_CHARS:
+            if prefix:
+                return True
+            end = pos + len(needle)
+            if text[end:end + 1] not in WORD_CHARS:
+                return True
+            if text[end:end + 1] == "s" and text[end + 1:end + 2] not in WORD_CHARS:
+                return True
+            if text.startswith("es", end) and text[end + 2:end + 3] not in WORD_CHARS:
+                return True
+        pos = text.find(needle, pos + 1)
+    return False
+
+
+class KeywordMatcher:
+    """
+    여러 그룹의 키워드를 한 번에 매칭합니다.
+    키워드는 단어 단위로 비교하며 (복수형 s/es 허용),
+    끝에 *가 붙은 키워드는 접두어로 매칭합니다 (advertis* → advertising).
+
+    Args:
+        groups: {그룹 이름: [키워드, ...]}. 같은 키워드가 여러 그룹에 있어도 한 번만 검사
+    """
+
+    def __init__(self, groups):
+        self.groups = {name: list(keywords) for name, keywords in groups.items()}
+        self._keyword_groups = {}
+        for name, keywords in self.groups.items():
+            for kw in dict.fromkeys(k.lower() for k in keywords):
+                self._keyword_groups.setdefault(kw, []).append(name)
+        # 한 단어 키워드: 단어(복수형 포함, bytes) → 키워드 사전. 텍스트의 단어 목록과 교집합으로 한 번에 매칭
+        # 여러 단어·접두어 키워드: `needle in text`로 거른 뒤 걸린 것만 단어 경계 확인
+        self._lookup = {}
+        self._needles = []
+        for kw in self._keyword_groups:
+            needle = kw.rstrip("*")
+            if not kw.endswith("*") and needle and set(needle) <= WORD_CHARS:
+                for variant in (needle, needle + "s", needle + "es"):
+                    self._lookup.setdefault(variant.encode("ascii"), kw)
+            else:
+                self._needles.append((needle, kw, kw.endswith("*")))
+        self._lookup_keys = frozenset(self._lookup)
+
+    def matched_keywords(self, text):
+        """텍스트(소문자)에 등장한 키워드 집합"""
+        if not text:
+            return set()
+        # 단어 목록을 집합으로 만들지 않고 키 집합 쪽에서 교집합 (짧은 쪽 기준 조회)
+        matched = {self._lookup[w] for w in self._lookup_keys.intersection(split_words(text))}
+        for needle, kw, prefix in self._needles:
+            if needle in text and _has_word(text, needle, prefix):
+                matched.add(kw)
+        return matched
+
+    def counts(self, text):
+        """그룹별로 등장한 서로 다른 키워드 수 {그룹: 개수}"""
+        counts = dict.fromkeys(self.groups, 0)
+        for kw in self.matched_keywords(text):
+            for name in self._keyword_groups[kw]:
+                counts[name] += 1
+        return counts
+
+
+CATEGORY_GROUPS = {cat: kws for cat, kws in TREND_CATEGORIES.items() if cat != DEFAULT_CATEGORY}
+RELEVANCE_GROUPS = {"core": RELEVANCE_KEYWORDS, "ai": RELEVANCE_AI_KEYWORDS}
+# 분류·관련도 키워드를 한 번에 검사 (겹치는 키워드는 한 번만)
+SCORE_MATCHER = KeywordMatcher({**CATEGORY_GROUPS, **RELEVANCE_GROUPS})
+
+
+def item_text(item):
+    return f"{item.get('title', '')} {item.get('summary', '')}".lower()
+
+
+def _best_category(counts):
+    """그룹별 키워드 수에서 카테고리 선택 (키워드 수 × 가중치가 가장 큰 카테고리, 동점이면 설정 순서)"""
+    best_cat, best_score = DEFAULT_CATEGORY, 0
+    for category in CATEGORY_GROUPS:
+        score = counts[category] * CATEGORY_WEIGHTS.get(category, 1.0)
+        if score > best_score:
+            best_score = score
+            best_cat = category
+    return best_cat
+
+
+def _relevance_score(item, counts):
+    score = counts["core"]
+    if item.get("type") == "academic": score += 3
+    if counts["ai"]: score += 2
+    if item.get("region") == "kr": score += 2  # 국내 기사 가중치
+    return score
+
+
+def score_item(item):
+    """항목의 카테고리와 관련도를 계산해 항목에 저장하고 반환합니다."""
+    counts = SCORE_MATCHER.counts(item_text(item))  # 분류와 관련도 계산이 키워드 검사를 공유
+    item[CATEGORY_FIELD] = _best_category(counts)
+    item[RELEVANCE_FIELD] = _relevance_score(item, counts)
+    return item
+
+
+def score_items(items):
+    """
+    여러 항목을 한꺼번에 점수화합니다 (이미 계산된 항목은 건너뜀).
+    의미 분류가 켜져 있으면 새로 계산한 항목의 카테고리를 임베딩 분류로 보정합니다.
+    """
+    scored = [score_item(item) for item in items
+              if CATEGORY_FIELD not in item or RELEVANCE_FIELD not in item]
+    refine_categories(scored, field=CATEGORY_FIELD)
+    return items
+
+
+def categorize(item):
+    if CATEGORY_FIELD not in item:
+        score_item(item)
+    return item[CATEGORY_FIELD]
+
+
+def relevance(item):
+    if RELEVANCE_FIELD not in item:
+        score_item(item)
+    return item[RELEVANCE_FIELD]
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""
+임베딩 기반 의미 분류 (선택 기능)
+- numpy + sentence-transformers가 설치되어 있고 SEMANTIC_CATEGORIZER가 켜져 있을 때만 동작
+- 항목 임베딩은 텍스트 해시 단위로 SQLite에 저장해 재사용 (한 번 계산한 항목은 모델 호출 없음)
+- 카테고리 중심 벡터(카테고리 이름 + 키워드 임베딩의 평균)와 코사인 유사도로 한 번에 분류
+"""
+
+import hashlib
+import importlib.util
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+
+from config import (
+    EMBEDDING_CACHE_PATH,
+    SEMANTIC_BATCH_SIZE,
+    SEMANTIC_CATEGORIZER,
+    SEMANTIC_MIN_SIMILARITY,
+    SEMANTIC_MODEL,
+    TREND_CATEGORIES,
+)
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# sentence-transformers는 import만으로 torch를 불러오므로 설치 여부만 확인하고 모델 로드 시점에 import
+HAS_SENTENCE_TRANSFORMERS = importlib.util.find_spec("sentence_transformers") is not None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CATEGORY = "기타"
+
+
+def semantic_available():
+    return SEMANTIC_CATEGORIZER and HAS_NUMPY and HAS_SENTENCE_TRANSFORMERS
+
+
+def embedding_text(item):
+    """임베딩에 사용할 텍스트 (제목 + 요약 앞부분)"""
+    return f"{item.get('title', '')}. {(item.get('summary') or '')[:500]}".strip()
+
+
+class EmbeddingCache:
+    """(모델, 텍스트 해시) → float32 벡터를 저장하는 SQLite 캐시"""
+
+    def __init__(self, path=EMBEDDING_CACHE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            " key TEXT PRIMARY KEY,"
+            " dim INTEGER NOT NULL,"
+            " vector BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def key(model, text):
+        return hashlib.sha1(f"{model}\n{text}".encode("utf-8")).hexdigest()
+
+    def get_many(self, keys):
+        """{key: 벡터} (없는 키는 빠짐)"""
+        found = {}
+        keys = list(dict.fromkeys(keys))
+        with self._lock:
+            for start in range(0, len(keys), 500):  # SQLite 변수 개수 제한
+                chunk = keys[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
+    def set_many(self, pairs):
+        """pairs: [(key, 벡터)]"""
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, dim, vector) VALUES (?, ?, ?)",
+                [(key, len(vec), np.asarray(vec, dtype=np.float32).tobytes()) for key, vec in pairs],
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class SemanticCategorizer:
+    """
+    임베딩 유사도로 항목을 TREND_CATEGORIES 중 하나로 분류합니다.
+
+    Args:
+        model_name: sentence-transformers 모델 이름
+        cache: EmbeddingCache (None이면 기본 경로)
+        encoder: texts → 2차원 배열 함수 (지정하지 않으면 model_name 모델을 불러옴)
+    """
+
+    def __init__(self, model_name=SEMANTIC_MODEL, cache=None, encoder=None,
+                 min_similarity=SEMANTIC_MIN_SIMILARITY, categories=TREND_CATEGORIES):
+        self.model_name = model_name
+        self.cache = cache or EmbeddingCache()
+        self.min_similarity = min_similarity
+        self._encoder = encoder
+        self._model = None
+        self.categories = [c for c in categories if c != DEFAULT_CATEGORY]
+        self._centroids = None
+        self._category_terms = {c: [c] + list(categories[c]) for c in self.categories}
+
+    def _encode_raw(self, texts):
+        if self._encoder is not None:
+            return np.asarray(self._encoder(texts), dtype=np.float32)
+        if self._model is None:
+            from sentence_transformers import SentenceTransformer
+            logger.info(f"[의미 분류] 모델 로드: {self.model_name}")
+            self._model = SentenceTransformer(self.model_name, device="cpu")
+        return self._model.encode(
+            texts, batch_size=SEMANTIC_BATCH_SIZE, convert_to_numpy=True, show_progress_bar=False
+        ).astype(np.float32)
+
+    def encode(self, texts):
+        """
+        텍스트 목록의 정규화된 임베딩 행렬 (len(texts) × dim).
+        캐시에 있는 텍스트는 모델을 거치지 않고, 없는 것만 배치로 계산합니다.
+        """
+        keys = [EmbeddingCache.key(self.model_name, t) for t in texts]
+        cached = self.cache.get_many(keys)
+        missing = list(dict.fromkeys(t for t, k in zip(texts, keys) if k not in cached))
+        if missing:
+            vectors = self._encode_raw(missing)
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors = vectors / np.maximum(norms, 1e-12)
+            new = [(EmbeddingCache.key(self.model_name, t), v) for t, v in zip(missing, vectors)]
+            self.cache.set_many(new)
+            cached.update(new)
+            logger.info(f"[의미 분류] 임베딩 계산 {len(missing)}건 (캐시 {len(texts) - len(missing)}건)")
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.vstack([cached[k] for k in keys])
+
+    def centroids(self):
+        """카테고리 중심 벡터 행렬 (카테고리 수 × dim), 카테고리 이름과 키워드 임베딩의 정규화된 평균"""
+        if self._centroids is None:
+            terms = [t for c in self.categories for t in self._category_terms[c]]
+            vectors = self.encode(terms)
+            rows, start = [], 0
+            for c in self.categories:
+                n = len(self._category_terms[c])
+                rows.append(vectors[start:start + n].mean(axis=0))
+                start += n
+            centroids = np.vstack(rows)
+            self._centroids = centroids / np.maximum(np.linalg.norm(centroids, axis=1, keepdims=True), 1e-12)
+        return self._centroids
+
+    def classify(self, items):
+        """
+        항목 목록을 분류합니다.
+
+        Returns:
+            list: (카테고리, 유사도) 목록. 유사도가 기준 미만이면 카테고리는 None
+        """
+        if not items:
+            return []
+        embeddings = self.encode([embedding_text(item) for item in items])
+        similarities = embeddings @ self.centroids().T  # 정규화된 벡터 → 내적 = 코사인 유사도
+        best = similarities.argmax(axis=1)
+        best_sim = similarities[np.arange(len(items)), best]
+        return [
+            (self.categories[idx] if sim >= self.min_similarity else None, float(sim))
+            for idx, sim in zip(best.tolist(), best_sim.tolist())
+        ]
+
+
+_categorizer = None
+_categorizer_lock = threading.Lock()
+_disabled = False
+
+
+def get_categorizer():
+    """설정이 켜져 있고 의존성이 있으면 공유 분류기를, 아니면 None을 반환합니다."""
+    global _categorizer
+    if _disabled or not semantic_available():
+        return None
+    with _categorizer_lock:
+        if _categorizer is None:
+            _categorizer = SemanticCategorizer()
+        return _categorizer
+
+
+def refine_categories(items, field="category"):
+    """
+    의미 분류가 가능하면 각 항목의 field를 의미 분류 결과로 덮어씁니다
+    (유사도가 기준 미만인 항목은 기존 키워드 분류 유지). 분류한 항목 수를 반환합니다.
+    """
+    global _disabled
+    categorizer = get_categorizer()
+    if categorizer is None or not items:
+        return 0
+    try:
+        results = categorizer.classify(items)
+    except Exception as e:
+        # 모델 다운로드/로드 실패 등 → 이번 실행에서는 키워드 분류만 사용
+        logger.warning(f"[의미 분류] 실패, 키워드 분류 사용: {e}")
+        _disabled = True
+        return 0
+    changed = 0
+    for item, (category, _) in zip(items, results):
+        if category is not None:
+            item[field] = category
+            changed += 1
+    return changed
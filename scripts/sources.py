@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+수집 소스 레지스트리
+- @register_source 데코레이터로 수집 함수를 소스로 등록
+- 모든 소스를 공유 스레드 풀에서 동시에 실행 (소스별 제한 시간/재시도)
+- 소스가 끝나는 대로 결과를 콜백으로 전달
+- 공통 항목 스키마로 정규화
+"""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from lang_detect import item_language
+from metrics import incr, span
+
+logger = logging.getLogger(__name__)
+
+# 공통 항목 스키마 (필드 → 기본값)
+ITEM_SCHEMA = {
+    "source": "",
+    "type": "industry",      # industry | academic
+    "region": "global",      # kr | global
+    "title": "",
+    "url": "",
+    "summary": "",
+    "published_date": None,  # ISO 형식 문자열
+    "authors": "",
+    "lang": "",              # ko | en (제목+요약의 한글 비율로 판별)
+}
+
+
+class Source:
+    """등록된 수집 소스"""
+
+    def __init__(self, name, collect, item_type, timeout=120, retries=0, kwargs=None):
+        self.name = name
+        self.collect = collect
+        self.item_type = item_type
+        self.timeout = timeout
+        self.retries = retries
+        self.kwargs = kwargs or {}
+
+    def __repr__(self):
+        return f"Source({self.name!r}, type={self.item_type!r})"
+
+
+SOURCES = []
+
+
+def register_source(name, item_type, timeout=120, retries=0, **kwargs):
+    """
+    수집 함수를 소스로 등록하는 데코레이터.
+    함수는 kwargs를 받아 항목 dict 목록을 반환해야 합니다.
+
+    Args:
+        name: 소스 이름 (로그용)
+        item_type: 항목 기본 유형 (industry | academic)
+        timeout: 소스 전체 제한 시간 (초)
+        retries: 예외 발생 시 재시도 횟수
+        **kwargs: 수집 함수에 전달할 인자
+    """
+    def decorator(func):
+        SOURCES.append(Source(name, func, item_type, timeout, retries, kwargs))
+        return func
+    return decorator
+
+
+def normalize_item(item, source):
+    """항목을 공통 스키마에 맞춥니다 (누락 필드는 기본값, 추가 필드는 유지)."""
+    if not item.get("source"):
+        item["source"] = source.name
+    if not item.get("type"):
+        item["type"] = source.item_type
+    for field, default in ITEM_SCHEMA.items():
+        if item.get(field) is None:
+            item[field] = default
+    if not item["lang"]:
+        item["lang"] = item_language(item)
+    return item
+
+
+def _run_with_retries(source):
+    for attempt in range(source.retries + 1):
+        try:
+            with span(f"source.{source.name}"):
+                return source.collect(**source.kwargs)
+        except Exception as e:
+            if attempt >= source.retries:
+                raise
+            incr("source.retries")
+            delay = 2 ** attempt
+            logger.warning(f"[{source.name}] 수집 실패, {delay}초 후 재시도 ({attempt + 1}/{source.retries}): {e}")
+            time.sleep(delay)
+
+
+def run_sources(sources=None, on_result=None):
+    """
+    소스들을 동시에 실행합니다. 소스가 끝나는 즉시 on_result(source, items)를
+    호출 스레드에서 호출합니다. 제한 시간을 넘기거나 실패한 소스는 빈 결과로 처리합니다.
+
+    Returns:
+        dict: 소스 이름 → 항목 목록
+    """
+    sources = list(SOURCES if sources is None else sources)
+    results = {source.name: [] for source in sources}
+    if not sources:
+        return results
+
+    executor = ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix="source")
+    started = time.monotonic()
+    pending = {executor.submit(_run_with_retries, source): source for source in sources}
+
+    while pending:
+        now = time.monotonic() - started
+        next_deadline = min(source.timeout for source in pending.values()) - now
+        done, _ = wait(pending, timeout=max(0.0, next_deadline), return_when=FIRST_COMPLETED)
+
+        for future in done:
+            source = pending.pop(future)
+            try:
+                items = [normalize_item(item, source) for item in (future.result() or [])]
+            except Exception as e:
+                logger.error(f"[{source.name}] 수집 오류: {e}")
+                continue
+            results[source.name] = items
+            if on_result:
+                on_result(source, items)
+
+        elapsed = time.monotonic() - started
+        for future, source in list(pending.items()):
+            if elapsed >= source.timeout:
+                logger.error(f"[{source.name}] 수집 제한 시간({source.timeout}초) 초과")
+                pending.pop(future)
+
+    # 제한 시간을 넘긴 소스는 기다리지 않음
+    executor.shutdown(wait=False, cancel_futures=True)
+    return results
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""
+누적 트렌드 인덱스 (SQLite + FTS5)
+- data/YYYY-MM-DD/ 디렉토리의 수집 항목을 하나의 인덱스로 통합
+- 새로 생기거나 바뀐 날짜 디렉토리만 증분 반영
+- 카테고리/소스/지역/날짜별 시계열 집계 및 전문 검색
+
+사용 예시:
+  python trend_index.py update
+  python trend_index.py counts --weeks 12
+  python trend_index.py counts --weeks 12 --category "동영상/CTV" --region kr
+  python trend_index.py search "connected tv" --limit 20
+  python trend_index.py rebuild
+"""
+
+import argparse
+import logging
+import re
+import sqlite3
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from config import DATA_DIR, TREND_CATEGORIES, TREND_INDEX_PATH
+from item_io import LEGACY_FILES, has_items, items_path, iter_items
+from item_store import item_key
+from scoring import CATEGORY_FIELD, score_items
+
+logger = logging.getLogger(__name__)
+
+DAY_DIR_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+INDEX_COLUMNS = ["title", "summary", "url", "source", "type", "region",
+                 "published_date", "doi", "arxiv_id", "item_id"]
+
+# 집계 단위 → SQLite strftime 형식
+PERIOD_FORMATS = {
+    "day": "%Y-%m-%d",
+    "week": "%Y-W%W",
+    "month": "%Y-%m",
+}
+
+
+class TrendIndex:
+    """날짜 디렉토리 전체를 대상으로 한 항목 인덱스"""
+
+    def __init__(self, path=TREND_INDEX_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS items (
+                item_key TEXT PRIMARY KEY,
+                date TEXT NOT NULL,
+                collected_day TEXT NOT NULL,
+                category TEXT NOT NULL,
+                source TEXT,
+                region TEXT,
+                type TEXT,
+                title TEXT,
+                url TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_items_cat_date ON items (category, date);
+            CREATE INDEX IF NOT EXISTS idx_items_date ON items (date);
+            CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5 (title, summary);
+            CREATE TABLE IF NOT EXISTS indexed_days (
+                day TEXT PRIMARY KEY,
+                mtime REAL NOT NULL
+            );
+            """
+        )
+        self._conn.commit()
+
+    # ── 인덱싱 ──
+    def index_day(self, day_dir):
+        """날짜 디렉토리 하나를 인덱스에 반영하고 새로 추가된 항목 수를 반환합니다."""
+        day_dir = Path(day_dir)
+        day = day_dir.name
+        added = 0
+        # 보고서와 같은 분류 규칙 (하루치를 한 번에 분류 → 의미 분류 사용 시 배치 임베딩)
+        items = score_items(list(iter_items(day_dir, columns=INDEX_COLUMNS)))
+        for item in items:
+            key = item.get("item_id") or item_key(item)
+            date = (item.get("published_date") or day)[:10]
+            cur = self._conn.execute(
+                "INSERT OR IGNORE INTO items"
+                " (item_key, date, collected_day, category, source, region, type, title, url)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, date, day, item[CATEGORY_FIELD], item.get("source"), item.get("region"),
+                 item.get("type"), item.get("title"), item.get("url")),
+            )
+            if cur.rowcount:
+                self._conn.execute(
+                    "INSERT INTO items_fts (rowid, title, summary) VALUES (?, ?, ?)",
+                    (cur.lastrowid, item.get("title") or "", item.get("summary") or ""),
+                )
+                added += 1
+        self._conn.execute(
+            "INSERT OR REPLACE INTO indexed_days (day, mtime) VALUES (?, ?)",
+            (day, _dir_mtime(day_dir)),
+        )
+        self._conn.commit()
+        return added
+
+    def update(self, data_dir=DATA_DIR):
+        """새로 생기거나 변경된 날짜 디렉토리만 인덱싱합니다."""
+        known = dict(self._conn.execute("SELECT day, mtime FROM indexed_days"))
+        total = 0
+        for day_dir in sorted(Path(data_dir).iterdir()):
+            if not day_dir.is_dir() or not DAY_DIR_RE.match(day_dir.name) or not has_items(day_dir):
+                continue
+            if known.get(day_dir.name) == _dir_mtime(day_dir):
+                continue
+            added = self.index_day(day_dir)
+            logger.info(f"[인덱스] {day_dir.name}: {added}건 추가")
+            total += added
+        return total
+
+    def rebuild(self, data_dir=DATA_DIR):
+        """인덱스를 비우고 전체 날짜 디렉토리를 다시 인덱싱합니다 (분류 규칙 변경 시)."""
+        self._conn.executescript(
+            "DELETE FROM items; DELETE FROM items_fts; DELETE FROM indexed_days;"
+        )
+        self._conn.commit()
+        return self.update(data_dir)
+
+    # ── 조회 ──
+    def counts(self, period="week", weeks=12, category=None, source=None, region=None, query=None):
+        """
+        기간 단위별 카테고리 항목 수를 집계합니다.
+
+        Args:
+            period: day | week | month
+            weeks: 최근 몇 주를 볼지
+            category/source/region: 필터 (선택)
+            query: FTS5 검색어 필터 (선택)
+
+        Returns:
+            list[tuple]: (기간, 카테고리, 건수) 목록
+        """
+        since = (datetime.now() - timedelta(weeks=weeks)).strftime("%Y-%m-%d")
+        sql = [f"SELECT strftime('{PERIOD_FORMATS[period]}', i.date) AS bucket, i.category, COUNT(*)"
+               " FROM items i"]
+        params = []
+        if query:
+            sql.append("JOIN items_fts f ON f.rowid = i.rowid AND items_fts MATCH ?")
+            params.append(query)
+        sql.append("WHERE i.date >= ?")
+        params.append(since)
+        for column, value in (("category", category), ("source", source), ("region", region)):
+            if value:
+                sql.append(f"AND i.{column} = ?")
+                params.append(value)
+        sql.append("GROUP BY bucket, i.category ORDER BY bucket, i.category")
+        return self._conn.execute(" ".join(sql), params).fetchall()
+
+    def search(self, query, limit=20):
+        """전문 검색: (날짜, 카테고리, 소스, 제목, URL) 목록을 관련도 순으로 반환"""
+        return self._conn.execute(
+            "SELECT i.date, i.category, i.source, i.title, i.url"
+            " FROM items_fts f JOIN items i ON i.rowid = f.rowid"
+            " WHERE items_fts MATCH ? ORDER BY rank LIMIT ?",
+            (query, limit),
+        ).fetchall()
+
+    def close(self):
+        self._conn.close()
+
+
+def _dir_mtime(day_dir):
+    """항목 파일의 수정 시각 (metrics.json·체크포인트 등 다른 파일의 변경은 무시)"""
+    paths = [items_path(day_dir)] + [Path(day_dir) / name for name in LEGACY_FILES]
+    return max((p.stat().st_mtime for p in paths if p.exists()), default=0.0)
+
+
+def format_counts_table(rows):
+    """counts() 결과를 기간 × 카테고리 표 문자열로 변환합니다."""
+    categories = [c for c in TREND_CATEGORIES if any(r[1] == c for r in rows)]
+    buckets = sorted({r[0] for r in rows})
+    table = {(b, c): n for b, c, n in rows}
+    width = max([len(b) for b in buckets] + [8])
+    lines = ["기간".ljust(width) + " | " + " | ".join(categories)]
+    for bucket in buckets:
+        cells = [str(table.get((bucket, c), 0)).rjust(len(c)) for c in categories]
+        lines.append(bucket.ljust(width) + " | " + " | ".join(cells))
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="누적 트렌드 인덱스 관리 및 조회")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("update", help="새 날짜 디렉토리를 인덱스에 반영")
+    sub.add_parser("rebuild", help="인덱스를 처음부터 다시 생성")
+
+    p_counts = sub.add_parser("counts", help="카테고리별 시계열 건수")
+    p_counts.add_argument("--period", choices=list(PERIOD_FORMATS), default="week")
+    p_counts.add_argument("--weeks", type=int, default=12)
+    p_counts.add_argument("--category")
+    p_counts.add_argument("--source")
+    p_counts.add_argument("--region", choices=["kr", "global"])
+    p_counts.add_argument("--query", help="FTS5 검색어로 대상 제한")
+
+    p_search = sub.add_parser("search", help="제목/요약 전문 검색")
+    p_search.add_argument("query")
+    p_search.add_argument("--limit", type=int, default=20)
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s", datefmt="%H:%M:%S")
+
+    index = TrendIndex()
+    try:
+        if args.command == "update":
+            print(f"✅ {index.update()}건 추가")
+        elif args.command == "rebuild":
+            print(f"✅ {index.rebuild()}건 인덱싱")
+        elif args.command == "counts":
+            index.update()
+            rows = index.counts(args.period, args.weeks, args.category, args.source, args.region, args.query)
+            print(format_counts_table(rows) if rows else "결과가 없습니다.")
+        elif args.command == "search":
+            index.update()
+            for date, category, source, title, url in index.search(args.query, args.limit):
+                print(f"{date}  [{category}] ({source}) {title}\n    {url}")
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    main()